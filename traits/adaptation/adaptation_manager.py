@@ -13,15 +13,89 @@
 """ Manages all registered adaptations. """
 
 
+from abc import ABCMeta
 from heapq import heappop, heappush
 import inspect
 import itertools
 import sys
 import functools
+import weakref
 
 from traits.adaptation.adaptation_error import AdaptationError
 from traits.has_traits import HasTraits
-from traits.trait_types import Dict, List, Str
+from traits.trait_types import Any, Dict, Instance, List, Str
+
+try:
+    from abc import get_cache_token
+except ImportError:
+    # Python 2 has no public accessor for the counter of ABC registrations.
+    def get_cache_token():
+        return ABCMeta._abc_invalidation_counter
+
+
+#: The maximum number of answers kept in the 'provides_protocol' cache.
+PROVIDES_CACHE_SIZE = 10000
+
+
+class _TypeCache(object):
+    """ A bounded cache of answers keyed by (type, protocol) pairs.
+
+    The types and protocols are only weakly referenced, so that the cache
+    does not keep classes alive, and the answers about a class which has been
+    garbage collected can never be returned for a new class allocated at the
+    same address. Once 'max_size' answers are cached, the least recently
+    used half of them (including those about collected classes) is evicted.
+
+    """
+
+    def __init__(self, max_size=PROVIDES_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = {}
+        self._clock = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, type_, protocol, default=None):
+        """ Returns the answer cached for a type and a protocol. """
+
+        try:
+            entry = self._entries[(weakref.ref(type_), weakref.ref(protocol))]
+        except (KeyError, TypeError):
+            return default
+
+        entry[1] = next(self._clock)
+        return entry[0]
+
+    def set(self, type_, protocol, value):
+        """ Caches the answer for a type and a protocol. """
+
+        try:
+            key = (weakref.ref(type_), weakref.ref(protocol))
+        except TypeError:
+            # The type or the protocol cannot be weakly referenced.
+            return
+
+        entries = self._entries
+        if len(entries) >= self.max_size:
+            by_use = sorted(entries.items(), key=lambda item: item[1][1])
+            for old_key, _ in by_use[:len(by_use) // 2 + 1]:
+                del entries[old_key]
+
+        entries[key] = [value, next(self._clock)]
+
+    def clear(self):
+        """ Discards all the cached answers. """
+
+        self._entries.clear()
+
+
+#: The cached answers of 'provides_protocol'. They are discarded whenever an
+#: ABC registration may have changed them.
+_provides_cache = _TypeCache()
+
+#: The ABC cache token the answers in '_provides_cache' were computed with.
+_provides_cache_token = get_cache_token()
 
 
 def no_adapter_necessary(adaptee):
@@ -92,7 +166,24 @@ class AdaptationManager(HasTraits):
           True if the object provides the protocol, otherwise False.
 
         """
-        return issubclass(type_, protocol)
+        global _provides_cache_token
+
+        token = get_cache_token()
+        if token != _provides_cache_token:
+            _provides_cache.clear()
+            _provides_cache_token = token
+
+        result = _provides_cache.get(type_, protocol)
+        if result is not None:
+            return result
+
+        result = issubclass(type_, protocol)
+
+        # Don't keep an answer computed while an ABC registration was made.
+        if get_cache_token() == token:
+            _provides_cache.set(type_, protocol, result)
+
+        return result
 
     #### 'AdaptationManager' protocol ##########################################
 
@@ -126,7 +217,11 @@ class AdaptationManager(HasTraits):
         if self.provides_protocol(adaptee.__class__, to_protocol):
             result = adaptee
 
-        # Otherwise, try adapting the object.
+        # Otherwise, try adapting the object, unless we already know that no
+        # adapters exist for its type.
+        elif self._has_no_adapters(type(adaptee), to_protocol):
+            result = None
+
         else:
             result = self._adapt(adaptee, to_protocol)
 
@@ -146,6 +241,7 @@ class AdaptationManager(HasTraits):
             offer.from_protocol_name, []
         )
         offers.append(offer)
+        self._no_adapters = _TypeCache()
 
         return
 
@@ -193,6 +289,26 @@ class AdaptationManager(HasTraits):
     #: list of adaptation offers.
     _adaptation_offers = Dict(Str, List)
 
+    #: The (type, protocol) pairs for which no chain of adaptation offers
+    #: exists. Replaced when an offer is registered, or when an ABC
+    #: registration may have changed which offers apply.
+    _no_adapters = Instance(_TypeCache, ())
+
+    #: The ABC cache token '_no_adapters' was computed with.
+    _no_adapters_token = Any
+
+    def _has_no_adapters(self, type_, to_protocol):
+        """ Is it known that no adaptation offers lead from the type to the
+        protocol?
+        """
+
+        token = get_cache_token()
+        if token != self._no_adapters_token:
+            self._no_adapters = _TypeCache()
+            self._no_adapters_token = token
+
+        return self._no_adapters.get(type_, to_protocol, False)
+
     def _adapt(self, adaptee, to_protocol):
         """ Returns an adapter that adapts an object to the target class.
 
@@ -254,6 +370,14 @@ class AdaptationManager(HasTraits):
         # (see http://bit.ly/13VxILn).
         offer_queue = [((0, 0, next(counter)), [], type(adaptee))]
 
+        # Did an adapter factory refuse to adapt 'adaptee'? If not, no
+        # adapters exist for any object of the same type.
+        # (The answer is recorded in the current '_no_adapters', so that it
+        # is discarded along with it if an offer is registered meanwhile.)
+        refused = False
+        no_adapters = self._no_adapters
+        token = get_cache_token()
+
         while len(offer_queue) > 0:
             # Get the most specific candidate path for adaptation.
             weight, path, current_protocol = heappop(offer_queue)
@@ -286,6 +410,7 @@ class AdaptationManager(HasTraits):
                             # This adaptation attempt failed (e.g. because of
                             # conditional adaptation).
                             # Discard this path and continue.
+                            refused = True
                             break
 
                     else:
@@ -303,6 +428,9 @@ class AdaptationManager(HasTraits):
                         (new_weight, new_path, offer.to_protocol)
                     )
 
+        if not refused and token == self._no_adapters_token:
+            no_adapters.set(type(adaptee), to_protocol, True)
+
         return None
 
     def _get_applicable_offers(self, current_protocol, path):
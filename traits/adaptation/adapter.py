@@ -64,9 +64,11 @@ def adapts(from_, to, extra=None, factory=None, cached=False, when=''):
         any callable that takes a single argument which is the object to
         be adapted. The factory should return an adapter if it can
         perform the adaptation and **None** if it cannot.
-    cached : bool
+    cached : bool or dict
         Should the adapters be cached? If an adapter is cached, then the
-        factory will produce at most one adapter per instance.
+        factory will produce at most one adapter per instance. A dictionary
+        specifies the cache policy, as the traits of the
+        CachedAdapterFactory (e.g. ``{'policy': 'lru', 'max_size': 100}``).
     when : str
         A Python expression that selects which instances of a particular type
         can be adapted by this factory. The expression is evaluated in a
@@ -130,7 +132,12 @@ def adapts(from_, to, extra=None, factory=None, cached=False, when=''):
 
                 adapter_factory = _conditional_factory
 
-            if cached:
+            if isinstance(cached, dict):
+                adapter_factory = CachedAdapterFactory(
+                    factory=adapter_factory, **cached
+                )
+
+            elif cached:
                 adapter_factory = CachedAdapterFactory(factory=adapter_factory)
 
         else:
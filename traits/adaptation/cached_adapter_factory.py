@@ -13,19 +13,31 @@
 """ An adapter factory that caches adapters per instance. """
 
 
+from collections import OrderedDict
+import sys
+import threading
+import time
 import weakref
 
-from traits.api import Any, Bool, HasTraits, Property
+from traits.api import Any, Bool, Enum, Float, HasTraits, Int, Property
 from traits.util.api import import_symbol
 
 
+#: All the live cached adapter factories.
+_cached_adapter_factories = weakref.WeakSet()
+
+
 class CachedAdapterFactory(HasTraits):
     """ An adapter factory that caches adapters per instance.
 
     We provide this class to provide the caching functionality of the
-    old traits 'adapts' implementation. However, note that the cache will
-    not be cleared unless you take care of cleaning the 'adaptee' trait once
-    your adapter are deleted.
+    old traits 'adapts' implementation. However, note that with the default
+    'weak' policy the cache will not be cleared unless you take care of
+    cleaning the 'adaptee' trait once your adapter are deleted.
+
+    The 'lru' and 'ttl' policies keep (strong references to) at most
+    'max_size' adaptees, and can be used for adaptees which cannot be
+    weakly referenced, or which are hashed by value.
 
     This class will be removed when the 'adapts' function is removed.
 
@@ -36,10 +48,25 @@ class CachedAdapterFactory(HasTraits):
     def __call__(self, adaptee):
         """ The adapter manager uses callables for adapter factories. """
 
-        adapter = self._adapter_cache.get(adaptee, None)
+        try:
+            adapter = self._get_adapter(adaptee)
+        except TypeError:
+            # The adaptee cannot be a key of the cache.
+            adapter = None
+
         if adapter is None:
+            with self._lock:
+                self._misses += 1
+
             adapter = self.factory(adaptee)
-            self._adapter_cache[adaptee] = adapter
+            try:
+                self._set_adapter(adaptee, adapter)
+            except TypeError:
+                pass
+
+        else:
+            with self._lock:
+                self._hits += 1
 
         return adapter
 
@@ -56,6 +83,42 @@ class CachedAdapterFactory(HasTraits):
     #: 'from foo.bar import baz' and imported when the trait is first accessed.
     factory = Property(Any)
 
+    #: How adapters are evicted from the cache:
+    #:
+    #: - 'weak': an adapter is kept as long as its adaptee is alive.
+    #: - 'lru': the least recently used adapter is evicted once 'max_size'
+    #:   adapters are cached.
+    #: - 'ttl': an adapter is evicted 'ttl' seconds after it was created, or
+    #:   earlier if 'max_size' adapters are cached.
+    policy = Enum('weak', 'lru', 'ttl')
+
+    #: The maximum number of adapters cached by the 'lru' and 'ttl' policies.
+    max_size = Int(1000)
+
+    #: The number of seconds an adapter is cached by the 'ttl' policy.
+    ttl = Float(60.0)
+
+    #: The number of calls which returned a cached adapter.
+    hits = Property(Int)
+    def _get_hits(self):
+        return self._hits
+
+    #: The number of calls which created a new adapter.
+    misses = Property(Int)
+    def _get_misses(self):
+        return self._misses
+
+    #: The number of adapters evicted from the cache by the 'lru' and 'ttl'
+    #: policies.
+    evictions = Property(Int)
+    def _get_evictions(self):
+        return self._evictions
+
+    #: The number of adapters currently cached.
+    size = Property(Int)
+    def _get_size(self):
+        return len(self._adapter_cache)
+
     #: True if the cache is empty, otherwise False.
     #:
     #: This method is mostly here to help testing - the framework does not
@@ -64,11 +127,151 @@ class CachedAdapterFactory(HasTraits):
     def _get_is_empty(self):
         return len(self._adapter_cache) == 0
 
+    def clear(self):
+        """ Discards all the cached adapters. """
+
+        with self._lock:
+            self._adapter_cache.clear()
+
+        return
+
+    def memory_usage(self):
+        """ Returns the approximate number of bytes used by the cache.
+
+        This counts the cache itself and the adapters, but not the adaptees.
+
+        """
+
+        with self._lock:
+            cache = self._adapter_cache
+            if self.policy == 'weak':
+                # Each entry holds a weak reference to its adaptee:
+                adapters = list(cache.values())
+                size = (sys.getsizeof(cache) +
+                        len(adapters) * sys.getsizeof(weakref.ref(cache)))
+
+            else:
+                size = sys.getsizeof(cache)
+                adapters = cache.values()
+                if self.policy == 'ttl':
+                    size += sum(sys.getsizeof(entry) for entry in adapters)
+                    adapters = [adapter for expires, adapter in adapters]
+
+        return size + sum(sys.getsizeof(adapter) for adapter in adapters)
+
+    def statistics(self):
+        """ Returns a dictionary describing the use of the cache. """
+
+        with self._lock:
+            hits, misses, evictions = self._hits, self._misses, self._evictions
+
+        return dict(
+            factory   = self._factory,
+            policy    = self.policy,
+            size      = self.size,
+            hits      = hits,
+            misses    = misses,
+            evictions = evictions,
+            memory    = self.memory_usage(),
+        )
+
+    #### 'HasTraits' protocol ##################################################
+
+    def traits_init(self):
+        """ Registers the factory for 'cached_adapter_statistics'. """
+
+        _cached_adapter_factories.add(self)
+
+        return
+
     #### Private protocol ######################################################
 
     _adapter_cache = Any
     def __adapter_cache_default(self):
-        return weakref.WeakKeyDictionary()
+        if self.policy == 'weak':
+            return weakref.WeakKeyDictionary()
+
+        return OrderedDict()
+
+    def _policy_changed(self):
+        """ Trait change handler. """
+
+        self._adapter_cache = self.__adapter_cache_default()
+
+        return
+
+    #: The lock protecting the order of the entries of the cache and the
+    #: counters.
+    _lock = Any
+    def __lock_default(self):
+        return threading.Lock()
+
+    #: The counters behind the 'hits', 'misses' and 'evictions' properties.
+    #: They are plain attributes, so that updating them (while holding the
+    #: lock) does not validate or notify anything.
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+
+    def _get_adapter(self, adaptee):
+        """ Returns the cached adapter for an adaptee, or None. """
+
+        policy = self.policy
+        if policy == 'weak':
+            return self._adapter_cache.get(adaptee, None)
+
+        with self._lock:
+            cache = self._adapter_cache
+            if policy == 'ttl':
+                entry = cache.get(adaptee)
+                if entry is None:
+                    return None
+
+                if entry[0] <= time.time():
+                    del cache[adaptee]
+                    self._evictions += 1
+                    return None
+
+                return entry[1]
+
+            adapter = cache.pop(adaptee, None)
+            if adapter is not None:
+                # Make it the most recently used entry:
+                cache[adaptee] = adapter
+
+        return adapter
+
+    def _set_adapter(self, adaptee, adapter):
+        """ Caches the adapter created for an adaptee. """
+
+        policy = self.policy
+        if policy == 'weak':
+            self._adapter_cache[adaptee] = adapter
+            return
+
+        with self._lock:
+            cache = self._adapter_cache
+            cache.pop(adaptee, None)
+            if policy == 'ttl':
+                now = time.time()
+                cache[adaptee] = (now + self.ttl, adapter)
+
+                # Entries expire in the order they were created:
+                while len(cache) > 0:
+                    expires, oldest = cache[next(iter(cache))]
+                    if expires > now:
+                        break
+                    cache.popitem(last=False)
+                    self._evictions += 1
+
+            else:
+                cache[adaptee] = adapter
+
+            while len(cache) > self.max_size:
+                cache.popitem(last=False)
+                self._evictions += 1
+
+        return
 
     #: Shadow trait for the corresponding property.
     _factory = Any
@@ -92,4 +295,23 @@ class CachedAdapterFactory(HasTraits):
 
         return
 
+
+def cached_adapter_statistics():
+    """ Returns the statistics of all the live cached adapter factories.
+
+    The result is a dictionary with the totals of the 'size', 'hits',
+    'misses', 'evictions' and 'memory' (in bytes) statistics, and the
+    list of the statistics of each factory as 'factories'.
+
+    """
+
+    factories = [factory.statistics()
+                 for factory in list(_cached_adapter_factories)]
+
+    totals = dict(factories=factories)
+    for name in ('size', 'hits', 'misses', 'evictions', 'memory'):
+        totals[name] = sum(statistics[name] for statistics in factories)
+
+    return totals
+
 #### EOF #######################################################################
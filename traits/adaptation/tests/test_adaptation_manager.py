@@ -1,7 +1,10 @@
 """ Test the adaptation manager. """
 
+import gc
 import sys
+import weakref
 
+from traits.adaptation.adaptation_manager import _TypeCache
 from traits.adaptation.api import AdaptationManager, adapt
 import traits.adaptation.tests.abc_examples
 import traits.adaptation.tests.interface_examples
@@ -539,6 +542,99 @@ class TestAdaptationManagerWithABC(unittest.TestCase):
 
         return
 
+    def test_abc_register_after_query(self):
+
+        from traits.api import Interface
+
+        class IFoo(Interface):
+            pass
+
+        class IBar(Interface):
+            pass
+
+        class Foo(object):
+            pass
+
+        self.adaptation_manager.register_provides(IBar, IFoo)
+
+        foo = Foo()
+        self.assertFalse(self.adaptation_manager.provides_protocol(Foo, IFoo))
+        self.assertFalse(self.adaptation_manager.supports_protocol(foo, IFoo))
+
+        # Registering the class changes the cached answers:
+        IBar.register(Foo)
+        self.assertFalse(self.adaptation_manager.provides_protocol(Foo, IFoo))
+        self.assertTrue(self.adaptation_manager.supports_protocol(foo, IFoo))
+
+        IFoo.register(Foo)
+        self.assertTrue(self.adaptation_manager.provides_protocol(Foo, IFoo))
+
+        return
+
+    def test_cached_types_not_kept_alive(self):
+
+        ex = self.examples
+
+        class Plug(ex.UKPlug):
+            pass
+
+        self.assertFalse(
+            self.adaptation_manager.provides_protocol(Plug, ex.EUStandard)
+        )
+        self.assertIsNone(
+            self.adaptation_manager.adapt(Plug(), ex.EUStandard, None)
+        )
+
+        plug_ref = weakref.ref(Plug)
+        del Plug
+        gc.collect()
+        self.assertIsNone(plug_ref())
+
+        return
+
+    def test_type_cache_evicts_least_recently_used(self):
+
+        cache = _TypeCache(max_size=4)
+        classes = [type('C%d' % i, (object,), {}) for i in range(5)]
+        for klass in classes[:4]:
+            cache.set(klass, object, True)
+
+        # Use the first answer, so that the second is the oldest one:
+        self.assertTrue(cache.get(classes[0], object))
+        cache.set(classes[4], object, True)
+
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(cache.get(classes[0], object))
+        self.assertTrue(cache.get(classes[4], object))
+        self.assertIsNone(cache.get(classes[1], object))
+
+        return
+
+    def test_conditional_adaptation_is_not_cached(self):
+
+        ex = self.examples
+
+        self.adaptation_manager.register_factory(
+            factory       = lambda adaptee: (
+                ex.UKStandardToEUStandard(adaptee)
+                if getattr(adaptee, 'ok', False) else None
+            ),
+            from_protocol = ex.UKStandard,
+            to_protocol   = ex.EUStandard
+        )
+
+        plug = ex.UKPlug()
+        self.assertIsNone(
+            self.adaptation_manager.adapt(plug, ex.EUStandard, None)
+        )
+
+        plug.ok = True
+        self.assertIsNotNone(
+            self.adaptation_manager.adapt(plug, ex.EUStandard, None)
+        )
+
+        return
+
 
 class TestAdaptationManagerWithInterfaces(TestAdaptationManagerWithABC):
     """ Test the adaptation manager with Interfaces. """
@@ -2,10 +2,13 @@
 
 
 import sys
+import threading
 
 import traits.adaptation.tests.interface_examples
 from traits.adaptation.api import AdaptationManager
-from traits.adaptation.cached_adapter_factory import CachedAdapterFactory
+from traits.api import TraitError
+from traits.adaptation.cached_adapter_factory import CachedAdapterFactory, \
+    cached_adapter_statistics
 from traits.testing.unittest_tools import unittest
 
 
@@ -136,6 +139,102 @@ class TestCachedAdapterFactory(unittest.TestCase):
 
         self.assertTrue(factory.is_empty)
 
+    def test_statistics(self):
+
+        factory = CachedAdapterFactory(factory=lambda adaptee: [adaptee])
+        editor = self.examples.Editor()
+
+        adapter = factory(editor)
+        self.assertIs(factory(editor), adapter)
+
+        self.assertEqual(factory.hits, 1)
+        self.assertEqual(factory.misses, 1)
+        self.assertEqual(factory.size, 1)
+        self.assertGreater(factory.memory_usage(), 0)
+
+        statistics = cached_adapter_statistics()
+        self.assertIn(factory.statistics(), statistics['factories'])
+        self.assertGreaterEqual(statistics['hits'], 1)
+
+        return
+
+    def test_statistics_threads(self):
+
+        factory = CachedAdapterFactory(factory=lambda adaptee: [adaptee])
+        editor = self.examples.Editor()
+        factory(editor)
+
+        def adapt():
+            for i in range(1000):
+                factory(editor)
+
+        threads = [threading.Thread(target=adapt) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # No update of the counters is lost:
+        self.assertEqual(factory.hits, 4000)
+        self.assertEqual(factory.misses, 1)
+
+        with self.assertRaises(TraitError):
+            factory.hits = 0
+
+        return
+
+    def test_lru_policy(self):
+
+        factory = CachedAdapterFactory(
+            factory=lambda adaptee: [adaptee], policy='lru', max_size=2
+        )
+
+        # Adaptees which cannot be weakly referenced can be cached:
+        adapter = factory(1)
+        factory(2)
+        self.assertIs(factory(1), adapter)
+        factory(3)
+
+        self.assertEqual(factory.size, 2)
+        self.assertEqual(factory.evictions, 1)
+        self.assertIs(factory(1), adapter)
+        self.assertEqual(factory.misses, 3)
+
+        factory(2)
+        self.assertEqual(factory.misses, 4)
+
+        return
+
+    def test_ttl_policy(self):
+
+        factory = CachedAdapterFactory(
+            factory=lambda adaptee: [adaptee], policy='ttl', ttl=3600.0
+        )
+
+        adapter = factory('a')
+        self.assertIs(factory('a'), adapter)
+
+        # Adapters expire immediately:
+        factory = CachedAdapterFactory(
+            factory=lambda adaptee: [adaptee], policy='ttl', ttl=0.0
+        )
+
+        adapter = factory('a')
+        self.assertIsNot(factory('a'), adapter)
+        self.assertEqual(factory.evictions, 2)
+        self.assertTrue(factory.is_empty)
+
+        return
+
+    def test_weak_policy_with_unhashable_adaptee(self):
+
+        factory = CachedAdapterFactory(factory=lambda adaptee: [adaptee])
+
+        self.assertEqual(factory([1]), [[1]])
+        self.assertTrue(factory.is_empty)
+
+        return
+
 if __name__ == '__main__':
     unittest.main()
 
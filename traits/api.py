@@ -28,7 +28,8 @@ from .trait_base import Uninitialized, Undefined, Missing, Self, python_version
 from .trait_errors import TraitError, TraitNotificationError, DelegationError
 
 from .trait_notifiers import (push_exception_handler, pop_exception_handler,
-        TraitChangeNotifyWrapper)
+        TraitChangeNotifyWrapper, dataflow_transaction, deferred_batch,
+        flush_deferred, ExceptionBuffer, RateLimitedExceptionLogger)
 
 from .category import Category
 
@@ -68,7 +69,7 @@ from .has_traits import (HasTraits, HasStrictTraits, HasPrivateTraits,
         Interface, SingletonHasTraits, SingletonHasStrictTraits,
         SingletonHasPrivateTraits, MetaHasTraits, Vetoable, VetoableEvent,
         implements, traits_super, on_trait_change, cached_property,
-        property_depends_on, provides, isinterface)
+        property_depends_on, provides, isinterface, trait_monitor_batch)
 
 try:
     from .has_traits import ABCHasTraits, ABCHasStrictTraits, ABCMetaHasTraits
@@ -86,6 +87,16 @@ from .trait_handlers import (BaseTraitHandler, TraitType, TraitHandler,
 from .trait_value import (BaseTraitValue, TraitValue, SyncValue,
         TypeValue, DefaultValue)
 
+from .trait_snapshot import TraitSnapshot
+
+from .dirty_traits import collect_dirty_traits
+
+from .trait_expression import ExpressionEvaluator
+
+from .path_validation import PathValidationError, set_path_traits
+
+from .trait_memory import trait_memory_report
+
 from .adaptation.adapter import Adapter, adapts
 from .adaptation.adaptation_error import AdaptationError
 from .adaptation.adaptation_manager import adapt, register_factory, \
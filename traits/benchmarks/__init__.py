@@ -0,0 +1,26 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Benchmarks measuring the overhead of the basic traits operations.
+
+    Run them, save their results and compare them with a previous run with::
+
+        python -m traits.benchmarks run -o new.json
+        python -m traits.benchmarks compare old.json new.json
+
+    'run' can also compare the results directly with a previous run, using
+    the '--compare' option. Both commands exit with status 1 when some
+    benchmarks are slower than in the previous run by more than the
+    '--threshold' ratio (10% by default).
+"""
@@ -0,0 +1,82 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Runs the benchmarks, or compares the results of two runs.
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import sys
+
+from .runner import (DEFAULT_MIN_TIME, DEFAULT_REPEAT, DEFAULT_THRESHOLD,
+    compare_results, format_comparison, load_results, run_benchmarks,
+    save_results)
+
+def main ( argv = None ):
+    parser = argparse.ArgumentParser( prog = 'python -m traits.benchmarks',
+                                      description = __doc__ )
+    commands = parser.add_subparsers( dest = 'command' )
+
+    run = commands.add_parser( 'run', help = 'run the benchmarks' )
+    run.add_argument( '-k', dest = 'patterns', action = 'append',
+        help = 'only run the benchmarks whose name contains this string' )
+    run.add_argument( '-o', '--output',
+        help = 'save the results to this JSON file' )
+    run.add_argument( '--compare', metavar = 'RESULTS',
+        help = 'compare the results with those saved in this JSON file' )
+    run.add_argument( '--min-time', type = float, default = DEFAULT_MIN_TIME,
+        help = 'minimum number of seconds of each timing' )
+    run.add_argument( '--repeat', type = int, default = DEFAULT_REPEAT,
+        help = 'number of timings of each benchmark' )
+    run.add_argument( '--threshold', type = float,
+        default = DEFAULT_THRESHOLD,
+        help = 'slowdown ratio reported as a regression' )
+
+    compare = commands.add_parser( 'compare',
+        help = 'compare the results of two runs' )
+    compare.add_argument( 'old' )
+    compare.add_argument( 'new' )
+    compare.add_argument( '--threshold', type = float,
+        default = DEFAULT_THRESHOLD,
+        help = 'slowdown ratio reported as a regression' )
+
+    args = parser.parse_args( argv )
+    if args.command == 'run':
+        def report ( name, time ):
+            print( '%-40s %12.3f us' % ( name, time * 1.0e6 ) )
+
+        new = run_benchmarks( args.patterns, args.min_time, args.repeat,
+                              report )
+        if args.output:
+            save_results( new, args.output )
+        if not args.compare:
+            return 0
+        old = load_results( args.compare )
+    else:
+        old = load_results( args.old )
+        new = load_results( args.new )
+
+    comparison = compare_results( old, new, args.threshold )
+    print( '\n'.join( format_comparison( comparison ) ) )
+    slower = [ item[0] for item in comparison if item[4] == 'slower' ]
+    if len( slower ) > 0:
+        print( '\n%d benchmarks are slower: %s' % ( len( slower ),
+                                                  ', '.join( slower ) ) )
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit( main() )
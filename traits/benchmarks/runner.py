@@ -0,0 +1,216 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines how benchmarks are declared, timed, saved and compared.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import json
+import platform
+import sys
+from datetime import datetime
+from timeit import default_timer
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The version of the format of the saved results:
+RESULTS_VERSION = 1
+
+# The default minimum number of seconds each timing of a benchmark lasts:
+DEFAULT_MIN_TIME = 0.1
+
+# The default number of timings of each benchmark (the best one is kept):
+DEFAULT_REPEAT = 3
+
+# The default ratio by which a benchmark must be slower to be a regression:
+DEFAULT_THRESHOLD = 0.1
+
+# The source of the function timing a statement. The values used by the
+# statement are passed as arguments, so that they are fast local variables:
+TIMER_TEMPLATE = """
+def inner ( _it, _timer%(args)s ):
+    _t0 = _timer()
+    for _i in _it:
+        %(stmt)s
+    return _timer() - _t0
+"""
+
+#-------------------------------------------------------------------------------
+#  Registered benchmarks:
+#-------------------------------------------------------------------------------
+
+# The list of the ( name, stmt, setup ) of all registered benchmarks:
+benchmarks = []
+
+def benchmark ( name, stmt ):
+    """ Decorator registering a benchmark timing the execution of the *stmt*
+        statement (which can use the loop counter '_i').
+
+        The decorated function is called before timing the benchmark, and
+        returns the dictionary of the values used by the statement.
+    """
+    def decorator ( setup ):
+        benchmarks.append( ( name, stmt, setup ) )
+        return setup
+
+    return decorator
+
+#-------------------------------------------------------------------------------
+#  Times statements:
+#-------------------------------------------------------------------------------
+
+def make_timer ( stmt, names ):
+    """ Returns the function timing a number of executions of *stmt*, which
+        uses the values of *names*.
+    """
+    args = ''.join( ', ' + name for name in names )
+    namespace = {}
+    exec( compile( TIMER_TEMPLATE % { 'args': args, 'stmt': stmt },
+                   '<benchmark>', 'exec' ), namespace )
+
+    return namespace[ 'inner' ]
+
+def time_statement ( stmt, values = None, min_time = DEFAULT_MIN_TIME,
+                     repeat = DEFAULT_REPEAT ):
+    """ Returns the best time (in seconds) taken by one execution of *stmt*,
+        not counting the loop overhead, and the number of executions timed.
+    """
+    values = values or {}
+    names  = sorted( values )
+    args   = [ values[ name ] for name in names ]
+    inner  = make_timer( stmt, names )
+    empty  = make_timer( 'pass', names )
+
+    # Find how many executions last at least 'min_time':
+    number = 1
+    while True:
+        elapsed = inner( xrange( number ), default_timer, *args )
+        if elapsed >= min_time:
+            break
+        number *= (10 if elapsed < (min_time / 10.0) else 2)
+
+    best = min( [ elapsed ] + [ inner( xrange( number ), default_timer, *args )
+                                for i in xrange( repeat - 1 ) ] )
+    overhead = min( empty( xrange( number ), default_timer, *args )
+                    for i in xrange( repeat ) )
+
+    return ( max( best - overhead, 0.0 ) / number, number )
+
+#-------------------------------------------------------------------------------
+#  Runs benchmarks:
+#-------------------------------------------------------------------------------
+
+def run_benchmarks ( patterns = None, min_time = DEFAULT_MIN_TIME,
+                     repeat = DEFAULT_REPEAT, report = None ):
+    """ Runs the registered benchmarks whose name contains one of the
+        *patterns* (or all of them), and returns the results.
+
+        *report*, if specified, is called with the name and the time of each
+        benchmark once it has been run.
+    """
+    from . import suite
+
+    results = {}
+    for name, stmt, setup in benchmarks:
+        if patterns and (not any( pattern in name for pattern in patterns )):
+            continue
+
+        time, number = time_statement( stmt, setup(), min_time, repeat )
+        results[ name ] = { 'time': time, 'number': number }
+        if report is not None:
+            report( name, time )
+
+    return { 'version':    RESULTS_VERSION,
+             'metadata':   run_metadata(),
+             'benchmarks': results }
+
+def run_metadata ( ):
+    """ Returns the description of the environment the benchmarks run in.
+    """
+    from .. import __version__
+
+    return { 'date':     datetime.now().isoformat(),
+             'traits':   __version__,
+             'python':   sys.version.split()[0],
+             'platform': platform.platform(),
+             'machine':  platform.machine(),
+             'node':     platform.node() }
+
+#-------------------------------------------------------------------------------
+#  Saves and compares results:
+#-------------------------------------------------------------------------------
+
+def save_results ( results, file_name ):
+    """ Saves the *results* of a run to a JSON file.
+    """
+    with open( file_name, 'w' ) as fh:
+        json.dump( results, fh, indent = 2, sort_keys = True )
+
+def load_results ( file_name ):
+    """ Returns the results of a run saved to a JSON file.
+    """
+    with open( file_name ) as fh:
+        results = json.load( fh )
+
+    if results.get( 'version' ) != RESULTS_VERSION:
+        raise ValueError( 'Unsupported benchmark results file: %s' %
+                          file_name )
+
+    return results
+
+def compare_results ( old, new, threshold = DEFAULT_THRESHOLD ):
+    """ Compares the results of two runs.
+
+        Returns the list of the ( name, old time, new time, ratio, status )
+        tuples of the benchmarks run both times, sorted by name, where the
+        status is 'slower' if the ratio of the new time to the old one
+        exceeds 1 + *threshold*, 'faster' if it is below 1 / (1 + *threshold*)
+        and '' otherwise.
+    """
+    old_times  = old[ 'benchmarks' ]
+    new_times  = new[ 'benchmarks' ]
+    comparison = []
+    for name in sorted( set( old_times ).intersection( new_times ) ):
+        old_time = old_times[ name ][ 'time' ]
+        new_time = new_times[ name ][ 'time' ]
+        ratio    = (new_time / old_time) if old_time > 0.0 else 1.0
+        if ratio > (1.0 + threshold):
+            status = 'slower'
+        elif ratio < (1.0 / (1.0 + threshold)):
+            status = 'faster'
+        else:
+            status = ''
+        comparison.append( ( name, old_time, new_time, ratio, status ) )
+
+    return comparison
+
+def format_comparison ( comparison ):
+    """ Returns the lines of a table describing a comparison of two runs.
+    """
+    width = max( [ 4 ] + [ len( item[0] ) for item in comparison ] )
+    lines = [ '%-*s %12s %12s %8s' % ( width, 'Name', 'Old (us)', 'New (us)',
+                                        'Ratio' ) ]
+    for name, old_time, new_time, ratio, status in comparison:
+        lines.append( '%-*s %12.3f %12.3f %8.2f %s' % ( width, name,
+                      old_time * 1.0e6, new_time * 1.0e6, ratio,
+                      status ) )
+
+    return lines
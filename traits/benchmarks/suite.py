@@ -0,0 +1,313 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" The benchmarks of the basic traits operations.
+
+    The benchmarks are named '<operation>.<variant>', so that related
+    benchmarks can be selected together (e.g. 'get.' or '.int').
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from ..adaptation.api import AdaptationManager
+from ..api import (Adapter, Any, DelegatesTo, Dict, Either, Enum, Float,
+    HasTraits, Instance, Int, Interface, List, Property, PrototypedFrom, Range,
+    Set, Str, Supports, Tuple, provides)
+from .runner import benchmark
+
+#-------------------------------------------------------------------------------
+#  Classes used by the benchmarks:
+#-------------------------------------------------------------------------------
+
+class Plain ( object ):
+
+    value = 0
+
+class Value ( HasTraits ):
+
+    pass
+
+class Node ( HasTraits ):
+
+    value = Int
+
+    child = Instance( 'Node' )
+
+class IShape ( Interface ):
+
+    pass
+
+@provides( IShape )
+class Square ( HasTraits ):
+
+    side = Float( 1.0 )
+
+class Circle ( HasTraits ):
+
+    radius = Float( 1.0 )
+
+@provides( IShape )
+class CircleToIShape ( Adapter ):
+
+    pass
+
+class Drawing ( HasTraits ):
+
+    shape = Supports( IShape )
+
+class Record ( HasTraits ):
+
+    name     = Str( 'record' )
+    count    = Int( 3 )
+    weight   = Float( 1.5 )
+    kind     = Enum( 'a', 'b', 'c' )
+    items    = List( Int, [ 1, 2, 3 ] )
+    mapping  = Dict( Str, Int, { 'a': 1 } )
+    tags     = Set( Str, { 'x' } )
+    position = Tuple( Int, Int )
+    parent   = Instance( Node, () )
+    data     = Any
+
+#-------------------------------------------------------------------------------
+#  Attribute get/set per trait type:
+#-------------------------------------------------------------------------------
+
+# The ( name, trait, value set ) of each trait type benchmarked:
+TRAIT_TYPES = [
+    ( 'any',      lambda: Any,                           1 ),
+    ( 'int',      lambda: Int,                           1 ),
+    ( 'float',    lambda: Float,                         1.5 ),
+    ( 'str',      lambda: Str,                           'a' ),
+    ( 'range',    lambda: Range( 0, 100 ),               50 ),
+    ( 'enum',     lambda: Enum( 'a', 'b', 'c' ),         'b' ),
+    ( 'instance', lambda: Instance( Node ),              Node() ),
+    ( 'either',   lambda: Either( Int, Str ),            'a' ),
+    ( 'property', lambda: Property( lambda self: 1,
+                                    lambda self, value: None ), 1 ),
+]
+
+def _trait_object ( trait ):
+    object = Value()
+    object.add_trait( 'value', trait() )
+    return object
+
+def _register_get_set ( name, trait, value ):
+    benchmark( 'get.' + name, 'object.value' )(
+        lambda: { 'object': _trait_object( trait ) } )
+    benchmark( 'set.' + name, 'object.value = value' )(
+        lambda: { 'object': _trait_object( trait ), 'value': value } )
+
+for name, trait, value in TRAIT_TYPES:
+    _register_get_set( name, trait, value )
+
+@benchmark( 'get.python', 'object.value' )
+def _get_python ( ):
+    return { 'object': Plain() }
+
+@benchmark( 'set.python', 'object.value = 1' )
+def _set_python ( ):
+    return { 'object': Plain() }
+
+class _Delegator ( HasTraits ):
+
+    delegate = Instance( Node, () )
+
+    value = DelegatesTo( 'delegate' )
+
+@benchmark( 'get.delegate', 'object.value' )
+def _get_delegate ( ):
+    return { 'object': _Delegator() }
+
+@benchmark( 'set.delegate', 'object.value = _i' )
+def _set_delegate ( ):
+    return { 'object': _Delegator() }
+
+class _Link ( HasTraits ):
+
+    parent = Instance( HasTraits )
+
+    value = PrototypedFrom( 'parent' )
+
+class _CachedLink ( HasTraits ):
+
+    parent = Instance( HasTraits )
+
+    value = PrototypedFrom( 'parent', cached = True )
+
+# The depths of the chains of delegations benchmarked:
+DELEGATE_DEPTHS = [ 1, 4, 8 ]
+
+def _delegate_chain ( klass, depth ):
+    object = Node( value = 1 )
+    for i in range( depth ):
+        object = klass( parent = object )
+    return { 'object': object }
+
+def _register_delegate_chain ( depth ):
+    benchmark( 'get.delegate_chain_%d' % depth, 'object.value' )(
+        lambda: _delegate_chain( _Link, depth ) )
+    benchmark( 'get.delegate_chain_%d_cached' % depth, 'object.value' )(
+        lambda: _delegate_chain( _CachedLink, depth ) )
+
+for depth in DELEGATE_DEPTHS:
+    _register_delegate_chain( depth )
+
+#-------------------------------------------------------------------------------
+#  Validation:
+#-------------------------------------------------------------------------------
+
+@benchmark( 'validate.float_from_int', 'object.weight = 1' )
+def _validate_float ( ):
+    return { 'object': Record() }
+
+@benchmark( 'validate.list', 'object.items = value' )
+def _validate_list ( ):
+    return { 'object': Record(), 'value': range( 10 ) }
+
+@benchmark( 'validate.dict', 'object.mapping = value' )
+def _validate_dict ( ):
+    return { 'object': Record(), 'value': dict.fromkeys( 'abcdefghij', 1 ) }
+
+@benchmark( 'validate.tuple', 'object.position = value' )
+def _validate_tuple ( ):
+    return { 'object': Record(), 'value': ( 1, 2 ) }
+
+@benchmark( 'validate.supports', 'object.shape = value' )
+def _validate_supports ( ):
+    return { 'object': Drawing(), 'value': Square() }
+
+#-------------------------------------------------------------------------------
+#  Notifiers:
+#-------------------------------------------------------------------------------
+
+def _fan_out ( count ):
+    object = Node()
+    for i in range( count ):
+        object.on_trait_change( lambda new: None, 'value' )
+    return { 'object': object }
+
+@benchmark( 'notify.fan_out_0', 'object.value = _i' )
+def _fan_out_0 ( ):
+    return _fan_out( 0 )
+
+@benchmark( 'notify.fan_out_1', 'object.value = _i' )
+def _fan_out_1 ( ):
+    return _fan_out( 1 )
+
+@benchmark( 'notify.fan_out_10', 'object.value = _i' )
+def _fan_out_10 ( ):
+    return _fan_out( 10 )
+
+def _chain ( ):
+    root = Node( child = Node( child = Node() ) )
+    root.on_trait_change( lambda new: None, 'child.child.value' )
+    return root
+
+@benchmark( 'listener.extended_leaf', 'leaf.value = _i' )
+def _extended_leaf ( ):
+    root = _chain()
+    return { 'leaf': root.child.child }
+
+@benchmark( 'listener.extended_rewire', 'object.child = nodes[ _i & 1 ]' )
+def _extended_rewire ( ):
+    root = _chain()
+    return { 'object': root.child, 'nodes': [ Node(), Node() ] }
+
+@benchmark( 'listener.extended_setup', 'object.on_trait_change( handler, '
+            "'child.child.value' ); object.on_trait_change( handler, "
+            "'child.child.value', remove = True )" )
+def _extended_setup ( ):
+    return { 'object': Node( child = Node( child = Node() ) ),
+             'handler': lambda new: None }
+
+#-------------------------------------------------------------------------------
+#  Container mutations:
+#-------------------------------------------------------------------------------
+
+@benchmark( 'mutate.list_append_pop', 'items.append( _i ); items.pop()' )
+def _list_append ( ):
+    return { 'items': Record().items }
+
+@benchmark( 'mutate.list_setitem', 'items[ 0 ] = _i' )
+def _list_setitem ( ):
+    return { 'items': Record().items }
+
+@benchmark( 'mutate.dict_setitem', 'mapping[ "a" ] = _i' )
+def _dict_setitem ( ):
+    return { 'mapping': Record().mapping }
+
+@benchmark( 'mutate.set_add_discard', 'tags.add( "y" ); tags.discard( "y" )' )
+def _set_add ( ):
+    return { 'tags': Record().tags }
+
+#-------------------------------------------------------------------------------
+#  Copying and pickling:
+#-------------------------------------------------------------------------------
+
+@benchmark( 'copy.clone_traits', 'object.clone_traits()' )
+def _clone_traits ( ):
+    return { 'object': Record() }
+
+@benchmark( 'pickle.round_trip', 'loads( dumps( object, 2 ) )' )
+def _pickle ( ):
+    return { 'object': Record(), 'dumps': pickle.dumps,
+             'loads': pickle.loads }
+
+#-------------------------------------------------------------------------------
+#  Class and instance creation:
+#-------------------------------------------------------------------------------
+
+@benchmark( 'create.class', "meta( 'Created', bases, "
+            "{ 'a': Int(), 'b': Str(), 'c': List( Int ) } )" )
+def _create_class ( ):
+    return { 'meta': type( HasTraits ), 'bases': ( HasTraits, ),
+             'Int': Int, 'Str': Str, 'List': List }
+
+@benchmark( 'create.instance', 'klass()' )
+def _create_instance ( ):
+    return { 'klass': Record }
+
+@benchmark( 'create.instance_with_traits', 'klass( name = "a", count = 1 )' )
+def _create_instance_traits ( ):
+    return { 'klass': Record }
+
+#-------------------------------------------------------------------------------
+#  Adaptation:
+#-------------------------------------------------------------------------------
+
+def _manager ( ):
+    manager = AdaptationManager()
+    manager.register_factory( CircleToIShape, Circle, IShape )
+    return manager
+
+@benchmark( 'adapt.provided', 'manager.adapt( object, IShape )' )
+def _adapt_provided ( ):
+    return { 'manager': _manager(), 'object': Square(), 'IShape': IShape }
+
+@benchmark( 'adapt.adapter', 'manager.adapt( object, IShape )' )
+def _adapt_adapter ( ):
+    return { 'manager': _manager(), 'object': Circle(), 'IShape': IShape }
+
+@benchmark( 'adapt.unsupported', 'manager.adapt( object, IShape, None )' )
+def _adapt_unsupported ( ):
+    return { 'manager': _manager(), 'object': Node(), 'IShape': IShape }
@@ -0,0 +1,71 @@
+""" Tests for the benchmark runner.
+"""
+from __future__ import absolute_import
+
+import os
+import shutil
+import sys
+import tempfile
+
+from traits.testing.unittest_tools import unittest
+
+from ..__main__ import main
+from ..runner import (benchmarks, compare_results, load_results,
+    run_benchmarks, save_results, time_statement)
+
+
+class TestRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_time_statement(self):
+        time, number = time_statement('items.append(_i)', {'items': []},
+                                      min_time=0.001, repeat=2)
+
+        self.assertGreaterEqual(time, 0.0)
+        self.assertGreaterEqual(number, 1)
+
+    def test_all_benchmarks_run(self):
+        results = run_benchmarks(min_time=0.0001, repeat=1)
+
+        self.assertEqual(sorted(results['benchmarks']),
+                         sorted(name for name, stmt, setup in benchmarks))
+        self.assertIn('traits', results['metadata'])
+
+    def test_save_and_compare(self):
+        file_name = os.path.join(self.directory, 'results.json')
+        old = run_benchmarks(['get.int', 'set.int'], min_time=0.0001,
+                             repeat=1)
+        save_results(old, file_name)
+        new = load_results(file_name)
+        new['benchmarks']['get.int']['time'] *= 2.0
+        new['benchmarks']['set.int']['time'] /= 2.0
+
+        comparison = compare_results(old, new)
+
+        self.assertEqual([(item[0], item[4]) for item in comparison],
+                         [('get.int', 'slower'), ('set.int', 'faster')])
+
+    def test_main_flags_regressions(self):
+        old_file = os.path.join(self.directory, 'old.json')
+        new_file = os.path.join(self.directory, 'new.json')
+        results = run_benchmarks(['get.int'], min_time=0.0001, repeat=1)
+        save_results(results, old_file)
+        results['benchmarks']['get.int']['time'] *= 2.0
+        save_results(results, new_file)
+
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                self.assertEqual(main(['compare', old_file, old_file]), 0)
+                self.assertEqual(main(['compare', old_file, new_file]), 1)
+            finally:
+                sys.stdout = stdout
+
+
+if __name__ == '__main__':
+    unittest.main()
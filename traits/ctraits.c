@@ -35,6 +35,8 @@ static PyObject * listener_traits;     /* == "__listener_traits__" */
 static PyObject * editor_property;     /* == "editor" */
 static PyObject * class_prefix;        /* == "__prefix__" */
 static PyObject * trait_added;         /* == "trait_added" */
+static PyObject * items_suffix;        /* == "_items" */
+static PyObject * track_dirty_traits;  /* == "__track_dirty_traits__" */
 static PyObject * empty_tuple;         /* == () */
 static PyObject * empty_dict;          /* == {} */
 static PyObject * Undefined;           /* Global 'Undefined' value */
@@ -49,9 +51,18 @@ static PyObject * adapt;               /* PyProtocols 'adapt' function */
 static PyObject * validate_implements; /* 'validate implementation' function */
 static PyObject * is_callable;         /* Marker for 'callable' value */
 static PyObject * _HasTraits_monitors; /* Object creation monitors. */
+static PyObject * class_monitors_cache; /* Object creation monitors of each
+                                  class, keyed by weak references to the
+                                  classes (cleared when the monitors change) */
+static PyObject * class_monitors_removed; /* Removes the entry of a deleted
+                                  class from 'class_monitors_cache' */
 static PyObject * _trait_notification_handler; /* User supplied trait */
                 /* notification handler (intended for use by debugging tools) */
 static PyTypeObject * ctrait_type;     /* Python-level CTrait type reference */
+static PyObject * dirty_handler = NULL; /* Called with each object starting to
+                                           record changed traits */
+static long dirty_serial = 0;          /* Serial number of the last recorded
+                                          trait change */
 
 /*-----------------------------------------------------------------------------
 |  Macro definitions:
@@ -145,6 +156,9 @@ PyDoc_STRVAR( ctraits__doc__,
    a trait: */
 #define HASTRAITS_VETO_NOTIFY 0x00000004
 
+/* Record the names of the traits whose value changes in 'dirty': */
+#define HASTRAITS_TRACK_DIRTY 0x00000008
+
 /*-----------------------------------------------------------------------------
 |  'CHasTraits' instance definition:
 |
@@ -154,6 +168,11 @@ PyDoc_STRVAR( ctraits__doc__,
 |
 |  All 'anytrait_changed' notification handlers are stored in the instance's
 |  'notifiers' list.
+|
+|  The instance specific notification handlers of a class trait are stored in
+|  the instance's 'inotifiers' side table, which maps the trait name to the
+|  list of its notifiers, so that the class trait does not have to be cloned
+|  into 'itrait_dict' just to hold them.
 +----------------------------------------------------------------------------*/
 
 typedef struct {
@@ -162,7 +181,11 @@ typedef struct {
         PyDictObject * itrait_dict; /* Instance traits dictionary */
     PyListObject * notifiers;   /* List of 'any trait changed' notification
                                    handlers */
+    PyDictObject * inotifiers;  /* Instance notifiers of class traits */
     int            flags;       /* Behavior modification flags */
+    PyObject     * dirty;       /* Set of the names of changed traits */
+    long           dirty_serial; /* Serial number of the last change */
+    PyObject     * delegate_cache; /* Cached values of 'cached' delegates */
         PyObject     * obj_dict;    /* Object attribute dictionary ('__dict__') */
                                 /* NOTE: 'obj_dict' field MUST be last field */
 } has_traits_object;
@@ -203,6 +226,9 @@ static int call_notifiers ( PyListObject *, PyListObject *,
    notifications? */
 #define TRAIT_NO_VALUE_TEST 0x00000100
 
+/* Should the value of a delegated trait be cached on the object? */
+#define TRAIT_CACHE_DELEGATE 0x00000200
+
 /*-----------------------------------------------------------------------------
 |  'CTrait' instance definition:
 +----------------------------------------------------------------------------*/
@@ -646,6 +672,95 @@ call_class ( PyObject * class, trait_object * trait, has_traits_object * obj,
     return result;
 }
 
+/*-----------------------------------------------------------------------------
+|  Records that the value of the trait 'name' of an object has changed:
++----------------------------------------------------------------------------*/
+
+static int
+mark_dirty ( has_traits_object * obj, PyObject * name ) {
+
+    PyObject * result;
+
+    obj->dirty_serial = ++dirty_serial;
+
+    if ( obj->dirty == NULL ) {
+        obj->dirty = PySet_New( NULL );
+        if ( obj->dirty == NULL )
+            return -1;
+
+        /* Let the dirty handler (if any) know about the newly dirty object,
+           so that changes can be found without walking object graphs: */
+        if ( dirty_handler != NULL ) {
+            result = PyObject_CallFunctionObjArgs( dirty_handler,
+                                                   (PyObject *) obj, NULL );
+            if ( result == NULL )
+                return -1;
+            Py_DECREF( result );
+        }
+    }
+
+    return PySet_Add( obj->dirty, name );
+}
+
+/*-----------------------------------------------------------------------------
+|  Records that the items of the trait whose 'xxx_items' event is 'name' have
+|  changed:
++----------------------------------------------------------------------------*/
+
+static int
+mark_items_dirty ( has_traits_object * obj, PyObject * name ) {
+
+    PyObject * suffix;
+    PyObject * base_name;
+    int rc;
+    Py_ssize_t n = PyObject_Length( name );
+
+    if ( n < 0 )
+        return -1;
+
+    if ( n <= 6 )
+        return 0;
+
+    suffix = PySequence_GetSlice( name, n - 6, n );
+    if ( suffix == NULL )
+        return -1;
+
+    rc = PyObject_RichCompareBool( suffix, items_suffix, Py_EQ );
+    Py_DECREF( suffix );
+    if ( rc <= 0 )
+        return rc;
+
+    base_name = PySequence_GetSlice( name, 0, n - 6 );
+    if ( base_name == NULL )
+        return -1;
+
+    rc = mark_dirty( obj, base_name );
+    Py_DECREF( base_name );
+
+    return rc;
+}
+
+/*-----------------------------------------------------------------------------
+|  Removes the cached value of the delegate trait 'name' of an object, and
+|  returns it (or NULL, without setting an exception, if no value is cached):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+uncache_delegate ( has_traits_object * obj, PyObject * name ) {
+
+    PyObject * value;
+
+    if ( (obj->delegate_cache == NULL) ||
+         ((value = PyDict_GetItem( obj->delegate_cache, name )) == NULL) )
+        return NULL;
+
+    Py_INCREF( value );
+    if ( PyDict_DelItem( obj->delegate_cache, name ) < 0 )
+        PyErr_Clear();
+
+    return value;
+}
+
 /*-----------------------------------------------------------------------------
 |  Attempts to get the value of a key in a 'known to be a dictionary' object:
 +----------------------------------------------------------------------------*/
@@ -671,6 +786,26 @@ dict_getitem ( PyDictObject * dict, PyObject *key ) {
 #endif
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns the notifiers list of a trait of an object, which is the list of
+|  the object's 'inotifiers' side table if the trait is the class trait and
+|  the object has instance notifiers for it:
++----------------------------------------------------------------------------*/
+
+static PyListObject *
+trait_notifiers ( trait_object * trait, has_traits_object * obj,
+                  PyObject * name ) {
+
+    PyObject * notifiers;
+
+    if ( (obj->inotifiers != NULL) &&
+         ((notifiers = dict_getitem( obj->inotifiers, name )) != NULL) &&
+         (dict_getitem( obj->ctrait_dict, name ) == (PyObject *) trait) )
+        return (PyListObject *) notifiers;
+
+    return trait->notifiers;
+}
+
 /*-----------------------------------------------------------------------------
 |  Gets the definition of the matching prefix based trait for a specified name:
 |
@@ -718,6 +853,19 @@ setattr_value ( trait_object      * trait,
     PyObject * trait_old = NULL;
     PyObject * value_old = NULL;
 
+    /* Move the instance notifiers of the class trait (if any) into an
+       instance trait, so that 'as_ctrait' copies them: */
+    if ( (obj->inotifiers != NULL) &&
+         (dict_getitem( obj->inotifiers, name ) != NULL) &&
+         (dict_getitem( obj->ctrait_dict, name ) == (PyObject *) trait) ) {
+        trait = (trait_object *) get_trait( obj, name, 2 );
+        if ( trait == NULL )
+            goto error2;
+
+        /* The instance trait dictionary keeps the trait alive: */
+        Py_DECREF( trait );
+    }
+
     trait_new = PyObject_CallMethod( value, "as_ctrait", "(O)", trait );
     if ( trait_new == NULL )
         goto error2;
@@ -824,6 +972,8 @@ has_traits_setattro ( has_traits_object * obj,
 PyObject *
 has_traits_new ( PyTypeObject * type, PyObject * args, PyObject * kwds ) {
 
+    PyObject * value;
+
     // Call PyBaseObject_Type.tp_new to do the actual construction.
     // This allows things like ABCMeta machinery to work correctly
     // which is implemented at the C level.
@@ -844,20 +994,111 @@ has_traits_new ( PyTypeObject * type, PyObject * args, PyObject * kwds ) {
             return NULL;
         }
         Py_INCREF( obj->ctrait_dict );
+
+        value = _PyType_Lookup( type, track_dirty_traits );
+        if ( (value != NULL) && (PyObject_IsTrue( value ) > 0) )
+            obj->flags |= HASTRAITS_TRACK_DIRTY;
     }
 
     return (PyObject *) obj;
 }
 
+/*-----------------------------------------------------------------------------
+|  Removes the cached object creation monitors of a class which has been
+|  deleted (called by the weak reference to the class):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_class_monitors_removed ( PyObject * self, PyObject * ref ) {
+
+    if ( PyDict_DelItem( class_monitors_cache, ref ) < 0 )
+        PyErr_Clear();
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
+
+static PyMethodDef class_monitors_removed_def = {
+    "_class_monitors_removed", (PyCFunction) _class_monitors_removed, METH_O,
+    PyDoc_STR( "_class_monitors_removed(ref)" )
+};
+
+/*-----------------------------------------------------------------------------
+|  Returns the tuple of the object creation monitors of a class (or NULL if an
+|  error occurs).
+|
+|  The tuple is computed from the global list of monitors the first time an
+|  instance of the class is created after the list has been changed, and is
+|  cached until the list changes again. The cache only holds weak references
+|  to the classes. The returned reference is borrowed from the cache.
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_class_monitors ( PyTypeObject * type ) {
+
+    PyObject * ref, * monitors, * monitor, * result;
+    Py_ssize_t i, n;
+    int rc;
+
+    /* Weak references compare equal when their (live) referents are the same,
+       so the shared weak reference to the class (without callback) finds the
+       entry keyed by the weak reference with a callback: */
+    ref = PyWeakref_NewRef( (PyObject *) type, NULL );
+    if ( ref == NULL )
+        return NULL;
+
+    result = PyDict_GetItem( class_monitors_cache, ref );
+    Py_DECREF( ref );
+    if ( result != NULL )
+        return result;
+
+    monitors = PyList_New( 0 );
+    if ( monitors == NULL )
+        return NULL;
+
+    for ( i = 0, n = PyList_GET_SIZE( _HasTraits_monitors ); i < n; i++ ) {
+        monitor = PyList_GET_ITEM( _HasTraits_monitors, i );
+        assert( PyTuple_Check( monitor ) );
+        assert( PyTuple_GET_SIZE( monitor ) == 2 );
+
+        rc = PyObject_IsSubclass( (PyObject *) type,
+                                  PyTuple_GET_ITEM( monitor, 0 ) );
+        if ( (rc < 0) ||
+             ((rc > 0) &&
+              (PyList_Append( monitors, PyTuple_GET_ITEM( monitor, 1 ) ) < 0)) ) {
+            Py_DECREF( monitors );
+            return NULL;
+        }
+    }
+
+    result = PyList_AsTuple( monitors );
+    Py_DECREF( monitors );
+    if ( result == NULL )
+        return NULL;
+
+    ref = PyWeakref_NewRef( (PyObject *) type, class_monitors_removed );
+    if ( ref == NULL ) {
+        Py_DECREF( result );
+        return NULL;
+    }
+
+    rc = PyDict_SetItem( class_monitors_cache, ref, result );
+    Py_DECREF( ref );
+    Py_DECREF( result );
+    if ( rc < 0 )
+        return NULL;
+
+    return result;
+}
+
 int
 has_traits_init ( PyObject * obj, PyObject * args, PyObject * kwds ) {
 
     PyObject * key;
     PyObject * value;
-    PyObject * klass;
-    PyObject * handler;
     PyObject * handler_args;
-    int n;
+    PyObject * monitors;
+    Py_ssize_t n;
     int has_listeners;
     Py_ssize_t i = 0;
 
@@ -896,19 +1137,30 @@ has_traits_init ( PyObject * obj, PyObject * args, PyObject * kwds ) {
     }
 
     /* Notify any interested monitors that a new object has been created: */
-    for ( i = 0, n = PyList_GET_SIZE( _HasTraits_monitors ); i < n; i++ ) {
-        value = PyList_GET_ITEM( _HasTraits_monitors, i );
-        assert( PyTuple_Check( value ) );
-        assert( PyTuple_GET_SIZE( value ) == 2 );
+    if ( PyList_GET_SIZE( _HasTraits_monitors ) > 0 ) {
+        monitors = get_class_monitors( Py_TYPE( obj ) );
+        if ( monitors == NULL )
+            return -1;
 
-        klass   = PyTuple_GET_ITEM( value, 0 );
-        handler = PyTuple_GET_ITEM( value, 1 );
+        n = PyTuple_GET_SIZE( monitors );
+        if ( n > 0 ) {
+            handler_args = PyTuple_Pack( 1, obj );
+            if ( handler_args == NULL )
+                return -1;
 
-        if ( PyObject_IsInstance( obj, klass ) > 0 ) {
-            handler_args = PyTuple_New( 1 );
-            PyTuple_SetItem( handler_args, 0, obj );
-            Py_INCREF( obj );
-            PyObject_Call( handler, handler_args, NULL );
+            /* Hold the monitors in case they are changed by a handler: */
+            Py_INCREF( monitors );
+            for ( i = 0; i < n; i++ ) {
+                value = PyObject_Call( PyTuple_GET_ITEM( monitors, i ),
+                                       handler_args, NULL );
+                if ( value == NULL ) {
+                    Py_DECREF( monitors );
+                    Py_DECREF( handler_args );
+                    return -1;
+                }
+                Py_DECREF( value );
+            }
+            Py_DECREF( monitors );
             Py_DECREF( handler_args );
         }
     }
@@ -936,6 +1188,9 @@ has_traits_clear ( has_traits_object * obj ) {
     Py_CLEAR( obj->ctrait_dict );
     Py_CLEAR( obj->itrait_dict );
     Py_CLEAR( obj->notifiers );
+    Py_CLEAR( obj->inotifiers );
+    Py_CLEAR( obj->dirty );
+    Py_CLEAR( obj->delegate_cache );
     Py_CLEAR( obj->obj_dict );
 
     return 0;
@@ -965,6 +1220,9 @@ has_traits_traverse ( has_traits_object * obj, visitproc visit, void * arg ) {
     Py_VISIT( obj->ctrait_dict );
     Py_VISIT( obj->itrait_dict );
     Py_VISIT( obj->notifiers );
+    Py_VISIT( obj->inotifiers );
+    Py_VISIT( obj->dirty );
+    Py_VISIT( obj->delegate_cache );
     Py_VISIT( obj->obj_dict );
 
         return 0;
@@ -1094,8 +1352,18 @@ get_trait ( has_traits_object * obj, PyObject * name, int instance ) {
     itrait->obj_dict = trait->obj_dict;
     Py_XINCREF( itrait->obj_dict );
 
-    /* Copy the class trait's notifier list into the instance trait: */
-    if ( (notifiers = trait->notifiers) != NULL ) {
+    /* Move the instance notifiers of the class trait (if any) into the
+       instance trait: */
+    if ( (obj->inotifiers != NULL) &&
+         ((item = dict_getitem( obj->inotifiers, name )) != NULL) ) {
+        Py_INCREF( item );
+        itrait->notifiers = (PyListObject *) item;
+        if ( PyDict_DelItem( (PyObject *) obj->inotifiers, name ) < 0 )
+            return NULL;
+
+    /* Otherwise, copy the class trait's notifier list into the instance
+       trait: */
+    } else if ( (notifiers = trait->notifiers) != NULL ) {
         n = PyList_GET_SIZE( notifiers );
         itrait->notifiers = inotifiers = (PyListObject *) PyList_New( n );
         if ( inotifiers == NULL )
@@ -1234,13 +1502,17 @@ trait_property_changed ( has_traits_object * obj, PyObject * name,
     trait_object * trait;
     PyListObject * tnotifiers;
     PyListObject * onotifiers;
+    PyObject     * cached;
     int null_new_value;
     int rc = 0;
 
+    cached = uncache_delegate( obj, name );
+    Py_XDECREF( cached );
+
     if ( (trait = (trait_object *) get_trait( obj, name, -1 )) == NULL )
         return -1;
 
-    tnotifiers = trait->notifiers;
+    tnotifiers = trait_notifiers( trait, obj, name );
     onotifiers = obj->notifiers;
     Py_DECREF( trait );
 
@@ -1335,6 +1607,10 @@ add_trait:
     if ( trait->setattr == setattr_disallow )
         goto add_trait;
 
+    if ( (obj->flags & HASTRAITS_TRACK_DIRTY) &&
+         (mark_items_dirty( obj, name ) < 0) )
+        return NULL;
+
     if ( trait->setattr( trait, trait, obj, name, event_object ) < 0 )
         return NULL;
 
@@ -1392,6 +1668,97 @@ _has_traits_veto_notify ( has_traits_object * obj, PyObject * args ) {
     return Py_None;
 }
 
+/*-----------------------------------------------------------------------------
+|  Enables/Disables recording the names of the traits whose value changes, and
+|  returns whether recording is enabled:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_track_dirty ( has_traits_object * obj, PyObject * args ) {
+
+    int enabled = -1;
+
+    /* Parse arguments, which optionally specify the new dirty tracking
+       enabled/disabled state: */
+    if ( !PyArg_ParseTuple( args, "|i", &enabled ) )
+        return NULL;
+
+    if ( enabled > 0 ) {
+        obj->flags |= HASTRAITS_TRACK_DIRTY;
+    } else if ( enabled == 0 ) {
+        obj->flags &= (~HASTRAITS_TRACK_DIRTY);
+        Py_CLEAR( obj->dirty );
+    }
+
+    if ( obj->flags & HASTRAITS_TRACK_DIRTY ) {
+        Py_INCREF( Py_True );
+        return Py_True;
+    }
+    Py_INCREF( Py_False );
+    return Py_False;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the set of the names of the traits whose value has changed, and
+|  optionally resets it:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_dirty ( has_traits_object * obj, PyObject * args ) {
+
+    PyObject * result;
+    int reset = 0;
+
+    if ( !PyArg_ParseTuple( args, "|i", &reset ) )
+        return NULL;
+
+    result = obj->dirty;
+    if ( result == NULL )
+        return PySet_New( NULL );
+
+    if ( reset ) {
+        /* Hand the existing set over to the caller: */
+        obj->dirty = NULL;
+        return result;
+    }
+
+    return PySet_New( result );
+}
+
+/*-----------------------------------------------------------------------------
+|  Removes and returns the cached value of a 'cached' delegate trait (or
+|  Undefined if no value is cached):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_uncache_delegate ( has_traits_object * obj, PyObject * args ) {
+
+    PyObject * name;
+    PyObject * result;
+
+    if ( !PyArg_ParseTuple( args, "O", &name ) )
+        return NULL;
+
+    result = uncache_delegate( obj, name );
+    if ( result == NULL ) {
+        Py_INCREF( Undefined );
+        return Undefined;
+    }
+
+    return result;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the serial number of the last recorded change of the object's traits
+|  (0 if none has been recorded):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_dirty_serial ( has_traits_object * obj, PyObject * args ) {
+
+    return PyLong_FromLong( obj->dirty_serial );
+}
+
 /*-----------------------------------------------------------------------------
 |  This method is called at the end of a HasTraits constructor and the
 |  __setstate__ method to perform any final object initialization needed.
@@ -1476,6 +1843,109 @@ _has_traits_notifiers ( has_traits_object * obj, PyObject * args ) {
     return result;
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns (and optionally creates) the instance specific notifiers list of a
+|  specified trait:
+|
+|  The legal values for 'force' are:
+|     1: Return the list (creating it if it does not exist)
+|     0: Return the list if it exists (or None)
+|    -1: Remove the list of a class trait from the 'inotifiers' side table
+|        and return it (or None)
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_trait_notifiers ( has_traits_object * obj, PyObject * args ) {
+
+    PyObject     * name;
+    PyObject     * result;
+    trait_object * trait;
+    int force;
+
+    if ( !PyArg_ParseTuple( args, "Oi", &name, &force ) )
+        return NULL;
+
+    /* An instance trait holds its own notifiers: */
+    if ( (force >= 0) && (obj->itrait_dict != NULL) &&
+         ((trait = (trait_object *) dict_getitem( obj->itrait_dict,
+                                                  name )) != NULL) ) {
+        result = (PyObject *) trait->notifiers;
+        if ( result == NULL ) {
+            if ( force == 0 ) {
+                Py_INCREF( Py_None );
+                return Py_None;
+            }
+            if ( (result = PyList_New( 0 )) == NULL )
+                return NULL;
+            trait->notifiers = (PyListObject *) result;
+        }
+        Py_INCREF( result );
+        return result;
+    }
+
+    /* Otherwise, look for the list in the side table: */
+    if ( (obj->inotifiers != NULL) &&
+         ((result = dict_getitem( obj->inotifiers, name )) != NULL) ) {
+        Py_INCREF( result );
+        if ( (force < 0) &&
+             (PyDict_DelItem( (PyObject *) obj->inotifiers, name ) < 0) ) {
+            Py_DECREF( result );
+            return NULL;
+        }
+        return result;
+    }
+
+    if ( force <= 0 ) {
+        Py_INCREF( Py_None );
+        return Py_None;
+    }
+
+    /* Otherwise, create it as a copy of the class trait's notifiers list
+       (creating a prefix trait if necessary): */
+    if ( (trait = (trait_object *) get_trait( obj, name, -1 )) == NULL )
+        return NULL;
+
+    if ( trait->notifiers != NULL )
+        result = PyList_GetSlice( (PyObject *) trait->notifiers, 0,
+                                  PyList_GET_SIZE( trait->notifiers ) );
+    else
+        result = PyList_New( 0 );
+    Py_DECREF( trait );
+    if ( result == NULL )
+        return NULL;
+
+    if ( obj->inotifiers == NULL ) {
+        obj->inotifiers = (PyDictObject *) PyDict_New();
+        if ( obj->inotifiers == NULL ) {
+            Py_DECREF( result );
+            return NULL;
+        }
+    }
+
+    if ( PyDict_SetItem( (PyObject *) obj->inotifiers, name, result ) < 0 ) {
+        Py_DECREF( result );
+        return NULL;
+    }
+
+    return result;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the ( obj_dict, itrait_dict, notifiers, inotifiers ) parts of the
+|  object (each being None if not created yet), without creating any of
+|  them:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_memory_parts ( has_traits_object * obj, PyObject * unused ) {
+
+    return Py_BuildValue( "(OOOO)",
+        (obj->obj_dict    != NULL) ? obj->obj_dict                : Py_None,
+        (obj->itrait_dict != NULL) ? (PyObject *) obj->itrait_dict : Py_None,
+        (obj->notifiers   != NULL) ? (PyObject *) obj->notifiers   : Py_None,
+        (obj->inotifiers  != NULL) ? (PyObject *) obj->inotifiers  : Py_None );
+}
+
 /*-----------------------------------------------------------------------------
 |  Returns the object's instance dictionary:
 +----------------------------------------------------------------------------*/
@@ -1524,6 +1994,17 @@ static PyMethodDef has_traits_methods[] = {
         { "_trait_veto_notify", (PyCFunction) _has_traits_veto_notify,
       METH_VARARGS,
       PyDoc_STR( "_trait_veto_notify(boolean)" ) },
+        { "_trait_track_dirty", (PyCFunction) _has_traits_track_dirty,
+      METH_VARARGS,
+      PyDoc_STR( "_trait_track_dirty([boolean]) -> boolean" ) },
+        { "_trait_dirty",     (PyCFunction) _has_traits_dirty,     METH_VARARGS,
+      PyDoc_STR( "_trait_dirty([reset]) -> set" ) },
+        { "_trait_dirty_serial", (PyCFunction) _has_traits_dirty_serial,
+      METH_NOARGS,
+      PyDoc_STR( "_trait_dirty_serial() -> int" ) },
+        { "_trait_uncache_delegate", (PyCFunction) _has_traits_uncache_delegate,
+      METH_VARARGS,
+      PyDoc_STR( "_trait_uncache_delegate(name) -> value" ) },
         { "traits_init", (PyCFunction) _has_traits_init,
       METH_NOARGS,
       PyDoc_STR( "traits_init()" ) },
@@ -1536,6 +2017,13 @@ static PyMethodDef has_traits_methods[] = {
       PyDoc_STR( "_instance_traits() -> dict" ) },
         { "_notifiers",       (PyCFunction) _has_traits_notifiers, METH_VARARGS,
       PyDoc_STR( "_notifiers(force_create) -> list" ) },
+        { "_trait_notifiers", (PyCFunction) _has_traits_trait_notifiers,
+      METH_VARARGS,
+      PyDoc_STR( "_trait_notifiers(name,force) -> list" ) },
+        { "_memory_parts",    (PyCFunction) _has_traits_memory_parts,
+      METH_NOARGS,
+      PyDoc_STR( "_memory_parts() -> "
+                 "(obj_dict,itrait_dict,notifiers,inotifiers)" ) },
         { NULL, NULL },
 };
 
@@ -1730,7 +2218,7 @@ getattr_trait ( trait_object      * trait,
                     rc = trait->post_setattr( trait, obj, name, result );
 
                 if (rc == 0) {
-                    tnotifiers = trait->notifiers;
+                    tnotifiers = trait_notifiers( trait, obj, name );
                     onotifiers = obj->notifiers;
                     if ( has_notifiers( tnotifiers, onotifiers ) )
                         rc = call_notifiers( tnotifiers, onotifiers, obj, name,
@@ -1761,7 +2249,7 @@ getattr_trait ( trait_object      * trait,
                 rc = trait->post_setattr( trait, obj, nname, result );
 
             if (rc == 0) {
-                tnotifiers = trait->notifiers;
+                tnotifiers = trait_notifiers( trait, obj, nname );
                 onotifiers = obj->notifiers;
                 if ( has_notifiers( tnotifiers, onotifiers ) )
                     rc = call_notifiers( tnotifiers, onotifiers, obj, nname,
@@ -1798,6 +2286,19 @@ getattr_delegate ( trait_object      * trait,
     PyObject     * result;
     PyObject     * nname;
     PyObject     * dict = obj->obj_dict;
+    int            cache = 0;
+
+    if ( trait->flags & TRAIT_CACHE_DELEGATE ) {
+        if ( (obj->delegate_cache != NULL) &&
+             ((result = PyDict_GetItem( obj->delegate_cache, name )) != NULL) ) {
+            Py_INCREF( result );
+            return result;
+        }
+
+        // Only cache the value once the object's delegate listeners are in
+        // place to invalidate it:
+        cache = ((obj->flags & HASTRAITS_INITED) != 0);
+    }
 
     if ( (dict == NULL) ||
          ((delegate = PyDict_GetItem( dict, trait->delegate_name )) == NULL) ){
@@ -1806,10 +2307,17 @@ getattr_delegate ( trait_object      * trait,
         delegate = has_traits_getattro( obj, trait->delegate_name );
         if ( delegate == NULL )
             return NULL;
+
+        // Changes to a computed delegate are not notified:
+        cache = 0;
     } else {
         Py_INCREF( delegate );
     }
 
+    // Changes to the attributes of non-HasTraits delegates are not notified:
+    if ( cache && !PyHasTraits_Check( delegate ) )
+        cache = 0;
+
     nname = Py2to3_NormaliseAttrName(name);
 
     if( nname == NULL ){
@@ -1851,6 +2359,15 @@ getattr_delegate ( trait_object      * trait,
     result = NULL;
 
 done:
+    if ( cache && (result != NULL) ) {
+        if ( obj->delegate_cache == NULL )
+            obj->delegate_cache = PyDict_New();
+        if ( (obj->delegate_cache == NULL) ||
+             (PyDict_SetItem( obj->delegate_cache, nname, result ) < 0) ) {
+            Py_CLEAR( result );
+        }
+    }
+
     Py_DECREF( delegate_attr_name );
     Py2to3_FinishNormaliseAttrName(name,nname);
     Py_DECREF( delegate );
@@ -2208,7 +2725,7 @@ setattr_event ( trait_object      * traito,
             Py_INCREF( value );
         }
 
-        tnotifiers = traito->notifiers;
+        tnotifiers = trait_notifiers( traito, obj, name );
         onotifiers = obj->notifiers;
 
         if ( has_notifiers( tnotifiers, onotifiers ) )
@@ -2271,8 +2788,11 @@ setattr_trait ( trait_object      * traito,
         }
 
         rc = 0;
-        if ( (obj->flags & HASTRAITS_NO_NOTIFY) == 0 ) {
-            tnotifiers = traito->notifiers;
+        if ( obj->flags & HASTRAITS_TRACK_DIRTY )
+            rc = mark_dirty( obj, nname );
+
+        if ( (rc == 0) && ((obj->flags & HASTRAITS_NO_NOTIFY) == 0) ) {
+            tnotifiers = trait_notifiers( traito, obj, nname );
             onotifiers = obj->notifiers;
             if ( (tnotifiers != NULL) || (onotifiers != NULL) ) {
                 value = traito->getattr( traito, obj, nname );
@@ -2345,24 +2865,31 @@ setattr_trait ( trait_object      * traito,
                    original_value: value;
     old_value    = NULL;
 
-    tnotifiers    = traito->notifiers;
+    tnotifiers    = trait_notifiers( traito, obj, nname );
     onotifiers    = obj->notifiers;
     do_notifiers  = has_notifiers( tnotifiers, onotifiers );
 
     post_setattr = traitd->post_setattr;
-    if ( (post_setattr != NULL) || do_notifiers ) {
+    if ( (post_setattr != NULL) || do_notifiers ||
+         (obj->flags & HASTRAITS_TRACK_DIRTY) ) {
         old_value = PyDict_GetItem( dict, nname );
         if ( old_value == NULL ) {
-            if ( traitd != traito ) {
-                old_value = traito->getattr( traito, obj, nname );
+            if ( (post_setattr == NULL) && !do_notifiers ) {
+                /* Only tracking changes, so there is no need to compute the
+                   (possibly dynamic) default value: */
+                changed = 1;
             } else {
-                old_value = default_value_for( traitd, obj, nname );
-            }
-            if ( old_value == NULL ) {
-                Py2to3_FinishNormaliseAttrName( name, nname );
-                Py_DECREF( value );
+                if ( traitd != traito ) {
+                    old_value = traito->getattr( traito, obj, nname );
+                } else {
+                    old_value = default_value_for( traitd, obj, nname );
+                }
+                if ( old_value == NULL ) {
+                    Py2to3_FinishNormaliseAttrName( name, nname );
+                    Py_DECREF( value );
 
-                return -1;
+                    return -1;
+                }
             }
         } else {
             Py_INCREF( old_value );
@@ -2394,7 +2921,10 @@ setattr_trait ( trait_object      * traito,
     rc = 0;
 
     if ( changed ) {
-        if ( post_setattr != NULL )
+        if ( obj->flags & HASTRAITS_TRACK_DIRTY )
+            rc = mark_dirty( obj, nname );
+
+        if ( (rc == 0) && (post_setattr != NULL) )
             rc = post_setattr( traitd, obj, nname,
                     (traitd->flags & TRAIT_POST_SETATTR_ORIGINAL_VALUE)?
                     original_value: value );
@@ -2428,8 +2958,13 @@ setattr_delegate ( trait_object      * traito,
     PyObject          * temp;
     has_traits_object * delegate;
     has_traits_object * temp_delegate;
+    PyObject          * cached;
         int i, result;
 
+    /* Any cached value is about to become out of date: */
+    cached = uncache_delegate( obj, name );
+    Py_XDECREF( cached );
+
     /* Follow the delegation chain until we find a non-delegated trait: */
     daname = name;
     Py_INCREF( daname );
@@ -3579,6 +4114,16 @@ validate_trait_adapt ( trait_object * trait, has_traits_object * obj,
         return NULL;
 #endif // #if PY_MAJOR_VERSION < 3
 
+    /* An object which already provides the protocol is accepted as is, so
+       there is no need to go through the adaptation manager: */
+    rc = PyObject_IsInstance( value, type );
+    if ( rc > 0 ) {
+        Py_INCREF( value );
+        return value;
+    }
+    if ( rc < 0 )
+        PyErr_Clear();
+
     if ( mode == 2 ) {
         args = PyTuple_New( 3 );
         if ( args == NULL )
@@ -4592,6 +5137,30 @@ _trait_is_mapped ( trait_object * trait, PyObject * args ) {
     return (PyObject *) trait;
 }
 
+/*-----------------------------------------------------------------------------
+|  Sets the value of the 'cache_delegate' flag of a CTrait instance (used to
+|  cache the value of a delegated trait on the object until a delegate
+|  listener reports a change):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_trait_cache_delegate ( trait_object * trait, PyObject * args ) {
+
+    int cache_delegate;
+
+    if ( !PyArg_ParseTuple( args, "i", &cache_delegate ) )
+        return NULL;
+
+    if ( cache_delegate != 0 ) {
+        trait->flags |= TRAIT_CACHE_DELEGATE;
+    } else {
+        trait->flags &= (~TRAIT_CACHE_DELEGATE);
+    }
+
+    Py_INCREF( trait );
+    return (PyObject *) trait;
+}
+
 /*-----------------------------------------------------------------------------
 |  Sets the 'property' value fields of a CTrait instance:
 +----------------------------------------------------------------------------*/
@@ -4954,6 +5523,9 @@ static PyMethodDef trait_methods[] = {
                 PyDoc_STR( "post_setattr_original_value(original_value_boolean)" ) },
         { "is_mapped", (PyCFunction) _trait_is_mapped,  METH_VARARGS,
                 PyDoc_STR( "is_mapped(is_mapped_boolean)" ) },
+        { "cache_delegate", (PyCFunction) _trait_cache_delegate,
+          METH_VARARGS,
+                PyDoc_STR( "cache_delegate(cache_delegate_boolean)" ) },
         { "property",      (PyCFunction) _trait_property,      METH_VARARGS,
                 PyDoc_STR( "property([get,set,validate])" ) },
         { "clone",         (PyCFunction) _trait_clone,         METH_VARARGS,
@@ -5022,6 +5594,440 @@ static PyTypeObject trait_type = {
     DEFERRED_ADDRESS( PyType_GenericNew )          /* tp_new */
 };
 
+/*-----------------------------------------------------------------------------
+|  'cSyncNotifier' instance definition:
+|
+|  A 'cSyncNotifier' is a trait change notification handler used by
+|  'HasTraits.sync_trait' which copies the new value of a trait to a trait of
+|  another object without running any Python code. It only keeps a weak
+|  reference to the other object, and removes itself from the notifiers list
+|  it belongs to when that object is deleted.
+|
+|  While a notifier copies the value of a trait, the (object, trait name) pair
+|  it copies from is recorded as being propagated by the current thread, and
+|  no value is copied back to any trait being propagated, so that cycles of
+|  synchronized traits (of any length) are only followed once.
++----------------------------------------------------------------------------*/
+
+typedef struct _sync_notifier_object {
+    PyObject_HEAD
+    PyObject * notifiers;   /* Notifiers list the notifier belongs to */
+    PyObject * target;      /* Weak reference to the synchronized object */
+    PyObject * target_name; /* Name of the synchronized trait */
+    PyObject * name;        /* Name of the trait being synchronized (or NULL
+                               if it is the name of the notified trait) */
+    int        items;       /* Mirror the list 'items' events? */
+} sync_notifier_object;
+
+static PyTypeObject sync_notifier_type;
+
+/* A trait whose value is being copied by a 'cSyncNotifier' (the records live
+   on the C stack of the copying call, and are linked in a list): */
+typedef struct _sync_propagation {
+    PyObject      * object;  /* Object whose trait value is copied */
+    PyObject      * name;    /* Name of the trait */
+    PyThreadState * thread;  /* Thread copying the value */
+    struct _sync_propagation * previous, * next;
+} sync_propagation;
+
+/* The traits whose values are currently being copied (in all threads): */
+static sync_propagation * sync_propagations = NULL;
+
+/*-----------------------------------------------------------------------------
+|  Returns whether the value of a specified trait is currently being copied
+|  by the current thread:
++----------------------------------------------------------------------------*/
+
+static int
+sync_is_propagating ( PyObject * object, PyObject * name ) {
+
+    sync_propagation * propagation;
+    int rc;
+
+    PyThreadState * thread = PyThreadState_GET();
+
+    for ( propagation = sync_propagations; propagation != NULL;
+          propagation = propagation->next ) {
+        if ( (propagation->object != object) ||
+             (propagation->thread != thread) )
+            continue;
+
+        if ( propagation->name == name )
+            return 1;
+
+        rc = PyObject_RichCompareBool( propagation->name, name, Py_EQ );
+        if ( rc < 0 )
+            PyErr_Clear();
+        else if ( rc > 0 )
+            return 1;
+    }
+
+    return 0;
+}
+
+/*-----------------------------------------------------------------------------
+|  Creates a new 'cSyncNotifier' instance:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+sync_notifier_new ( PyTypeObject * type, PyObject * args, PyObject * kwds ) {
+
+    sync_notifier_object * notifier;
+    PyObject * notifiers, * target, * target_name;
+    PyObject * name  = NULL;
+    int        items = 0;
+
+    if ( !PyArg_ParseTuple( args, "O!OO|iO", &PyList_Type, &notifiers,
+                            &target, &target_name, &items, &name ) )
+        return NULL;
+
+    notifier = (sync_notifier_object *) type->tp_alloc( type, 0 );
+    if ( notifier == NULL )
+        return NULL;
+
+    notifier->target = PyWeakref_NewRef( target, (PyObject *) notifier );
+    if ( notifier->target == NULL ) {
+        Py_DECREF( notifier );
+        return NULL;
+    }
+
+    Py_INCREF( notifiers );
+    notifier->notifiers = notifiers;
+    Py_INCREF( target_name );
+    notifier->target_name = target_name;
+    Py_XINCREF( name );
+    notifier->name        = name;
+    notifier->items       = items;
+
+    return (PyObject *) notifier;
+}
+
+/*-----------------------------------------------------------------------------
+|  Removes a 'cSyncNotifier' from its notifiers list and releases the
+|  synchronized object:
++----------------------------------------------------------------------------*/
+
+static int
+sync_notifier_detach ( sync_notifier_object * notifier ) {
+
+    Py_ssize_t i;
+
+    int        rc        = 0;
+    PyObject * notifiers = notifier->notifiers;
+
+    /* Removing the notifier from its list may release the last reference
+       to it: */
+    Py_INCREF( notifier );
+
+    notifier->notifiers = NULL;
+    if ( notifiers != NULL ) {
+        for ( i = PyList_GET_SIZE( notifiers ) - 1; i >= 0; i-- ) {
+            if ( PyList_GET_ITEM( notifiers, i ) == (PyObject *) notifier ) {
+                rc = PyList_SetSlice( notifiers, i, i + 1, NULL );
+                break;
+            }
+        }
+        Py_DECREF( notifiers );
+    }
+
+    Py_CLEAR( notifier->target );
+    Py_DECREF( notifier );
+
+    return rc;
+}
+
+/*-----------------------------------------------------------------------------
+|  Copies a list 'items' event to the synchronized list:
++----------------------------------------------------------------------------*/
+
+static int
+sync_notifier_items ( PyObject * target, PyObject * name, PyObject * event ) {
+
+    Py_ssize_t n0, n1;
+    PyObject * list, * index, * removed, * added;
+
+    int rc = -1;
+
+    list    = PyObject_GetAttr( target, name );
+    index   = PyObject_GetAttrString( event, "index" );
+    removed = PyObject_GetAttrString( event, "removed" );
+    added   = PyObject_GetAttrString( event, "added" );
+    if ( (list != NULL) && (index != NULL) && (removed != NULL) &&
+         (added != NULL) ) {
+        n0 = PyNumber_AsSsize_t( index, NULL );
+        n1 = PySequence_Length( removed );
+        if ( (n0 != -1 || !PyErr_Occurred()) && (n1 >= 0) )
+            rc = PySequence_SetSlice( list, n0, n0 + n1, added );
+    }
+
+    Py_XDECREF( list );
+    Py_XDECREF( index );
+    Py_XDECREF( removed );
+    Py_XDECREF( added );
+
+    return rc;
+}
+
+/*-----------------------------------------------------------------------------
+|  Handles a trait change notification, or the deletion of the synchronized
+|  object (when called by the weak reference with a single argument):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+sync_notifier_call ( sync_notifier_object * notifier, PyObject * args,
+                     PyObject * kwds ) {
+
+    PyObject * target;
+    sync_propagation propagation;
+    int rc;
+
+    if ( PyTuple_GET_SIZE( args ) == 1 ) {
+        if ( sync_notifier_detach( notifier ) < 0 )
+            return NULL;
+
+        Py_INCREF( Py_None );
+        return Py_None;
+    }
+
+    if ( PyTuple_GET_SIZE( args ) != 4 ) {
+        PyErr_SetString( PyExc_TypeError,
+            "A cSyncNotifier must be called with (object, name, old, new)." );
+        return NULL;
+    }
+
+    if ( notifier->target == NULL ) {
+        Py_INCREF( Py_None );
+        return Py_None;
+    }
+
+    /* Do not copy a value back to a trait it is being copied from: */
+    target = PyWeakref_GET_OBJECT( notifier->target );
+    if ( (target == Py_None) ||
+         sync_is_propagating( target, notifier->target_name ) ) {
+        Py_INCREF( Py_None );
+        return Py_None;
+    }
+
+    /* The notifier may be removed from its list while copying the value: */
+    Py_INCREF( notifier );
+    Py_INCREF( target );
+
+    propagation.object   = PyTuple_GET_ITEM( args, 0 );
+    propagation.name     = (notifier->name != NULL) ? notifier->name :
+                                                     PyTuple_GET_ITEM( args, 1 );
+    propagation.thread   = PyThreadState_GET();
+    propagation.previous = NULL;
+    propagation.next     = sync_propagations;
+    if ( sync_propagations != NULL )
+        sync_propagations->previous = &propagation;
+    sync_propagations = &propagation;
+
+    if ( notifier->items )
+        rc = sync_notifier_items( target, notifier->target_name,
+                                  PyTuple_GET_ITEM( args, 3 ) );
+    else
+        rc = PyObject_SetAttr( target, notifier->target_name,
+                               PyTuple_GET_ITEM( args, 3 ) );
+
+    /* Other threads may have added or removed records in the meantime: */
+    if ( propagation.previous != NULL )
+        propagation.previous->next = propagation.next;
+    else
+        sync_propagations = propagation.next;
+    if ( propagation.next != NULL )
+        propagation.next->previous = propagation.previous;
+
+    Py_DECREF( target );
+    Py_DECREF( notifier );
+
+    /* Values which cannot be assigned to the synchronized trait are ignored: */
+    if ( rc < 0 )
+        PyErr_Clear();
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns whether a specified handler is the same as the notifier:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_sync_notifier_equals ( sync_notifier_object * notifier, PyObject * args ) {
+
+    PyObject * handler;
+
+    if ( !PyArg_ParseTuple( args, "O", &handler ) )
+        return NULL;
+
+    return PyBool_FromLong( handler == (PyObject *) notifier );
+}
+
+/*-----------------------------------------------------------------------------
+|  Removes the notifier from its notifiers list:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_sync_notifier_dispose ( sync_notifier_object * notifier, PyObject * args ) {
+
+    if ( sync_notifier_detach( notifier ) < 0 )
+        return NULL;
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the synchronized object (or None if it has been deleted):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_sync_notifier_target ( sync_notifier_object * notifier, void * closure ) {
+
+    PyObject * target = Py_None;
+
+    if ( notifier->target != NULL )
+        target = PyWeakref_GET_OBJECT( notifier->target );
+
+    Py_INCREF( target );
+    return target;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the name of the synchronized trait:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_sync_notifier_target_name ( sync_notifier_object * notifier,
+                                void * closure ) {
+
+    Py_INCREF( notifier->target_name );
+    return notifier->target_name;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns whether the notifier mirrors list 'items' events:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_sync_notifier_items ( sync_notifier_object * notifier, void * closure ) {
+
+    return PyBool_FromLong( notifier->items );
+}
+
+/*-----------------------------------------------------------------------------
+|  Garbage collector traversal method:
++----------------------------------------------------------------------------*/
+
+static int
+sync_notifier_traverse ( sync_notifier_object * notifier, visitproc visit,
+                         void * arg ) {
+
+    Py_VISIT( notifier->notifiers );
+    Py_VISIT( notifier->target );
+    Py_VISIT( notifier->target_name );
+    Py_VISIT( notifier->name );
+
+    return 0;
+}
+
+/*-----------------------------------------------------------------------------
+|  Garbage collector 'clear' method:
++----------------------------------------------------------------------------*/
+
+static int
+sync_notifier_clear ( sync_notifier_object * notifier ) {
+
+    Py_CLEAR( notifier->notifiers );
+    Py_CLEAR( notifier->target );
+    Py_CLEAR( notifier->target_name );
+    Py_CLEAR( notifier->name );
+
+    return 0;
+}
+
+/*-----------------------------------------------------------------------------
+|  Deallocates an unused 'cSyncNotifier' instance:
++----------------------------------------------------------------------------*/
+
+static void
+sync_notifier_dealloc ( sync_notifier_object * notifier ) {
+
+    PyObject_GC_UnTrack( notifier );
+    Py_TRASHCAN_SAFE_BEGIN( notifier );
+    sync_notifier_clear( notifier );
+    Py_TYPE(notifier)->tp_free( (PyObject *) notifier );
+    Py_TRASHCAN_SAFE_END( notifier );
+}
+
+/*-----------------------------------------------------------------------------
+|  'cSyncNotifier' instance methods:
++----------------------------------------------------------------------------*/
+
+static PyMethodDef sync_notifier_methods[] = {
+        { "equals",  (PyCFunction) _sync_notifier_equals,  METH_VARARGS,
+                PyDoc_STR( "equals(handler)" ) },
+        { "dispose", (PyCFunction) _sync_notifier_dispose, METH_NOARGS,
+                PyDoc_STR( "dispose()" ) },
+        { NULL, NULL },
+};
+
+/*-----------------------------------------------------------------------------
+|  'cSyncNotifier' property definitions:
++----------------------------------------------------------------------------*/
+
+static PyGetSetDef sync_notifier_properties[] = {
+        { "target",      (getter) get_sync_notifier_target,      NULL },
+        { "target_name", (getter) get_sync_notifier_target_name, NULL },
+        { "items",       (getter) get_sync_notifier_items,       NULL },
+        { 0 }
+};
+
+/*-----------------------------------------------------------------------------
+|  'cSyncNotifier' type definition:
++----------------------------------------------------------------------------*/
+
+static PyTypeObject sync_notifier_type = {
+    PyVarObject_HEAD_INIT( DEFERRED_ADDRESS( &PyType_Type ), 0 )
+    "traits.ctraits.cSyncNotifier",
+    sizeof( sync_notifier_object ),
+    0,
+    (destructor) sync_notifier_dealloc,            /* tp_dealloc */
+    0,                                             /* tp_print */
+    0,                                             /* tp_getattr */
+    0,                                             /* tp_setattr */
+    0,                                             /* tp_compare */
+    0,                                             /* tp_repr */
+    0,                                             /* tp_as_number */
+    0,                                             /* tp_as_sequence */
+    0,                                             /* tp_as_mapping */
+    0,                                             /* tp_hash */
+    (ternaryfunc) sync_notifier_call,              /* tp_call */
+    0,                                             /* tp_str */
+    0,                                             /* tp_getattro */
+    0,                                             /* tp_setattro */
+    0,                                             /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,       /* tp_flags */
+    0,                                             /* tp_doc */
+    (traverseproc) sync_notifier_traverse,         /* tp_traverse */
+    (inquiry) sync_notifier_clear,                 /* tp_clear */
+    0,                                             /* tp_richcompare */
+    0,                                             /* tp_weaklistoffset */
+    0,                                             /* tp_iter */
+    0,                                             /* tp_iternext */
+    sync_notifier_methods,                         /* tp_methods */
+    0,                                             /* tp_members */
+    sync_notifier_properties,                      /* tp_getset */
+    DEFERRED_ADDRESS( &PyBaseObject_Type ),        /* tp_base */
+    0,                                             /* tp_dict */
+    0,                                             /* tp_descr_get */
+    0,                                             /* tp_descr_set */
+    0,                                             /* tp_dictoffset */
+    0,                                             /* tp_init */
+    DEFERRED_ADDRESS( PyType_GenericAlloc ),       /* tp_alloc */
+    (newfunc) sync_notifier_new                    /* tp_new */
+};
+
 /*-----------------------------------------------------------------------------
 |  Sets the global 'Undefined' and 'Uninitialized' values:
 +----------------------------------------------------------------------------*/
@@ -5169,6 +6175,45 @@ _ctraits_trait_notification_handler ( PyObject * self, PyObject * args ) {
     return result;
 }
 
+/*-----------------------------------------------------------------------------
+|  Sets the global 'dirty_handler' function, called with each object which
+|  starts recording changed traits, and returns the serial number of the last
+|  recorded change:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_dirty_handler ( PyObject * self, PyObject * args ) {
+
+    PyObject * handler = NULL;
+
+    if ( !PyArg_ParseTuple( args, "|O", &handler ) )
+        return NULL;
+
+    if ( handler != NULL ) {
+        Py_CLEAR( dirty_handler );
+        if ( handler != Py_None ) {
+            Py_INCREF( handler );
+            dirty_handler = handler;
+        }
+    }
+
+    return PyLong_FromLong( dirty_serial );
+}
+
+/*-----------------------------------------------------------------------------
+|  Invalidates the object creation monitors of all classes, after the global
+|  list of monitors has been changed:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_monitors_changed ( PyObject * self, PyObject * args ) {
+
+    PyDict_Clear( class_monitors_cache );
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
+
 /*-----------------------------------------------------------------------------
 |  'CTrait' instance methods:
 +----------------------------------------------------------------------------*/
@@ -5191,6 +6236,10 @@ static PyMethodDef ctraits_methods[] = {
         { "_trait_notification_handler",
         (PyCFunction) _ctraits_trait_notification_handler,  METH_VARARGS,
         PyDoc_STR( "_trait_notification_handler(handler)" ) },
+        { "_monitors_changed", (PyCFunction) _ctraits_monitors_changed,
+        METH_NOARGS, PyDoc_STR( "_monitors_changed()" ) },
+        { "_dirty_handler", (PyCFunction) _ctraits_dirty_handler,
+        METH_VARARGS, PyDoc_STR( "_dirty_handler([handler]) -> int" ) },
         { NULL, NULL },
 };
 
@@ -5237,6 +6286,17 @@ Py2to3_MOD_INIT(ctraits) {
                          (PyObject *) &trait_type ) < 0 )
        return Py2to3_MOD_ERROR_VAL;
 
+    /* Create the 'cSyncNotifier' type: */
+    sync_notifier_type.tp_base  = &PyBaseObject_Type;
+    sync_notifier_type.tp_alloc = PyType_GenericAlloc;
+    if ( PyType_Ready( &sync_notifier_type ) < 0 )
+       return Py2to3_MOD_ERROR_VAL;
+
+    Py_INCREF( &sync_notifier_type );
+    if ( PyModule_AddObject( module, "cSyncNotifier",
+                         (PyObject *) &sync_notifier_type ) < 0 )
+       return Py2to3_MOD_ERROR_VAL;
+
     /* Create the 'HasTraitsMonitor' list: */
     tmp = PyList_New( 0 );
     Py_INCREF( tmp );
@@ -5247,6 +6307,16 @@ Py2to3_MOD_INIT(ctraits) {
 
     _HasTraits_monitors = tmp;
 
+    /* Create the cache of the object creation monitors of each class: */
+    class_monitors_cache = PyDict_New();
+    if ( class_monitors_cache == NULL )
+        return Py2to3_MOD_ERROR_VAL;
+
+    class_monitors_removed = PyCFunction_New( &class_monitors_removed_def,
+                                              NULL );
+    if ( class_monitors_removed == NULL )
+        return Py2to3_MOD_ERROR_VAL;
+
     /* Predefine a Python string == "__class_traits__": */
     class_traits = Py2to3_SimpleString_FromString( "__class_traits__" );
 
@@ -5262,6 +6332,13 @@ Py2to3_MOD_INIT(ctraits) {
     /* Predefine a Python string == "trait_added": */
     trait_added = Py2to3_SimpleString_FromString( "trait_added" );
 
+    /* Predefine a Python string == "_items": */
+    items_suffix = Py2to3_SimpleString_FromString( "_items" );
+
+    /* Predefine a Python string == "__track_dirty_traits__": */
+    track_dirty_traits = Py2to3_SimpleString_FromString(
+                             "__track_dirty_traits__" );
+
     /* Create an empty tuple: */
     empty_tuple = PyTuple_New( 0 );
 
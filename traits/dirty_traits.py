@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the collect_dirty_traits() function, used to gather the changes
+    recorded by dirty tracking (see HasTraits.track_dirty_traits()) across a
+    graph of HasTraits objects.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+from weakref import WeakKeyDictionary
+
+from .trait_graph import TraitGraph, changed_objects
+
+#-------------------------------------------------------------------------------
+#  Global Data:
+#-------------------------------------------------------------------------------
+
+# The graph of the objects reachable from each object collect_dirty_traits()
+# was called with:
+_dirty_graphs = WeakKeyDictionary()
+
+#-------------------------------------------------------------------------------
+#  Collects the dirty traits of a graph of HasTraits objects:
+#-------------------------------------------------------------------------------
+
+def collect_dirty_traits ( root, clear = False ):
+    """ Returns the changed traits of all objects reachable from *root*.
+
+        Parameters
+        ----------
+        root : HasTraits
+            The object the graph of objects to collect changes from starts
+            at. All HasTraits objects referred to by its copyable traits
+            (including those contained in lists, sets and dictionaries) are
+            visited, recursively.
+        clear : bool
+            Flag indicating whether the collected changes should also be
+            cleared on each object.
+
+        Returns
+        -------
+        changes : list of ( object, names ) tuples
+            One entry for each visited object which has changed traits, where
+            *names* is the set of names of its changed traits.
+
+        Description
+        -----------
+        The graph of objects is walked in full the first time only. Later
+        calls only visit the objects which changed since, as long as all the
+        objects of the graph track their changes (see
+        HasTraits.track_dirty_traits()).
+    """
+    graph = _dirty_graphs.get( root )
+    if graph is None:
+        graph = _dirty_graphs[ root ] = TraitGraph( root )
+
+    graph.update()
+
+    # Only the objects which recorded changes need to be visited:
+    changes = []
+    for object in changed_objects():
+        if object in graph.nodes:
+            names = object._trait_dirty( clear )
+            if len( names ) > 0:
+                changes.append( ( object, names ) )
+
+    return changes
@@ -32,23 +32,30 @@ import weakref
 import re
 import sys
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import local as thread_local
+
 from types import FunctionType, MethodType
 
 from . import __version__ as TraitsVersion
 
 from .adaptation.adaptation_error import AdaptationError
 
-from .ctraits import CHasTraits, _HasTraits_monitors
+from .ctraits import (CHasTraits, cSyncNotifier, _HasTraits_monitors,
+    _monitors_changed)
 
 from .traits import (CTrait, ForwardProperty, Property, SpecialNames, Trait,
     TraitFactory, __newobj__, generic_trait, trait_factory)
 
 from .trait_types import Any, Bool, Disallow, Enum, Event, Python, This
 
-from .trait_notifiers import (ExtendedTraitChangeNotifyWrapper,
-    FastUITraitChangeNotifyWrapper, NewTraitChangeNotifyWrapper,
-    StaticAnyTraitChangeNotifyWrapper, StaticTraitChangeNotifyWrapper,
-    TraitChangeNotifyWrapper)
+from .trait_notifiers import (DataflowTraitChangeNotifyWrapper,
+    DebounceTraitChangeNotifyWrapper, DeferredTraitChangeNotifyWrapper,
+    ExtendedTraitChangeNotifyWrapper, FastUITraitChangeNotifyWrapper,
+    ThrottleTraitChangeNotifyWrapper,
+    NewTraitChangeNotifyWrapper, StaticAnyTraitChangeNotifyWrapper,
+    StaticTraitChangeNotifyWrapper, TraitChangeNotifyWrapper)
 
 from .trait_handlers import TraitType
 
@@ -57,6 +64,9 @@ from .trait_base import (Missing, SequenceTypes, TraitsCache, Undefined,
 
 from .trait_errors import TraitError
 
+# Registers the objects which record changed traits (see dirty_traits()):
+from . import trait_graph
+
 from .protocols.advice import addClassAdvisor
 
 from .util.deprecated import deprecated
@@ -800,7 +810,13 @@ def _trait_monitor_index ( cls, handler ):
     global _HasTraits_monitors
 
     type_handler = type( handler )
-    for i, _cls, _handler in enumerate( _HasTraits_monitors ):
+    for i, ( _cls, _handler ) in enumerate( _HasTraits_monitors ):
+        if _cls is not cls:
+            continue
+
+        if isinstance( _handler, _BatchedMonitor ):
+            _handler = _handler.handler
+
         if type_handler is type( _handler ):
             if (((type_handler is MethodType)  or
                 'cython_function_or_method' in str(type_handler)) and \
@@ -814,18 +830,57 @@ def _trait_monitor_index ( cls, handler ):
 
     return -1
 
+# The state of the trait_monitor_batch() blocks of each thread:
+_monitor_batch = thread_local()
+
+class _BatchedMonitor ( object ):
+    """ An object creation monitor passing the objects created within a
+        trait_monitor_batch() block to its handler as a single list.
+    """
+
+    def __init__ ( self, handler ):
+        self.handler = handler
+
+    def __call__ ( self, object ):
+        monitors = getattr( _monitor_batch, 'monitors', None )
+        if monitors is None:
+            self.handler( [ object ] )
+        else:
+            monitors.setdefault( self, [] ).append( object )
+
+@contextmanager
+def trait_monitor_batch ( ):
+    """ Context manager delaying the notification of the monitors added with
+        *batch* set to True of the objects created in its body until its
+        end, where each monitor is called once with the list of these
+        objects.
+    """
+    depth = getattr( _monitor_batch, 'depth', 0 )
+    if depth == 0:
+        _monitor_batch.monitors = OrderedDict()
+    _monitor_batch.depth = depth + 1
+    try:
+        yield
+    finally:
+        _monitor_batch.depth = depth
+        if depth == 0:
+            monitors, _monitor_batch.monitors = _monitor_batch.monitors, None
+            for monitor, objects in monitors.items():
+                monitor.handler( objects )
+
 #-------------------------------------------------------------------------------
 #  'HasTraits' decorators:
 #-------------------------------------------------------------------------------
 
-def on_trait_change ( name, post_init = False, dispatch = 'same' ):
+def on_trait_change ( name, post_init = False, dispatch = 'same',
+                      interval = None ):
     """ Marks the following method definition as being a handler for the
         extended trait change specified by *name(s)*.
 
         Refer to the documentation for the on_trait_change() method of
         the **HasTraits** class for information on the correct syntax for
-        the *name* argument and the semantics of the *dispatch* keyword
-        argument.
+        the *name* argument and the semantics of the *dispatch* and
+        *interval* keyword arguments.
 
         A handler defined using this decorator is normally effective
         immediately. However, if *post_init* is **True**, then the handler only
@@ -837,7 +892,8 @@ def on_trait_change ( name, post_init = False, dispatch = 'same' ):
 
         function.on_trait_change = {'pattern': name,
                                     'post_init': post_init,
-                                    'dispatch': dispatch}
+                                    'dispatch': dispatch,
+                                    'interval': interval}
 
         return function
 
@@ -945,44 +1001,44 @@ def weak_arg(arg):
     def decorator(function):
         # We need multiple wrappers to traits can find the number of arguments.
         # The all just dereference the weak reference and the call the
-        # function if it is not None.
-        def wrapper0():
-            arg = weak_arg()
-            if arg is not None:
-                return function(arg)
-        def wrapper1(arg1):
-            arg = weak_arg()
-            if arg is not None:
-                return function(arg, arg1)
-        def wrapper2(arg1, arg2):
-            arg = weak_arg()
-            if arg is not None:
-                return function(arg, arg1, arg2)
-        def wrapper3(arg1, arg2, arg3):
-            arg = weak_arg()
-            if arg is not None:
-                return function(arg, arg1, arg2, arg3)
-        def wrapper4(arg1, arg2, arg3, arg4):
-            arg = weak_arg()
-            if arg is not None:
-                return function(arg, arg1, arg2, arg3, arg4)
-        def wrappern(*args):
-            arg = weak_arg()
-            if arg is not None:
-                function(arg, *args)
-        # Return the correct wrapper depending on the arg count
+        # function if it is not None. Only the wrapper matching the arg count
+        # is created.
         args = function.func_code.co_argcount-1
         if args == 0:
+            def wrapper0():
+                arg = weak_arg()
+                if arg is not None:
+                    return function(arg)
             return wrapper0
         elif args == 1:
+            def wrapper1(arg1):
+                arg = weak_arg()
+                if arg is not None:
+                    return function(arg, arg1)
             return wrapper1
         elif args == 2:
+            def wrapper2(arg1, arg2):
+                arg = weak_arg()
+                if arg is not None:
+                    return function(arg, arg1, arg2)
             return wrapper2
         elif args == 3:
+            def wrapper3(arg1, arg2, arg3):
+                arg = weak_arg()
+                if arg is not None:
+                    return function(arg, arg1, arg2, arg3)
             return wrapper3
         elif args == 4:
+            def wrapper4(arg1, arg2, arg3, arg4):
+                arg = weak_arg()
+                if arg is not None:
+                    return function(arg, arg1, arg2, arg3, arg4)
             return wrapper4
         else:
+            def wrappern(*args):
+                arg = weak_arg()
+                if arg is not None:
+                    function(arg, *args)
             return wrappern
 
     return decorator
@@ -1031,9 +1087,17 @@ class HasTraits ( CHasTraits ):
         'extended': ExtendedTraitChangeNotifyWrapper,
         'new':      NewTraitChangeNotifyWrapper,
         'fast_ui':  FastUITraitChangeNotifyWrapper,
-        'ui':       FastUITraitChangeNotifyWrapper
+        'ui':       FastUITraitChangeNotifyWrapper,
+        'dataflow': DataflowTraitChangeNotifyWrapper,
+        'deferred': DeferredTraitChangeNotifyWrapper,
+        'debounce': DebounceTraitChangeNotifyWrapper,
+        'throttle': ThrottleTraitChangeNotifyWrapper
     }
 
+    #: Should the names of the traits whose value changes be recorded for every
+    #: instance of the class (see dirty_traits())?
+    __track_dirty_traits__ = False
+
     #-- Trait Definitions ------------------------------------------------------
 
     #: An event fired when a new trait is dynamically added to the object
@@ -1063,7 +1127,7 @@ class HasTraits ( CHasTraits ):
     #  Adds/Removes a trait instance creation monitor:
     #---------------------------------------------------------------------------
 
-    def trait_monitor ( cls, handler, remove = False ):
+    def trait_monitor ( cls, handler, remove = False, batch = False ):
         """Adds or removes the specified *handler* from the list of active
         monitors.
 
@@ -1074,6 +1138,9 @@ class HasTraits ( CHasTraits ):
         remove : bool
             Flag indicating whether to remove (True) or add the specified
             handler as a monitor for this class.
+        batch : bool
+            Flag indicating whether the handler is called with the list of
+            the objects created (True), or with each object (False).
 
         Description
         -----------
@@ -1081,6 +1148,10 @@ class HasTraits ( CHasTraits ):
         the list of active monitors; if *remove* is True, the handler is
         removed from the active monitor list.
 
+        A handler added with *batch* set to True is called once, at the end
+        of a trait_monitor_batch() block, with the list of the objects created
+        within the block, and with a single object list otherwise.
+
         """
         global _HasTraits_monitors
 
@@ -1088,10 +1159,14 @@ class HasTraits ( CHasTraits ):
         if remove:
             if index >= 0:
                 del _HasTraits_monitors[ index ]
+                _monitors_changed()
             return
 
         if index < 0:
+            if batch:
+                handler = _BatchedMonitor( handler )
             _HasTraits_monitors.append( ( cls, handler ) )
+            _monitors_changed()
 
     trait_monitor = classmethod( trait_monitor )
 
@@ -1573,6 +1648,45 @@ class HasTraits ( CHasTraits ):
         """
         return self.trait_set( trait_change_notify = False, **traits )
 
+    #---------------------------------------------------------------------------
+    #  Tracks which of an object's traits have changed value:
+    #---------------------------------------------------------------------------
+
+    def track_dirty_traits ( self, enabled = True ):
+        """ Enables or disables recording which of the object's traits change
+        value.
+
+        Parameters
+        ----------
+        enabled : bool
+            Flag indicating whether changes should be recorded. Disabling
+            recording also discards any changes recorded so far.
+
+        Description
+        -----------
+        Recording can also be enabled for all instances of a class by setting
+        the class's **__track_dirty_traits__** attribute to True. Changes are
+        recorded by the low-level trait assignment code, and do not require
+        any trait change notification handlers.
+        """
+        self._trait_track_dirty( enabled )
+
+    def dirty_traits ( self ):
+        """ Returns the set of names of the traits whose values have changed
+        since dirty tracking was enabled or clear_dirty() was last called.
+
+        A trait is considered changed when it is assigned a value which is
+        not equal to its previous value, when its value is deleted, or when
+        the items of its list, dictionary or set value are modified.
+        """
+        return self._trait_dirty()
+
+    def clear_dirty ( self ):
+        """ Forgets all changes recorded by dirty tracking, and returns the set
+        of names of the traits which had changed.
+        """
+        return self._trait_dirty( True )
+
     #---------------------------------------------------------------------------
     #  Resets some or all of an object's traits to their default values:
     #---------------------------------------------------------------------------
@@ -1786,6 +1900,36 @@ class HasTraits ( CHasTraits ):
 
         return new
 
+    #---------------------------------------------------------------------------
+    #  Takes an immutable snapshot of the object's trait values:
+    #---------------------------------------------------------------------------
+
+    def snapshot ( self ):
+        """ Returns an immutable snapshot of the object's trait values.
+
+        Returns
+        -------
+        snapshot : TraitSnapshot
+            A snapshot of the values of the traits returned by
+            copyable_trait_names(), in which all referenced HasTraits objects
+            (including those contained in lists, sets and dictionaries) are
+            themselves replaced by snapshots.
+
+        Description
+        -----------
+        Apart from numpy arrays, no trait values are copied: values which are
+        neither HasTraits objects nor containers are captured by reference,
+        so changes made to them in place are not seen by the snapshot. The
+        snapshot of any object in the graph whose trait values have not
+        changed since its previous snapshot is reused, so successive
+        snapshots of a large, mostly unchanged graph share most of their
+        structure and are cheap to take. Use traits.trait_snapshot.diff() to
+        find the traits which changed between two snapshots.
+        """
+        from .trait_snapshot import snapshot
+
+        return snapshot( self )
+
     #---------------------------------------------------------------------------
     #  Creates a deep copy of the object:
     #---------------------------------------------------------------------------
@@ -2260,7 +2404,7 @@ class HasTraits ( CHasTraits ):
 
     def _on_trait_change ( self, handler, name = None, remove = False,
                                  dispatch = 'same', priority = False,
-                                 target = None):
+                                 target = None, interval = None ):
         """Causes the object to invoke a handler whenever a trait attribute
         is modified, or removes the association.
 
@@ -2287,7 +2431,7 @@ class HasTraits ( CHasTraits ):
         if type( name ) is list:
             for name_i in name:
                 self._on_trait_change( handler, name_i, remove, dispatch,
-                                       priority, target )
+                                       priority, target, interval )
 
             return
 
@@ -2297,10 +2441,7 @@ class HasTraits ( CHasTraits ):
             if name == 'anytrait':
                 notifiers = self._notifiers( 0 )
             else:
-                trait = self._trait( name, 1 )
-                if trait is None:
-                    return
-                notifiers = trait._notifiers( 0 )
+                notifiers = self._trait_notifiers( name, 0 )
 
             if notifiers is not None:
                 for i, notifier in enumerate( notifiers ):
@@ -2314,13 +2455,17 @@ class HasTraits ( CHasTraits ):
         if name == 'anytrait':
             notifiers = self._notifiers( 1 )
         else:
-            notifiers = self._trait( name, 2 )._notifiers( 1 )
+            notifiers = self._trait_notifiers( name, 1 )
 
         for notifier in notifiers:
             if notifier.equals( handler ):
                 break
         else:
             wrapper = self.wrappers[ dispatch ]( handler, notifiers, target )
+            if isinstance( wrapper, DeferredTraitChangeNotifyWrapper ):
+                wrapper.priority = int( priority )
+            if interval is not None:
+                wrapper.interval = float( interval )
 
             if priority:
                 notifiers.insert( 0, wrapper )
@@ -2337,7 +2482,8 @@ class HasTraits ( CHasTraits ):
 
     def on_trait_change ( self, handler, name = None, remove = False,
                                 dispatch = 'same', priority = False,
-                                deferred = False, target = None ):
+                                deferred = False, target = None,
+                                interval = None ):
         """Causes the object to invoke a handler whenever a trait attribute
         matching a specified pattern is modified, or removes the association.
 
@@ -2358,17 +2504,36 @@ class HasTraits ( CHasTraits ):
             A string indicating the thread on which notifications must be run.
             Possible values are:
 
-            =========== =======================================================
-            value       dispatch
-            =========== =======================================================
-            ``same``    Run notifications on the same thread as this one.
-            ``ui``      Run notifications on the UI thread. If the current
-                        thread is the UI thread, the notifications are executed
-                        immediately; otherwise, they are placed on the UI
-                        event queue.
-            ``fast_ui`` Alias for ``ui``.
-            ``new``     Run notifications in a new thread.
-            =========== =======================================================
+            ============ ======================================================
+            value        dispatch
+            ============ ======================================================
+            ``same``     Run notifications on the same thread as this one.
+            ``ui``       Run notifications on the UI thread. If the current
+                         thread is the UI thread, the notifications are
+                         executed immediately; otherwise, they are placed on
+                         the UI event queue.
+            ``fast_ui``  Alias for ``ui``.
+            ``new``      Run notifications in a new thread.
+            ``dataflow`` Run notifications on the same thread, once per
+                         transaction, after the handlers they depend on (see
+                         :func:`dataflow_transaction`).
+            ``deferred`` Queue notifications until :func:`flush_deferred` is
+                         called or a :func:`deferred_batch` ends, then run
+                         them once per handler, by decreasing *priority*.
+            ``debounce`` Run notifications on a shared timer thread, with the
+                         latest change only, once no change has occurred for
+                         *interval* seconds.
+            ``throttle`` Run notifications on a shared timer thread, with the
+                         latest change only, at most once every *interval*
+                         seconds.
+            ============ ======================================================
+        priority : bool or int
+            If True, the handler is notified before the handlers already
+            registered. For the ``deferred`` dispatch, the integer value is
+            also the priority of the handler in the queue.
+        interval : float
+            The number of seconds used by the ``debounce`` and ``throttle``
+            dispatch (0.1 if omitted).
 
         Description
         -----------
@@ -2549,7 +2714,8 @@ class HasTraits ( CHasTraits ):
         # handler:
         if ((isinstance( name, basestring ) and
             (extended_trait_pat.match( name ) is None)) or (name is None)):
-            self._on_trait_change( handler, name, remove, dispatch, priority, target )
+            self._on_trait_change( handler, name, remove, dispatch, priority,
+                                   target, interval )
 
             return
 
@@ -2560,7 +2726,7 @@ class HasTraits ( CHasTraits ):
         if isinstance( name, list ):
             for name_i in name:
                 self.on_trait_change( handler, name_i, remove, dispatch,
-                                      priority, target )
+                                      priority, target, interval = interval )
 
             return
 
@@ -2596,6 +2762,7 @@ class HasTraits ( CHasTraits ):
                                     wrapped_handler_ref = weakref.ref(lnw),
                                     type            = lnw.type,
                                     dispatch        = dispatch,
+                                    interval        = interval,
                                     priority        = priority,
                                     deferred        = deferred )
                 listener.register( self )
@@ -2644,99 +2811,52 @@ class HasTraits ( CHasTraits ):
                    object._is_list_trait( alias ))
 
         if remove:
-            info = self._get_sync_trait_info()
-            dic  = info.get( trait_name )
-            if dic is not None:
-                key = ( id( object ), alias )
-                if key in dic:
-                    del dic[ key ]
-
-                    if len( dic ) == 0:
-                        del info[ trait_name ]
-                        self._on_trait_change( self._sync_trait_modified,
-                            trait_name, remove = True )
-
-                        if is_list:
-                            self._on_trait_change(
-                                self._sync_trait_items_modified,
-                                trait_name + '_items', remove = True )
+            for name in self._sync_trait_names( trait_name, is_list ):
+                notifier = self._sync_notifier( name, object, alias )
+                if notifier is not None:
+                    notifier.dispose()
 
             if mutual:
                 object.sync_trait( alias, self, trait_name, False, True )
 
             return
 
-        # Callback to use when the synced object goes out of scope. In order
-        # to avoid reference cycles, this must not be a member function. See
-        # Github issue #69 for more detail.
-        def _sync_trait_listener_deleted (ref, info):
-            for key, dic in info.items():
-                if key != '':
-                    for name, value in dic.items():
-                        if ref is value[0]:
-                            del dic[ name ]
-                    if len( dic ) == 0:
-                        del info[ key ]
-
-        info = self._get_sync_trait_info()
-        dic   = info.setdefault( trait_name, {} )
-        key   = ( id( object ), alias )
-
-        callback = lambda ref: _sync_trait_listener_deleted(ref, info)
-        value = ( weakref.ref( object, callback ), alias )
-
-        if key not in dic:
-            if len( dic ) == 0:
-                self._on_trait_change( self._sync_trait_modified, trait_name )
-                if is_list:
-                    self._on_trait_change( self._sync_trait_items_modified,
-                                           trait_name + '_items' )
-            dic[ key ] = value
+        # The values are copied by native 'cSyncNotifier' handlers, which only
+        # keep a weak reference to the synchronized object and remove
+        # themselves when it is deleted (see Github issue #69):
+        if self._sync_notifier( trait_name, object, alias ) is None:
+            for name in self._sync_trait_names( trait_name, is_list ):
+                notifiers = self._trait_notifiers( name, 1 )
+                notifiers.append( cSyncNotifier( notifiers, object, alias,
+                                                 name != trait_name,
+                                                 trait_name ) )
             setattr( object, alias, getattr( self, trait_name ) )
 
         if mutual:
             object.sync_trait( alias, self, trait_name, False )
 
-    def _get_sync_trait_info ( self ):
-        info = getattr( self, '__sync_trait__', None )
-        if info is None:
-            self.__dict__[ '__sync_trait__' ] = info = {}
-            info[ '' ] = {}
-
-        return info
+    def _sync_trait_names ( self, trait_name, is_list ):
+        """ Returns the names of the traits whose changes are copied when
+            synchronizing the specified trait.
+        """
+        if is_list:
+            return ( trait_name, trait_name + '_items' )
 
-    def _sync_trait_modified ( self, object, name, old, new ):
-        info   = self.__sync_trait__
-        if name not in info:
-            return
-        locked = info[ '' ]
-        locked[ name ] = None
-        for object, object_name in info[ name ].values():
-            object = object()
-            if object_name not in object._get_sync_trait_info()[ '' ]:
-                try:
-                    setattr( object, object_name, new )
-                except:
-                    pass
+        return ( trait_name, )
 
-        del locked[ name ]
-
-    def _sync_trait_items_modified ( self, object, name, old, event ):
-        n0     = event.index
-        n1     = n0 + len( event.removed )
-        name   = name[:-6]
-        info   = self.__sync_trait__
-        locked = info[ '' ]
-        locked[ name ] = None
-        for object, object_name in info[ name ].values():
-            object = object()
-            if object_name not in object._get_sync_trait_info()[ '' ]:
-                try:
-                    getattr( object, object_name )[ n0: n1 ] = event.added
-                except:
-                    pass
+    def _sync_notifier ( self, name, object, alias ):
+        """ Returns the notifier copying the changes of the specified trait to
+            the *alias* trait of *object*, or None if there is none.
+        """
+        notifiers = self._trait_notifiers( name, 0 )
+        if notifiers is not None:
+            for notifier in notifiers:
+                if (isinstance( notifier, cSyncNotifier ) and
+                    (notifier.target is object) and
+                    (notifier.target_name == alias)):
+                    return notifier
 
-        del locked[ name ]
+        return None
 
     def _is_list_trait ( self, trait_name ):
         handler = self.base_trait( trait_name ).handler
@@ -2782,6 +2902,10 @@ class HasTraits ( CHasTraits ):
 
         # See if there already is a class or instance trait with the same name:
         old_trait = self._trait( name, 0 )
+        if old_trait is not None:
+            old_notifiers = self._trait_notifiers( name, -1 )
+            if old_notifiers is None:
+                old_notifiers = old_trait._notifiers( 0 )
 
         # Get the object's instance trait dictionary and add a clone of the new
         # trait to it:
@@ -2791,7 +2915,6 @@ class HasTraits ( CHasTraits ):
         # If there already was a trait with the same name:
         if old_trait is not None:
             # Copy the old traits notifiers into the new trait:
-            old_notifiers = old_trait._notifiers( 0 )
             if old_notifiers is not None:
                 trait._notifiers( 1 ).extend( old_notifiers )
         else:
@@ -2852,6 +2975,9 @@ class HasTraits ( CHasTraits ):
             if name in self.__dict__:
                 del self.__dict__[ name ]
 
+            # Discard the instance notifiers of the class trait (if any):
+            notifiers = self._trait_notifiers( name, -1 )
+
             # Get the object's instance trait dictionary and remove the trait
             # from it:
             itrait_dict = self._instance_traits()
@@ -2859,6 +2985,8 @@ class HasTraits ( CHasTraits ):
                 del itrait_dict[ name ]
                 return True
 
+            return (notifiers is not None)
+
         return False
 
     #---------------------------------------------------------------------------
@@ -3306,7 +3434,8 @@ class HasTraits ( CHasTraits ):
                     self.on_trait_change( getattr( self, name ),
                                           config['pattern'],
                                           deferred = True,
-                                          dispatch=config['dispatch'] )
+                                          dispatch=config['dispatch'],
+                                          interval=config['interval'] )
 
     def _init_trait_listeners ( self ):
         """ Initializes the object's statically parsed, but dynamically
@@ -3324,7 +3453,8 @@ class HasTraits ( CHasTraits ):
             self.on_trait_change( getattr( self, name ),
                                   config['pattern'],
                                   deferred = True,
-                                  dispatch=config['dispatch'] )
+                                  dispatch=config['dispatch'],
+                                  interval=config['interval'] )
 
     def _init_trait_event_listener ( self, name, kind, pattern ):
         """ Sets up the listener for an event with on_trait_change metadata.
@@ -3374,6 +3504,26 @@ class HasTraits ( CHasTraits ):
         self.on_trait_change( notify, name_pattern, target=self )
         self.__dict__.setdefault( ListenerTraits, {} )[ name ] = notify
 
+        # The listener for the delegate object itself is only set up once (it
+        # is not removed when a local value is assigned):
+        if kind and self.trait( name )._cached:
+            self._init_trait_delegate_cache_listener( name )
+
+    def _init_trait_delegate_cache_listener ( self, name ):
+        """ Sets up the listener which discards the cached value of a 'cached'
+            delegate trait when its delegate object is replaced.
+        """
+        @weak_arg(self)
+        def notify ( self ):
+            old = self._trait_uncache_delegate( name )
+            if old is not Undefined:
+                # Let the objects delegating to this one discard their cached
+                # value too:
+                self.trait_property_changed( name, old )
+
+        self.on_trait_change( notify, self.trait( name )._delegate,
+                              target=self )
+
     def _remove_trait_delegate_listener ( self, name, remove ):
         """ Removes a delegate listener when the local delegate value is set.
         """
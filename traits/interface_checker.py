@@ -24,11 +24,22 @@
 
 from __future__ import absolute_import
 
+import json
+import os
+import pkgutil
+import sys
+
+from hashlib import sha1
+
 from types import FunctionType
 
 from inspect import getargspec, getmro
 
-from .has_traits import HasTraits
+from weakref import WeakKeyDictionary
+
+from .has_traits import HasTraits, Interface, isinterface
+
+from .trait_types import Any, Dict, Instance, Str
 
 #-------------------------------------------------------------------------------
 #  Logging:
@@ -65,8 +76,33 @@ class InterfaceError ( Exception ):
 
 class InterfaceChecker ( HasTraits ):
     """ Checks that interfaces are actually implemented.
+
+        The result of checking a class against an interface is kept for the
+        lifetime of the class. If 'cache_file' is set, the results for the
+        classes and interfaces defined at module level are also saved to that
+        file by save_cache(), keyed by a hash of the source files of the
+        modules defining them and their base classes, so that other processes
+        can reuse them for as long as these files do not change.
     """
 
+    #: The file (if any) the results are loaded from and saved to:
+    cache_file = Str
+
+    #-- Private Traits ---------------------------------------------------------
+
+    # The error message (or None) for each class and interface checked:
+    _results = Instance( WeakKeyDictionary, () )
+
+    # The results loaded from (or to be saved to) 'cache_file', keyed by
+    # source hash:
+    _file_results = Any
+
+    # The results not saved to 'cache_file' yet:
+    _new_results = Dict
+
+    # The hash of each source file:
+    _file_hashes = Dict
+
     #---------------------------------------------------------------------------
     #  'InterfaceChecker' interface:
     #---------------------------------------------------------------------------
@@ -82,40 +118,78 @@ class InterfaceChecker ( HasTraits ):
         except TypeError:
             interfaces = [ interfaces ]
 
-        # If the class has traits then check that it implements all traits and
-        # methods on the specified interfaces:
-        if issubclass( cls, HasTraits ):
-            for interface in interfaces:
-                if not self._check_has_traits_class( cls, interface,
-                                                     error_mode ):
-                    return False
+        for interface in interfaces:
+            msg = self.check_interface( cls, interface )
+            if msg is not None:
+                return self._handle_error( msg, error_mode )
+
+        return True
 
-        # Otherwise, just check that the class implements all methods on the
-        # specified interface:
+    def check_interface ( self, cls, interface ):
+        """ Returns the message describing why the class does not implement
+            the interface, or None if it does.
+        """
+        results = self._results.get( cls )
+        if results is None:
+            self._results[ cls ] = results = {}
+        elif interface in results:
+            return results[ interface ]
+
+        key = self._file_key( cls, interface )
+        if (key is not None) and (key in self._get_file_results()):
+            msg = self._file_results[ key ]
         else:
-            for interface in interfaces:
-                if not self._check_non_has_traits_class( cls, interface,
-                                                         error_mode ):
-                    return False
+            # If the class has traits then check that it implements all traits
+            # and methods on the specified interface. Otherwise, just check
+            # that the class implements all methods on the interface:
+            if issubclass( cls, HasTraits ):
+                msg = self._check_has_traits_class( cls, interface )
+            else:
+                msg = self._check_non_has_traits_class( cls, interface )
 
-        return True
+            if key is not None:
+                self._file_results[ key ] = self._new_results[ key ] = msg
+
+        results[ interface ] = msg
+
+        return msg
+
+    def save_cache ( self ):
+        """ Saves the results to 'cache_file'.
+        """
+        if self.cache_file and (len( self._new_results ) > 0):
+            with open( self.cache_file, 'w' ) as fh:
+                json.dump( self._get_file_results(), fh, indent = 0,
+                           sort_keys = True )
+            self._new_results = {}
+
+    def clear_cache ( self ):
+        """ Discards the results kept in memory (e.g. after classes have been
+            modified).
+        """
+        self._results.clear()
+        self._file_results = None
+        self._file_hashes  = {}
 
     #---------------------------------------------------------------------------
     #  Private interface:
     #---------------------------------------------------------------------------
 
-    def _check_has_traits_class ( self, cls, interface, error_mode ):
+    def _check_has_traits_class ( self, cls, interface ):
         """ Checks that a 'HasTraits' class implements an interface.
         """
-        return (self._check_traits(  cls, interface, error_mode ) and
-                self._check_methods( cls, interface, error_mode ))
+        msg = self._check_traits( cls, interface )
+        if msg is None:
+            msg = self._check_methods( cls, interface )
 
-    def _check_non_has_traits_class ( self, cls, interface, error_mode ):
+        return msg
+
+    def _check_non_has_traits_class ( self, cls, interface ):
         """ Checks that a non-'HasTraits' class implements an interface.
         """
-        return self._check_methods( cls, interface, error_mode )
+        return self._check_methods( cls, interface )
 
-    def _check_methods ( self, cls, interface, error_mode ):
+    def _check_methods ( self, cls, interface ):
         """ Checks that a class implements the methods on an interface.
         """
         cls_methods       = self._get_public_methods( cls )
@@ -123,34 +197,31 @@ class InterfaceChecker ( HasTraits ):
 
         for name in interface_methods:
             if name not in cls_methods:
-                return self._handle_error( MISSING_METHOD %
-                           ( self._class_name( cls ), name,
-                             self._class_name( interface ) ), error_mode )
-
+                return MISSING_METHOD % ( self._class_name( cls ), name,
+                                          self._class_name( interface ) )
 
             # Check that the method signatures are the same:
             cls_argspec       = getargspec( cls_methods[ name ] )
             interface_argspec = getargspec( interface_methods[ name ] )
 
             if cls_argspec != interface_argspec:
-                return self._handle_error( BAD_SIGNATURE %
-                           ( self._class_name( cls ), name,
-                             self._class_name( interface ) ), error_mode )
+                return BAD_SIGNATURE % ( self._class_name( cls ), name,
+                                         self._class_name( interface ) )
 
-        return True
+        return None
 
-    def _check_traits ( self, cls, interface, error_mode ):
+    def _check_traits ( self, cls, interface ):
         """ Checks that a class implements the traits on an interface.
         """
         missing = set( interface.class_traits() ).difference(
                   set( cls.class_traits() ) )
 
         if len( missing ) > 0:
-            return self._handle_error( MISSING_TRAIT %
-                       ( self._class_name( cls ), `list( missing )`[1:-1],
-                         self._class_name( interface ) ), error_mode )
+            return MISSING_TRAIT % ( self._class_name( cls ),
+                                     `list( missing )`[1:-1],
+                                     self._class_name( interface ) )
 
-        return True
+        return None
 
     def _get_public_methods ( self, cls ):
         """ Returns all public methods on a class.
@@ -183,6 +254,68 @@ class InterfaceChecker ( HasTraits ):
 
         return False
 
+    def _get_file_results ( self ):
+        """ Returns the results loaded from 'cache_file'.
+        """
+        if self._file_results is None:
+            self._file_results = {}
+            if self.cache_file and os.path.isfile( self.cache_file ):
+                try:
+                    with open( self.cache_file ) as fh:
+                        self._file_results = json.load( fh )
+                except ( IOError, ValueError ):
+                    logger.warning( 'Ignoring the invalid interface check '
+                                    'cache: %s', self.cache_file )
+
+        return self._file_results
+
+    def _file_key ( self, cls, interface ):
+        """ Returns the key of the result for a class and an interface in
+            'cache_file', or None if it cannot be saved to the file.
+        """
+        if not self.cache_file:
+            return None
+
+        names = []
+        for klass in ( cls, interface ):
+            # Classes not defined at module level cannot be told apart from
+            # other classes with the same name:
+            module = sys.modules.get( klass.__module__ )
+            if getattr( module, klass.__name__, None ) is not klass:
+                return None
+            names.append( '%s.%s' % ( klass.__module__, klass.__name__ ) )
+
+        hash = sha1()
+        for module_name in sorted( set(
+                c.__module__ for c in getmro( cls ) + getmro( interface ) ) ):
+            file_hash = self._file_hash( sys.modules.get( module_name ) )
+            if file_hash is None:
+                return None
+            hash.update( file_hash.encode( 'ascii' ) )
+
+        return '%s:%s:%s' % ( names[0], names[1], hash.hexdigest() )
+
+    def _file_hash ( self, module ):
+        """ Returns the hash of the source file of a module, or None if it
+            has none.
+        """
+        file_name = getattr( module, '__file__', None )
+        if file_name is None:
+            return ('' if module is not None else None)
+
+        if file_name[-4:] in ( '.pyc', '.pyo' ):
+            file_name = file_name[:-1]
+
+        file_hash = self._file_hashes.get( file_name )
+        if file_hash is None:
+            try:
+                with open( file_name, 'rb' ) as fh:
+                    file_hash = sha1( fh.read() ).hexdigest()
+            except IOError:
+                return None
+            self._file_hashes[ file_name ] = file_hash
+
+        return file_hash
 
 # A default interface checker:
 checker = InterfaceChecker()
@@ -194,3 +327,91 @@ def check_implements ( cls, interfaces, error_mode = 0 ):
     """
     return checker.check_implements( cls, interfaces, error_mode )
 
+
+#-------------------------------------------------------------------------------
+#  Checks all the classes of a package:
+#-------------------------------------------------------------------------------
+
+def check_package ( package, workers = None, cache_file = '' ):
+    """ Checks that all the classes defined in a package (and its
+        subpackages) implement the interfaces they provide, using *workers*
+        processes (by default, one per CPU).
+
+        Returns the list of the error messages. If *cache_file* is specified,
+        the results are also saved to that file, so that the interface checks
+        made when importing the package can reuse them (see InterfaceChecker).
+    """
+    module = __import__( package, fromlist = [ '__name__' ] )
+    modules = [ module.__name__ ]
+    if hasattr( module, '__path__' ):
+        modules.extend( name for loader, name, is_package in
+                        pkgutil.walk_packages( module.__path__,
+                                               module.__name__ + '.' ) )
+
+    args = [ ( name, cache_file ) for name in modules ]
+    if (workers == 1) or (len( modules ) == 1):
+        results = [ _check_module( arg ) for arg in args ]
+    else:
+        from multiprocessing import Pool
+
+        pool = Pool( workers )
+        try:
+            results = pool.map( _check_module, args )
+        finally:
+            pool.close()
+            pool.join()
+
+    messages = []
+    if cache_file:
+        saved = InterfaceChecker( cache_file = cache_file )
+        for module_messages, new_results in results:
+            saved._get_file_results().update( new_results )
+            saved._new_results.update( new_results )
+        saved.save_cache()
+
+    for module_messages, new_results in results:
+        messages.extend( module_messages )
+
+    return messages
+
+def _check_module ( args ):
+    """ Checks the classes defined in a module against the interfaces they
+        provide, and returns the error messages and the new results for the
+        cache file.
+    """
+    module_name, cache_file = args
+    checker  = InterfaceChecker( cache_file = cache_file )
+    messages = []
+    try:
+        module = __import__( module_name, fromlist = [ '__name__' ] )
+    except Exception as excp:
+        return ( [ 'Cannot import %s: %s' % ( module_name, excp ) ], {} )
+
+    interfaces = _all_interfaces()
+    for name, cls in sorted( vars( module ).items() ):
+        if ((not isinstance( cls, type )) or (cls.__module__ != module_name) or
+            isinterface( cls )):
+            continue
+
+        # Registered classes (e.g. using @provides), their subclasses and the
+        # classes inheriting from an interface are all subclasses of it:
+        for interface in interfaces:
+            if issubclass( cls, interface ):
+                msg = checker.check_interface( cls, interface )
+                if msg is not None:
+                    messages.append( msg )
+
+    return ( messages, checker._new_results )
+
+def _all_interfaces ( ):
+    """ Returns all the interfaces defined so far.
+    """
+    interfaces = []
+    pending    = [ Interface ]
+    while len( pending ) > 0:
+        for interface in pending.pop().__subclasses__():
+            if isinterface( interface ) and (interface not in interfaces):
+                interfaces.append( interface )
+                pending.append( interface )
+
+    return interfaces
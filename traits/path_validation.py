@@ -0,0 +1,231 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the cache of file system queries used by the File and Directory
+    traits with 'exists=True', and the set_path_traits() function, used to
+    assign many of those traits at once while checking the existence of the
+    paths in parallel.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import os
+from contextlib import contextmanager
+from stat import S_ISDIR, S_ISREG
+from threading import local, Lock
+from time import time
+
+from .trait_errors import TraitError
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The suggested number of seconds a file system query result is reused for,
+# when enabling the cache:
+DEFAULT_TTL = 1.0
+
+# The default maximum number of paths whose query result is kept:
+DEFAULT_MAX_SIZE = 65536
+
+# The default number of threads used by set_path_traits():
+DEFAULT_WORKERS = 8
+
+#-------------------------------------------------------------------------------
+#  'StatCache' class:
+#-------------------------------------------------------------------------------
+
+class StatCache ( object ):
+    """ A thread-safe cache of the kind of file system object found at a
+        path.
+
+        The kind of an existing object is reused for *ttl* seconds after the
+        path was queried, so an object removed or replaced in the meantime is
+        only seen once the result expires, or after calling invalidate().
+        Missing paths are never cached, so a path which is created is seen
+        at once. A *ttl* of 0 disables caching.
+    """
+
+    def __init__ ( self, ttl = DEFAULT_TTL, max_size = DEFAULT_MAX_SIZE ):
+        self.ttl      = ttl
+        self.max_size = max_size
+        self._modes   = {}
+        self._lock    = Lock()
+        self._local   = local()
+
+    def isfile ( self, path ):
+        """ Returns whether *path* is an existing regular file.
+        """
+        mode = self.mode( path )
+        return (mode is not None) and S_ISREG( mode )
+
+    def isdir ( self, path ):
+        """ Returns whether *path* is an existing directory.
+        """
+        mode = self.mode( path )
+        return (mode is not None) and S_ISDIR( mode )
+
+    def mode ( self, path ):
+        """ Returns the 'st_mode' of the file system object at *path*, or
+            None if there is none.
+        """
+        preloaded = getattr( self._local, 'modes', None )
+        if preloaded is not None:
+            mode = preloaded.get( path )
+            if mode is not None:
+                return mode
+
+        ttl = self.ttl
+        if ttl > 0:
+            entry = self._modes.get( path )
+            if (entry is not None) and ((time() - entry[0]) < ttl):
+                return entry[1]
+
+        try:
+            mode = os.stat( path ).st_mode
+        except ( OSError, TypeError, ValueError ):
+            return None
+
+        if ttl > 0:
+            with self._lock:
+                if len( self._modes ) >= self.max_size:
+                    self._prune()
+                self._modes[ path ] = ( time(), mode )
+
+        return mode
+
+    @contextmanager
+    def preloaded ( self, modes ):
+        """ Reuses the given results of file system queries (a dictionary
+            mapping paths to their 'st_mode') in the current thread while
+            the context is active, whatever the *ttl* of the cache.
+        """
+        previous          = getattr( self._local, 'modes', None )
+        self._local.modes = modes
+        try:
+            yield
+        finally:
+            self._local.modes = previous
+
+    def invalidate ( self, path = None ):
+        """ Discards the cached result for *path*, or for all paths if *path*
+            is None.
+        """
+        with self._lock:
+            if path is None:
+                self._modes.clear()
+            else:
+                self._modes.pop( path, None )
+
+    def _prune ( self ):
+        """ Discards the expired results, or all results if none has expired.
+        """
+        limit = time() - self.ttl
+        modes = self._modes
+        for path, entry in modes.items():
+            if entry[0] <= limit:
+                del modes[ path ]
+
+        if len( modes ) >= self.max_size:
+            modes.clear()
+
+# The cache used by the File and Directory traits. It is disabled by default;
+# set its 'ttl' (e.g. to DEFAULT_TTL) to enable it:
+stat_cache = StatCache( ttl = 0 )
+
+#-------------------------------------------------------------------------------
+#  'PathValidationError' class:
+#-------------------------------------------------------------------------------
+
+class PathValidationError ( TraitError ):
+    """ The exception raised by set_path_traits() when some of the values
+        could not be assigned.
+
+        Its 'errors' attribute is the list of ( object, name, value, error )
+        tuples describing each failed assignment, in the order they were
+        given.
+    """
+
+    def __init__ ( self, errors ):
+        self.errors = errors
+        messages    = [ str( error ) for object, name, value, error in errors ]
+        super( PathValidationError, self ).__init__(
+            '%d trait assignments failed:\n%s' % ( len( errors ),
+                                                   '\n'.join( messages ) ) )
+
+#-------------------------------------------------------------------------------
+#  Assigns many File/Directory trait values at once:
+#-------------------------------------------------------------------------------
+
+def set_path_traits ( assignments, workers = DEFAULT_WORKERS ):
+    """ Assigns many (File or Directory) trait values at once.
+
+        The file system is first queried for all the assigned paths using a
+        pool of *workers* threads, and the results are reused by the File and
+        Directory traits with 'exists=True' during the assignments, so that
+        they do not have to wait for the file system (except for the missing
+        paths, which are checked again).
+
+        All the valid values are assigned. If any assignment fails, a
+        PathValidationError describing all the failures is raised once the
+        other values have been assigned.
+
+        Parameters
+        ----------
+        assignments : iterable of ( object, name, value ) tuples
+            The values to assign, and the traits to assign them to.
+        workers : int
+            The number of threads used to query the file system.
+    """
+    assignments = list( assignments )
+    paths = set( value for object, name, value in assignments
+                 if isinstance( value, basestring ) )
+    modes = _query_paths( paths, workers )
+
+    errors = []
+    with stat_cache.preloaded( modes ):
+        for object, name, value in assignments:
+            try:
+                setattr( object, name, value )
+            except TraitError as excp:
+                errors.append( ( object, name, value, excp ) )
+
+    if len( errors ) > 0:
+        raise PathValidationError( errors )
+
+def _query_paths ( paths, workers ):
+    """ Queries the file system for each of the *paths* using a pool of
+        *workers* threads. Returns a dictionary mapping the existing paths to
+        their 'st_mode'.
+    """
+    paths = list( paths )
+    if (workers <= 1) or (len( paths ) <= workers):
+        modes = [ stat_cache.mode( path ) for path in paths ]
+    else:
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool( workers )
+        try:
+            modes = pool.map( stat_cache.mode, paths,
+                        chunksize = max( 1, len( paths ) // (4 * workers) ) )
+        finally:
+            pool.close()
+            pool.join()
+
+    return dict( ( path, mode ) for path, mode in zip( paths, modes )
+                 if mode is not None )
@@ -0,0 +1,258 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the Replicator class, used to replicate the trait changes of
+    objects to mirror objects in another process.
+
+    The replicators at both ends of a connection (for example, the two ends
+    of a multiprocessing.Pipe, or a multiprocessing.connection Client and
+    Listener over a Unix socket) exchange batches of change events. Each
+    event identifies the object by a name chosen by the application, and
+    the changes made to the items of lists, dictionaries and sets are sent
+    as deltas instead of full values::
+
+        # In the process owning the model:
+        replicator = Replicator( connection )
+        replicator.publish( model, 'model' )
+        with replicator.batch():
+            model.count += 1
+            model.items.append( 3 )
+
+        # In the worker process:
+        replicator = Replicator( connection )
+        replicator.mirror( model_copy, 'model' )
+        while replicator.receive():
+            pass
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+from contextlib import contextmanager
+from weakref import WeakKeyDictionary
+
+from .trait_handlers import TraitDictEvent, TraitListEvent, TraitSetEvent
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The kinds of change events:
+VALUE_EVENT = 0
+LIST_EVENT  = 1
+DICT_EVENT  = 2
+SET_EVENT   = 3
+
+#-------------------------------------------------------------------------------
+#  'Replicator' class:
+#-------------------------------------------------------------------------------
+
+class Replicator ( object ):
+    """ Replicates the trait changes of published objects to the mirror
+        objects of the replicator at the other end of a connection.
+
+        The *connection* only needs 'send', 'recv' and 'poll' methods, like
+        the connections of the multiprocessing package. The trait values are
+        pickled, so mirrors receive copies of them.
+
+        Outside of a batch() block, each change is sent as soon as it is
+        made. Within it, the changes are sent together when the outermost
+        block ends, or when *batch_size* changes are pending.
+    """
+
+    def __init__ ( self, connection, batch_size = 1000 ):
+        self.connection = connection
+        self.batch_size = batch_size
+
+        # Mapping from published objects to their ( id, trait names ):
+        self._published = WeakKeyDictionary()
+
+        # Mapping from ids to the mirror objects:
+        self._mirrors = {}
+
+        # The events not sent yet:
+        self._events = []
+
+        # The nesting level of batch() blocks:
+        self._depth = 0
+
+        # Are received events being applied?
+        self._applying = False
+
+    #-- Sending changes --------------------------------------------------------
+
+    def publish ( self, object, object_id, names = None ):
+        """ Starts sending the changes of the *names* traits (by default, all
+            the copyable traits) of *object*, identified by *object_id*.
+
+            The current values of the traits are sent first.
+        """
+        if names is None:
+            names = object.copyable_trait_names( type = 'trait' )
+
+        names = frozenset( names )
+        self._published[ object ] = ( object_id, names )
+        object.on_trait_change( self._trait_changed )
+
+        with self.batch():
+            for name in names:
+                self._events.append( ( VALUE_EVENT, object_id, name,
+                                       getattr( object, name ) ) )
+
+    def unpublish ( self, object ):
+        """ Stops sending the changes of *object*.
+        """
+        if self._published.pop( object, None ) is not None:
+            object.on_trait_change( self._trait_changed, remove = True )
+
+    @contextmanager
+    def batch ( self ):
+        """ Context manager sending all the changes made in its body at its
+            end.
+        """
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def flush ( self ):
+        """ Sends the pending changes.
+        """
+        events = self._events
+        if len( events ) > 0:
+            self._events = []
+            self.connection.send( events )
+
+    def close ( self ):
+        """ Sends the pending changes, stops sending any new ones, and closes
+            the connection.
+        """
+        self.flush()
+        for object in self._published.keys():
+            self.unpublish( object )
+        self.connection.close()
+
+    #-- Receiving changes ------------------------------------------------------
+
+    def mirror ( self, object, object_id ):
+        """ Applies the changes received for *object_id* to *object*.
+        """
+        self._mirrors[ object_id ] = object
+
+    def unmirror ( self, object_id ):
+        """ Stops applying the changes received for *object_id*.
+        """
+        self._mirrors.pop( object_id, None )
+
+    def receive ( self, timeout = None ):
+        """ Waits up to *timeout* seconds (or forever if None) for a batch of
+            changes, and applies it.
+
+            Returns whether a batch was received. Raises EOFError when the
+            other end of the connection has been closed.
+        """
+        if (timeout is not None) and (not self.connection.poll( timeout )):
+            return False
+
+        self.apply( self.connection.recv() )
+
+        return True
+
+    def apply ( self, events ):
+        """ Applies a batch of change *events* to the mirror objects.
+
+            The events received for unknown ids are ignored.
+        """
+        mirrors = self._mirrors
+        self._applying = True
+        try:
+            for event in events:
+                object = mirrors.get( event[1] )
+                if object is None:
+                    continue
+
+                kind, name = event[0], event[2]
+                if kind == VALUE_EVENT:
+                    setattr( object, name, event[3] )
+                elif kind == LIST_EVENT:
+                    index, count, added = event[3:]
+                    getattr( object, name )[ index: index + count ] = added
+                elif kind == DICT_EVENT:
+                    updated, removed = event[3:]
+                    dict = getattr( object, name )
+                    for key in removed:
+                        dict.pop( key, None )
+                    dict.update( updated )
+                else:
+                    added, removed = event[3:]
+                    set = getattr( object, name )
+                    set.difference_update( removed )
+                    set.update( added )
+        finally:
+            self._applying = False
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _trait_changed ( self, object, name, old, new ):
+        """ Handles a trait of a published object being changed.
+        """
+        if self._applying:
+            return
+
+        info = self._published.get( object )
+        if info is None:
+            return
+
+        object_id, names = info
+        if name in names:
+            event = ( VALUE_EVENT, object_id, name, new )
+        elif (name[-6:] == '_items') and (name[:-6] in names):
+            event = self._items_event( object, object_id, name[:-6], new )
+        else:
+            return
+
+        self._events.append( event )
+        if (self._depth == 0) or (len( self._events ) >= self.batch_size):
+            self.flush()
+
+    def _items_event ( self, object, object_id, name, event ):
+        """ Returns the delta corresponding to an '_items' event of the *name*
+            trait.
+        """
+        if isinstance( event, TraitListEvent ):
+            # Extended slice changes are sent as the full list:
+            if isinstance( event.index, int ):
+                return ( LIST_EVENT, object_id, name, event.index,
+                         len( event.removed ), list( event.added ) )
+
+        elif isinstance( event, TraitDictEvent ):
+            value   = getattr( object, name )
+            updated = dict( event.added )
+            for key in event.changed:
+                updated[ key ] = value[ key ]
+
+            return ( DICT_EVENT, object_id, name, updated,
+                     list( event.removed ) )
+
+        elif isinstance( event, TraitSetEvent ):
+            return ( SET_EVENT, object_id, name, set( event.added ),
+                     set( event.removed ) )
+
+        return ( VALUE_EVENT, object_id, name, getattr( object, name ) )
@@ -8,9 +8,12 @@
 
 from __future__ import absolute_import
 
+import copy
+
 from traits.testing.unittest_tools import unittest
 
-from ..api import HasTraits, Instance, Str
+from ..api import (BaseInt, Dict, HasTraits, Instance, List, Set, Str,
+    TraitError)
 
 
 class Shared(HasTraits):
@@ -279,4 +282,76 @@ class TestCopyTraitsCopyDeepSharedRef(CopyTraitsBase,
         TestCopyTraitsSharedCopyRef.setUp(self)
         self.baz2.copy_traits(self.baz, copy='deep')
         return
+
+
+class CountingInt(BaseInt):
+    """ An Int trait which counts the number of values it validates. """
+
+    validations = 0
+
+    def validate(self, object, name, value):
+        CountingInt.validations += 1
+        return super(CountingInt, self).validate(object, name, value)
+
+
+class Containers(HasTraits):
+    deep_list = List(CountingInt, copy='deep')
+    shallow_list = List(CountingInt, copy='shallow')
+    deep_dict = Dict(Str, CountingInt, copy='deep')
+    deep_set = Set(CountingInt, copy='deep')
+
+
+class TestCopyContainerTraits(unittest.TestCase):
+    """ Validate that copying container traits does not validate their
+    items again.
+    """
+
+    def setUp(self):
+        self.containers = Containers(
+            deep_list=range(10),
+            shallow_list=range(10),
+            deep_dict=dict(a=1, b=2),
+            deep_set=set(range(5)),
+        )
+        CountingInt.validations = 0
+
+    def test_clone_does_not_revalidate_items(self):
+        clone = self.containers.clone_traits()
+
+        self.assertEqual(CountingInt.validations, 0)
+        self.assertEqual(clone.deep_list, range(10))
+        self.assertEqual(clone.shallow_list, range(10))
+        self.assertEqual(clone.deep_dict, dict(a=1, b=2))
+        self.assertEqual(clone.deep_set, set(range(5)))
+
+    def test_copies_are_independent(self):
+        clone = self.containers.clone_traits()
+        events = []
+        clone.on_trait_change(lambda: events.append(True), 'deep_list_items')
+
+        clone.deep_list.append(10)
+        clone.shallow_list.append(10)
+        clone.deep_dict['c'] = 3
+        clone.deep_set.add(5)
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(CountingInt.validations, 4)
+        self.assertEqual(self.containers.deep_list, range(10))
+        self.assertEqual(self.containers.shallow_list, range(10))
+        self.assertEqual(self.containers.deep_dict, dict(a=1, b=2))
+        self.assertEqual(self.containers.deep_set, set(range(5)))
+
+    def test_detached_copy_is_validated_when_changed(self):
+        detached = copy.copy(self.containers.deep_list)
+        self.assertIsNone(detached.object())
+        with self.assertRaises(TraitError):
+            detached.append('not an int')
+
+    def test_assigning_owned_container_revalidates_items(self):
+        other = Containers()
+        other.deep_list = self.containers.deep_list
+
+        self.assertEqual(CountingInt.validations, 10)
+        self.assertIsNot(other.deep_list, self.containers.deep_list)
+
 ### EOF
@@ -0,0 +1,121 @@
+""" Tests for dynamic notifiers with `dispatch='dataflow'`.
+
+Dynamic notifiers created with the `dispatch='dataflow'` option are run once
+per transaction, after the handlers they depend on.
+
+"""
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from .. import trait_notifiers
+from ..api import (HasTraits, Int, dataflow_transaction,
+    push_exception_handler, pop_exception_handler)
+
+
+class Pipeline(HasTraits):
+    x = Int
+
+    b = Int
+
+    c = Int
+
+    d = Int
+
+    def __init__(self, **traits):
+        super(Pipeline, self).__init__(**traits)
+        self.seen = []
+
+    def update_b(self, x):
+        self.b = x + 1
+
+    def update_c(self, x):
+        self.c = 2 * x
+
+    def update_d(self):
+        self.seen.append((self.x, self.b, self.c))
+        self.d = self.b + self.c
+
+
+class TestDataflowNotifiers(unittest.TestCase):
+
+    def setUp(self):
+        push_exception_handler(lambda *args: None, reraise_exceptions=True)
+
+    def tearDown(self):
+        pop_exception_handler()
+
+    def test_diamond_runs_once(self):
+        p = Pipeline()
+        p.on_trait_change(p.update_b, 'x', dispatch='dataflow')
+        p.on_trait_change(p.update_c, 'x', dispatch='dataflow')
+        p.on_trait_change(p.update_d, 'b, c', dispatch='dataflow')
+
+        p.x = 1
+
+        self.assertEqual(p.seen, [(1, 2, 2)])
+        self.assertEqual(p.d, 4)
+
+    def test_learned_dependencies(self):
+        p = Pipeline()
+        p.on_trait_change(p.update_d, 'x, c', dispatch='dataflow')
+        p.on_trait_change(p.update_c, 'x', dispatch='dataflow')
+
+        # Nothing is known yet about update_c triggering update_d:
+        p.x = 1
+        self.assertEqual(p.seen, [(1, 0, 0), (1, 0, 2)])
+
+        del p.seen[:]
+        p.x = 2
+        self.assertEqual(p.seen, [(2, 0, 4)])
+
+    def test_transaction(self):
+        p = Pipeline()
+        p.on_trait_change(p.update_c, 'x', dispatch='dataflow')
+        p.on_trait_change(p.update_d, 'x, c', dispatch='dataflow')
+
+        with dataflow_transaction():
+            p.x = 1
+            p.x = 2
+            self.assertEqual(p.seen, [])
+            self.assertEqual(p.c, 0)
+
+        self.assertEqual(p.seen, [(2, 0, 4)])
+        self.assertEqual(p.d, 4)
+
+    def test_order_computed_once_per_flush(self):
+        scheduler = trait_notifiers.dataflow_scheduler
+        sort = scheduler._sort
+        calls = []
+
+        def counting_sort(pending):
+            calls.append(len(pending))
+            return sort(pending)
+
+        pipelines = [Pipeline() for i in range(10)]
+        for p in pipelines:
+            p.on_trait_change(p.update_d, 'x', dispatch='dataflow')
+        scheduler._sort = counting_sort
+        try:
+            with dataflow_transaction():
+                for p in pipelines:
+                    p.x = 1
+        finally:
+            del scheduler._sort
+
+        # The handlers do not queue other handlers:
+        self.assertEqual(calls, [10])
+        self.assertEqual([p.seen for p in pipelines], [[(1, 0, 0)]] * 10)
+
+    def test_remove(self):
+        p = Pipeline()
+        p.on_trait_change(p.update_c, 'x', dispatch='dataflow')
+        p.on_trait_change(p.update_c, 'x', dispatch='dataflow', remove=True)
+
+        p.x = 1
+
+        self.assertEqual(p.c, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+""" Tests for dynamic notifiers with `dispatch='deferred'`.
+
+Dynamic notifiers created with the `dispatch='deferred'` option queue the
+events until `flush_deferred` is called or a `deferred_batch` ends.
+
+"""
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (HasTraits, Int, deferred_batch, flush_deferred,
+    push_exception_handler, pop_exception_handler)
+
+
+class Document(HasTraits):
+    text = Int
+
+    index = Int
+
+    def __init__(self, **traits):
+        super(Document, self).__init__(**traits)
+        self.calls = []
+
+    def render(self, new):
+        self.calls.append(('render', new))
+
+    def reindex(self, new):
+        self.calls.append(('reindex', new))
+        self.index = new
+
+    def save(self):
+        self.calls.append(('save', self.index))
+
+
+class TestDeferredNotifiers(unittest.TestCase):
+
+    def setUp(self):
+        push_exception_handler(lambda *args: None, reraise_exceptions=True)
+
+    def tearDown(self):
+        pop_exception_handler()
+        flush_deferred()
+
+    def test_flush(self):
+        doc = Document()
+        doc.on_trait_change(doc.render, 'text', dispatch='deferred')
+
+        doc.text = 1
+        doc.text = 2
+        self.assertEqual(doc.calls, [])
+
+        flush_deferred()
+        self.assertEqual(doc.calls, [('render', 2)])
+
+        flush_deferred()
+        self.assertEqual(doc.calls, [('render', 2)])
+
+    def test_priority(self):
+        doc = Document()
+        doc.on_trait_change(doc.render, 'text', dispatch='deferred')
+        doc.on_trait_change(doc.save, 'index', dispatch='deferred',
+                            priority=-1)
+        doc.on_trait_change(doc.reindex, 'text', dispatch='deferred',
+                            priority=5)
+
+        with deferred_batch():
+            doc.text = 3
+            self.assertEqual(doc.calls, [])
+
+        self.assertEqual(doc.calls,
+                         [('reindex', 3), ('render', 3), ('save', 3)])
+
+    def test_extended_name(self):
+        doc = Document()
+        doc.on_trait_change(doc.save, 'text, index', dispatch='deferred',
+                            priority=2)
+
+        with deferred_batch():
+            doc.text = 4
+            doc.index = 5
+
+        self.assertEqual(doc.calls, [('save', 5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
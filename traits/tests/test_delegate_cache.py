@@ -0,0 +1,109 @@
+""" Tests for 'cached' DelegatesTo and PrototypedFrom traits.
+"""
+
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import Any, DelegatesTo, HasTraits, Instance, PrototypedFrom, Str
+
+
+class Base(HasTraits):
+    name = Str('base')
+    label = Str('label')
+
+
+class Level1(HasTraits):
+    parent = Instance(HasTraits)
+    name = PrototypedFrom('parent', cached=True)
+    label = DelegatesTo('parent', cached=True)
+
+
+class Level2(HasTraits):
+    parent = Instance(Level1)
+    name = PrototypedFrom('parent', cached=True)
+    label = DelegatesTo('parent', cached=True)
+
+
+class Plain(object):
+    name = 'plain'
+
+
+class AnyParent(HasTraits):
+    parent = Any
+    name = PrototypedFrom('parent', cached=True)
+
+
+class TestDelegateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Base()
+        self.level1 = Level1(parent=self.base)
+        self.level2 = Level2(parent=self.level1)
+
+    def test_cached_trait_metadata(self):
+        self.assertTrue(self.level1.trait('name')._cached)
+
+    def test_value_is_cached(self):
+        self.assertEqual(self.level2.name, 'base')
+
+        # Values changed without notification are not seen:
+        self.base.trait_setq(name='quiet')
+        self.assertEqual(self.level2.name, 'base')
+
+    def test_change_to_delegate_value(self):
+        self.assertEqual(self.level2.name, 'base')
+        self.assertEqual(self.level2.label, 'label')
+
+        self.base.name = 'changed'
+        self.level2.label = 'new label'
+
+        self.assertEqual(self.level2.name, 'changed')
+        self.assertEqual(self.level1.name, 'changed')
+        self.assertEqual(self.base.label, 'new label')
+        self.assertEqual(self.level2.label, 'new label')
+
+    def test_delegate_replaced_mid_chain(self):
+        changes = []
+        self.level2.on_trait_change(
+            lambda new: changes.append(new), 'name')
+        self.assertEqual(self.level2.name, 'base')
+
+        self.level1.parent = Base(name='other')
+
+        self.assertEqual(self.level2.name, 'other')
+        self.assertEqual(changes, ['other'])
+
+    def test_delegate_replaced(self):
+        self.assertEqual(self.level2.name, 'base')
+
+        self.level2.parent = Level1(parent=Base(name='other'))
+
+        self.assertEqual(self.level2.name, 'other')
+
+    def test_local_value(self):
+        self.assertEqual(self.level2.name, 'base')
+
+        self.level2.name = 'local'
+        self.assertEqual(self.level2.name, 'local')
+
+        self.base.name = 'changed'
+        self.assertEqual(self.level2.name, 'local')
+
+        del self.level2.name
+        self.assertEqual(self.level2.name, 'changed')
+
+    def test_non_has_traits_delegate_is_not_cached(self):
+        obj = AnyParent()
+        obj.trait_setq(parent=Plain())
+        self.assertEqual(obj.name, 'plain')
+
+        Plain.name = 'changed'
+        try:
+            self.assertEqual(obj.name, 'changed')
+        finally:
+            Plain.name = 'plain'
+
+
+if __name__ == '__main__':
+    unittest.main()
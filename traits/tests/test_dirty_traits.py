@@ -0,0 +1,188 @@
+""" Tests for the recording of changed traits by dirty tracking.
+"""
+
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (collect_dirty_traits, Dict, HasTraits, Instance, Int, List,
+    Set, Str)
+
+
+class Tracked(HasTraits):
+    __track_dirty_traits__ = True
+
+    name = Str
+    value = Int
+    values = List(Int)
+    mapping = Dict(Str, Int)
+    members = Set(Int)
+    child = Instance('Tracked')
+    children = List(Instance('Tracked'))
+
+
+class TrackedWithDefault(HasTraits):
+    __track_dirty_traits__ = True
+
+    value = Int
+
+    defaults_computed = Int
+
+    def _value_default(self):
+        self.defaults_computed += 1
+        return 1
+
+
+class Untracked(HasTraits):
+    name = Str
+
+
+class CountingTracked(Tracked):
+    """ Counts the number of times its traits are enumerated by a graph walk.
+    """
+
+    walks = 0
+
+    def copyable_trait_names(self, **metadata):
+        CountingTracked.walks += 1
+        return super(CountingTracked, self).copyable_trait_names(**metadata)
+
+
+class TestDirtyTraits(unittest.TestCase):
+
+    def test_class_opt_in(self):
+        self.assertTrue(Tracked()._trait_track_dirty())
+        self.assertFalse(Untracked()._trait_track_dirty())
+
+    def test_untracked_object_records_nothing(self):
+        obj = Untracked()
+        obj.name = 'changed'
+
+        self.assertEqual(obj.dirty_traits(), set())
+
+    def test_track_dirty_traits_on_instance(self):
+        obj = Untracked()
+        obj.track_dirty_traits()
+        obj.name = 'changed'
+
+        self.assertEqual(obj.dirty_traits(), set(['name']))
+
+        obj.track_dirty_traits(False)
+        self.assertEqual(obj.dirty_traits(), set())
+
+    def test_assignment(self):
+        obj = Tracked()
+        obj.name = 'name'
+
+        self.assertEqual(obj.dirty_traits(), set(['name']))
+
+    def test_unchanged_value_is_not_dirty(self):
+        obj = Tracked(name='name')
+        obj.clear_dirty()
+        obj.name = 'name'
+
+        self.assertEqual(obj.dirty_traits(), set())
+
+    def test_dynamic_default_is_not_computed(self):
+        obj = TrackedWithDefault()
+        obj.value = 5
+
+        self.assertEqual(obj.defaults_computed, 0)
+        self.assertEqual(obj.dirty_traits(), set(['value']))
+
+    def test_trait_setq(self):
+        obj = Tracked()
+        obj.trait_setq(name='quiet')
+
+        self.assertEqual(obj.dirty_traits(), set(['name']))
+
+    def test_deletion(self):
+        obj = Tracked(name='name')
+        obj.clear_dirty()
+        del obj.name
+
+        self.assertEqual(obj.dirty_traits(), set(['name']))
+
+    def test_items_changes(self):
+        obj = Tracked()
+        obj.clear_dirty()
+        obj.values.append(1)
+        obj.mapping['a'] = 1
+        obj.members.add(1)
+
+        self.assertEqual(obj.dirty_traits(),
+                         set(['values', 'mapping', 'members']))
+
+    def test_clear_dirty(self):
+        obj = Tracked(name='name', value=2)
+
+        self.assertEqual(obj.clear_dirty(), set(['name', 'value']))
+        self.assertEqual(obj.dirty_traits(), set())
+
+    def test_dirty_traits_returns_a_copy(self):
+        obj = Tracked(name='name')
+        obj.dirty_traits().clear()
+
+        self.assertEqual(obj.dirty_traits(), set(['name']))
+
+    def test_collect_dirty_traits(self):
+        leaf = Tracked()
+        child = Tracked(child=leaf)
+        root = Tracked(children=[child])
+        for obj in (leaf, child, root):
+            obj.clear_dirty()
+
+        leaf.name = 'leaf'
+        root.value = 3
+
+        changes = collect_dirty_traits(root, clear=True)
+        self.assertEqual(len(changes), 2)
+        self.assertIn((root, set(['value'])), changes)
+        self.assertIn((leaf, set(['name'])), changes)
+        self.assertEqual(collect_dirty_traits(root), [])
+
+    def test_collect_visits_only_changed_objects(self):
+        leaves = [CountingTracked() for i in range(10)]
+        root = CountingTracked(children=leaves)
+        collect_dirty_traits(root, clear=True)
+
+        CountingTracked.walks = 0
+        leaves[3].value = 1
+        changes = collect_dirty_traits(root, clear=True)
+        self.assertEqual(changes, [(leaves[3], set(['value']))])
+        self.assertEqual(CountingTracked.walks, 1)
+
+    def test_collect_finds_added_objects(self):
+        root = Tracked()
+        collect_dirty_traits(root, clear=True)
+
+        child = Tracked()
+        child.clear_dirty()
+        root.child = child
+        child.value = 2
+        changes = collect_dirty_traits(root, clear=True)
+        self.assertEqual(len(changes), 2)
+        self.assertIn((child, set(['value'])), changes)
+
+        # Changes of an object which is no longer in the graph are ignored:
+        root.child = None
+        root.clear_dirty()
+        child.value = 3
+        self.assertEqual(collect_dirty_traits(root), [])
+
+    def test_collect_with_untracked_objects(self):
+        leaf = Tracked()
+        root = Untracked()
+        root.add_trait('child', Instance(HasTraits))
+        root.child = Tracked()
+        collect_dirty_traits(root, clear=True)
+
+        # Replacing a reference in an untracked object is still found:
+        root.child = leaf
+        leaf.value = 1
+        self.assertEqual(collect_dirty_traits(root, clear=True),
+                         [(leaf, set(['value']))])
+
+
+if __name__ == '__main__':
+    unittest.main()
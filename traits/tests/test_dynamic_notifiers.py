@@ -290,5 +290,96 @@ class TestDynamicNotifiers(unittest.TestCase):
         self.assertEqual(gc.collect(), 0)
 
 
+class Point(HasTraits):
+
+    x = Float
+
+
+class PointListener(HasTraits):
+
+    def changed(self):
+        pass
+
+
+class TestInstanceNotifiers(unittest.TestCase):
+    """ Dynamic notifiers of class traits are kept without cloning the
+    traits. """
+
+    def setUp(self):
+        self.calls = []
+
+    def handler(self, new):
+        self.calls.append(new)
+
+    def test_no_instance_trait_is_created(self):
+        point = Point()
+        point.on_trait_change(self.handler, 'x')
+
+        self.assertNotIn('x', point._instance_traits())
+        point.x = 1.0
+        self.assertEqual(self.calls, [1.0])
+
+        # Other instances are not notified:
+        Point().x = 2.0
+        self.assertEqual(self.calls, [1.0])
+
+    def test_remove_notifier(self):
+        point = Point()
+        point.on_trait_change(self.handler, 'x')
+        point.on_trait_change(self.handler, 'x', remove=True)
+
+        point.x = 1.0
+        self.assertEqual(self.calls, [])
+
+    def test_notifiers_moved_to_instance_trait(self):
+        point = Point()
+        point.on_trait_change(self.handler, 'x')
+
+        # Cloning the trait keeps the notifiers, once:
+        point._trait('x', 2)
+        point.x = 1.0
+        self.assertEqual(self.calls, [1.0])
+        self.assertEqual(point._trait_notifiers('x', -1), None)
+
+    def test_notifiers_kept_by_add_trait(self):
+        point = Point()
+        point.on_trait_change(self.handler, 'x')
+        point.add_trait('x', Float)
+
+        point.x = 1.0
+        self.assertEqual(self.calls, [1.0])
+
+    def test_remove_trait_removes_notifiers(self):
+        point = Point()
+        point.on_trait_change(self.handler, 'x')
+
+        self.assertTrue(point.remove_trait('x'))
+        point.x = 1.0
+        self.assertEqual(self.calls, [])
+
+    def test_sync_trait(self):
+        point, other = Point(), Point()
+        point.sync_trait('x', other)
+
+        point.x = 1.0
+        self.assertEqual(other.x, 1.0)
+        self.assertNotIn('x', point._instance_traits())
+
+        point.sync_trait('x', other, remove=True)
+        point.x = 2.0
+        self.assertEqual(other.x, 1.0)
+
+    def test_notifiers_removed_when_listener_deleted(self):
+        listener = PointListener()
+        points = [Point() for i in range(3)]
+        for point in points:
+            point.on_trait_change(listener.changed, 'x')
+
+        del listener
+        gc.collect()
+        for point in points:
+            self.assertEqual(point._trait_notifiers('x', 0), [])
+
+
 if __name__ == '__main__':
     unittest.main()
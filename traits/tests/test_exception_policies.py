@@ -0,0 +1,114 @@
+""" Tests for the RateLimitedExceptionLogger and ExceptionBuffer
+notification exception handlers.
+"""
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (ExceptionBuffer, HasTraits, Int,
+    RateLimitedExceptionLogger, push_exception_handler, pop_exception_handler)
+from ..trait_notifiers import notification_exception_handler
+
+
+class Failing(HasTraits):
+    x = Int
+
+    y = Int
+
+    def _x_changed(self):
+        raise ValueError('x')
+
+    def _y_changed(self):
+        raise KeyError('y')
+
+
+class StubLogger(object):
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, message):
+        self.warnings.append(message)
+
+
+class TestRateLimitedExceptionLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.logged = []
+        self.logger = StubLogger()
+        notification_exception_handler._log_exception = (
+            lambda *args: self.logged.append(args))
+        notification_exception_handler.traits_logger, self.old_logger = (
+            self.logger, notification_exception_handler.traits_logger)
+
+    def tearDown(self):
+        pop_exception_handler()
+        del notification_exception_handler._log_exception
+        notification_exception_handler.traits_logger = self.old_logger
+
+    def test_repeated_exceptions_are_counted(self):
+        handler = RateLimitedExceptionLogger(interval=3600.0)
+        push_exception_handler(handler)
+        failing = Failing()
+
+        for i in range(1, 6):
+            failing.x = i
+        failing.y = 1
+
+        self.assertEqual([args[1] for args in self.logged], ['x', 'y'])
+        counts = sorted(
+            (signature[1], signature[3], count)
+            for signature, count in handler.counts().items())
+        self.assertEqual(counts, [('x', ValueError, 5), ('y', KeyError, 1)])
+
+    def test_suppressed_exceptions_are_reported(self):
+        handler = RateLimitedExceptionLogger(interval=3600.0, burst=2)
+        push_exception_handler(handler)
+        failing = Failing()
+
+        for i in range(1, 6):
+            failing.x = i
+        self.assertEqual(len(self.logged), 2)
+
+        handler.interval = 0.0
+        failing.x = 6
+
+        self.assertEqual(len(self.logged), 3)
+        self.assertEqual(len(self.logger.warnings), 1)
+        self.assertIn('3 similar exceptions', self.logger.warnings[0])
+
+
+class TestExceptionBuffer(unittest.TestCase):
+
+    def tearDown(self):
+        pop_exception_handler()
+
+    def test_bounded_buffer(self):
+        buffer = ExceptionBuffer(max_size=3)
+        push_exception_handler(buffer)
+        failing = Failing()
+
+        for i in range(1, 6):
+            failing.x = i
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.dropped, 2)
+        records = buffer.drain()
+        self.assertEqual([record[3] for record in records], [3, 4, 5])
+        self.assertIs(records[0][4][0], ValueError)
+        self.assertIsNone(records[0][4][2])
+        self.assertEqual(len(buffer), 0)
+
+    def test_format(self):
+        buffer = ExceptionBuffer(keep_traceback=True)
+        push_exception_handler(buffer)
+
+        Failing().y = 1
+
+        messages = buffer.format()
+        self.assertEqual(len(messages), 1)
+        self.assertIn('trait: y', messages[0])
+        self.assertIn('_y_changed', messages[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
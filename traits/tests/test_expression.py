@@ -0,0 +1,106 @@
+""" Tests for the Expression trait and traits.trait_expression.
+"""
+
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Expression, ExpressionEvaluator, HasTraits, Int, Trait,
+    TraitError)
+from ..trait_expression import ExpressionCache, expression_cache
+from ..trait_handlers import TraitExpression
+
+
+class Rule(HasTraits):
+    condition = Expression
+    handled = Trait('0', TraitExpression())
+    x = Int(2)
+    y = Int(3)
+
+
+class TestExpressionCache(unittest.TestCase):
+
+    def test_compiled_once(self):
+        cache = ExpressionCache()
+        code = cache.compile('x + 1')
+
+        self.assertIs(cache.compile('x + 1'), code)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_is_discarded(self):
+        cache = ExpressionCache(size=2)
+        code = cache.compile('1')
+        cache.compile('2')
+        cache.compile('1')
+        cache.compile('3')
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.compile('1'), code)
+        cache.compile('2')
+        self.assertEqual(cache.misses, 4)
+
+    def test_resize(self):
+        cache = ExpressionCache()
+        for i in range(10):
+            cache.compile(str(i))
+        cache.resize(3)
+
+        self.assertEqual(len(cache), 3)
+
+    def test_invalid_expression(self):
+        cache = ExpressionCache()
+
+        with self.assertRaises(SyntaxError):
+            cache.compile('x +')
+        self.assertEqual(len(cache), 0)
+
+
+class TestExpressionTraits(unittest.TestCase):
+
+    def test_single_compile_per_assignment(self):
+        rule = Rule()
+        source = 'x * y + 12345'
+        misses = expression_cache.misses
+
+        rule.condition = source
+        rule.handled = source
+
+        self.assertEqual(expression_cache.misses, misses + 1)
+        self.assertIs(rule.condition_, rule.handled_)
+        self.assertEqual(rule.condition, source)
+
+    def test_invalid_expression(self):
+        rule = Rule()
+
+        with self.assertRaises(TraitError):
+            rule.condition = 'x +'
+        with self.assertRaises(TraitError):
+            rule.handled = 'x +'
+
+
+class TestExpressionEvaluator(unittest.TestCase):
+
+    def test_trait_namespace(self):
+        rule = Rule(condition='x * y')
+        evaluate = ExpressionEvaluator(rule)
+
+        self.assertEqual(evaluate(rule.condition_), 6)
+        rule.x = 4
+        self.assertEqual(evaluate('x * y'), 12)
+
+    def test_names_and_globals(self):
+        rule = Rule()
+        evaluate = ExpressionEvaluator(rule, globals={'z': 10}, y=100)
+
+        self.assertEqual(evaluate('x + y + z'), 112)
+        self.assertEqual(evaluate('len([x])'), 1)
+
+    def test_unknown_name(self):
+        evaluate = ExpressionEvaluator(Rule())
+
+        with self.assertRaises(NameError):
+            evaluate('unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
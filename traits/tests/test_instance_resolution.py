@@ -0,0 +1,124 @@
+""" Tests for the resolution of classes given by name to Instance traits.
+"""
+
+from __future__ import absolute_import
+
+import gc
+import sys
+import weakref
+from types import ModuleType
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import TraitError
+from .. import trait_types
+
+SOURCE = """
+from traits.api import HasTraits, Instance, List
+
+class Holder(HasTraits):
+    target = Instance('Target')
+    targets = List(Instance('Target'))
+
+class Owner(HasTraits):
+    target = Instance('Target', ())
+
+class Target(HasTraits):
+    pass
+
+class Pending(HasTraits):
+    missing = Instance('Missing')
+"""
+
+
+class TestInstanceResolution(unittest.TestCase):
+
+    def setUp(self):
+        # Each test defines its classes in a new module:
+        self.module = ModuleType('_test_instance_resolution_%s' % id(self))
+        sys.modules[self.module.__name__] = self.module
+        exec SOURCE in self.module.__dict__
+
+    def tearDown(self):
+        del sys.modules[self.module.__name__]
+
+    def get_validate(self, klass, name):
+        return klass.class_traits()[name].get_validate()
+
+    def test_classes_resolved_at_first_use(self):
+        module = self.module
+        self.assertFalse(
+            isinstance(self.get_validate(module.Owner, 'target'), tuple))
+
+        holder = module.Holder(target=module.Target())
+
+        # All the traits referring to the class now use the C validator:
+        for klass, name in [(module.Holder, 'target'),
+                            (module.Owner, 'target')]:
+            validate = self.get_validate(klass, name)
+            self.assertIsInstance(validate, tuple)
+            self.assertIs(validate[-1], module.Target)
+        item_trait = module.Holder.class_traits()['targets'].handler.item_trait
+        self.assertIs(item_trait.get_validate()[-1], module.Target)
+
+        with self.assertRaises(TraitError):
+            holder.target = module.Owner()
+
+    def test_only_waiting_traits_resolved(self):
+        module = self.module
+        missing_key = (module.__name__, 'Missing')
+        pending = trait_types._unresolved_classes[missing_key]
+
+        module.Holder(target=module.Target())
+
+        # Only the traits waiting for the resolved class were visited:
+        self.assertNotIn((module.__name__, 'Target'),
+                         trait_types._unresolved_classes)
+        self.assertIs(trait_types._unresolved_classes[missing_key], pending)
+        self.assertEqual(len(pending), 1)
+
+    def test_default_value(self):
+        module = self.module
+
+        owner = module.Owner()
+
+        self.assertIsInstance(owner.target, module.Target)
+        self.assertIsInstance(self.get_validate(module.Owner, 'target'),
+                              tuple)
+
+    def test_resolved_classes_are_shared(self):
+        module = self.module
+        module.Owner().target
+
+        self.assertIs(
+            trait_types._resolved_classes[(module.__name__, 'Target')],
+            module.Target)
+
+    def test_reloaded_module(self):
+        module = self.module
+        module.Owner().target
+
+        # Simulate reloading the module:
+        exec SOURCE in module.__dict__
+
+        holder = module.Holder()
+        holder.target = module.Target()
+        self.assertIs(self.get_validate(module.Holder, 'target')[-1],
+                      module.Target)
+
+    def test_resolved_classes_not_kept_alive(self):
+        module = self.module
+        module.Owner().target
+        target_ref = weakref.ref(module.Target)
+
+        del sys.modules[module.__name__]
+        del self.module, module
+        gc.collect()
+
+        self.assertIsNone(target_ref())
+        self.module = ModuleType('_test_instance_resolution_%s' % id(self))
+        sys.modules[self.module.__name__] = self.module
+
+
+if __name__ == '__main__':
+    unittest.main()
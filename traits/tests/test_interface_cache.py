@@ -0,0 +1,157 @@
+""" Tests for the cached results of the interface checker, and
+traits.interface_checker.check_package.
+"""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import HasTraits, Int, Interface
+from ..interface_checker import InterfaceChecker, check_package
+
+
+PACKAGE_FILES = {
+    '__init__.py': '',
+    'interfaces.py': """
+        from traits.api import Interface
+
+        class IShape(Interface):
+            def area(self):
+                pass
+    """,
+    'shapes.py': """
+        from traits.api import HasTraits, provides
+        from .interfaces import IShape
+
+        @provides(IShape)
+        class Square(HasTraits):
+            def area(self):
+                return 1
+
+        @provides(IShape)
+        class Line(HasTraits):
+            pass
+
+        class Rectangle(Line):
+            def area(self):
+                return 2
+
+        class Segment(Line):
+            pass
+
+        class Polygon(IShape):
+            pass
+    """,
+}
+
+
+class TestInterfaceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.package = 'iface_cache_%d' % id(self)
+        package_dir = os.path.join(self.directory, self.package)
+        os.mkdir(package_dir)
+        for name, source in PACKAGE_FILES.items():
+            with open(os.path.join(package_dir, name), 'w') as fh:
+                fh.write(textwrap.dedent(source))
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        for name in list(sys.modules):
+            if name.startswith(self.package):
+                del sys.modules[name]
+        shutil.rmtree(self.directory)
+
+    def test_results_are_cached(self):
+        class IFoo(Interface):
+            def foo(self):
+                pass
+
+        class Foo(HasTraits):
+            pass
+
+        checker = InterfaceChecker()
+        self.assertFalse(checker.check_implements(Foo, IFoo, 0))
+
+        # The class is not checked again:
+        Foo.foo = lambda self: None
+        self.assertFalse(checker.check_implements(Foo, IFoo, 0))
+
+        checker.clear_cache()
+        self.assertTrue(checker.check_implements(Foo, IFoo, 0))
+
+    def test_cache_file(self):
+        cache_file = os.path.join(self.directory, 'cache.json')
+        shapes = __import__(self.package + '.shapes', fromlist=['Square'])
+        interfaces = sys.modules[self.package + '.interfaces']
+
+        checker = InterfaceChecker(cache_file=cache_file)
+        self.assertIsNone(
+            checker.check_interface(shapes.Square, interfaces.IShape))
+        self.assertIsNotNone(
+            checker.check_interface(shapes.Line, interfaces.IShape))
+        checker.save_cache()
+
+        # The results are read back from the file instead of being computed:
+        checker = InterfaceChecker(cache_file=cache_file)
+        for name in list(checker._get_file_results()):
+            checker._file_results[name] = 'cached'
+        self.assertEqual(
+            checker.check_interface(shapes.Square, interfaces.IShape),
+            'cached')
+
+    def test_cache_file_ignores_local_classes(self):
+        class IFoo(Interface):
+            x = Int
+
+        class Foo(HasTraits):
+            pass
+
+        checker = InterfaceChecker(
+            cache_file=os.path.join(self.directory, 'cache.json'))
+        self.assertIsNotNone(checker.check_interface(Foo, IFoo))
+        self.assertEqual(checker._new_results, {})
+
+    def test_check_package(self):
+        cache_file = os.path.join(self.directory, 'cache.json')
+
+        messages = check_package(self.package, workers=2,
+                                 cache_file=cache_file)
+
+        # Subclasses of registered classes are checked too, but not the
+        # interfaces themselves:
+        self.assertEqual(len(messages), 2)
+        self.assertIn("'Line'", messages[0])
+        self.assertIn("'Segment'", messages[1])
+        checker = InterfaceChecker(cache_file=cache_file)
+        self.assertEqual(len(checker._get_file_results()), 4)
+
+    def test_check_package_without_workers(self):
+        messages = check_package(self.package, workers=1)
+
+        self.assertEqual(len(messages), 2)
+
+    def test_file_key(self):
+        shapes = __import__(self.package + '.shapes', fromlist=['Square'])
+        interfaces = sys.modules[self.package + '.interfaces']
+        checker = InterfaceChecker(
+            cache_file=os.path.join(self.directory, 'cache.json'))
+
+        key = checker._file_key(shapes.Square, interfaces.IShape)
+        self.assertTrue(key.startswith(
+            '%s.shapes.Square:%s.interfaces.IShape:' % (
+                self.package, self.package)))
+        self.assertEqual(
+            checker._file_key(shapes.Square, interfaces.IShape), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+""" Tests for the File and Directory traits with exists=True, and
+traits.path_validation.
+"""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Directory, File, HasTraits, PathValidationError,
+    set_path_traits, TraitError)
+from ..path_validation import StatCache, stat_cache
+
+
+class Project(HasTraits):
+    source = File(exists=True)
+    folder = Directory(exists=True)
+
+
+class PathTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        stat_cache.invalidate()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        stat_cache.invalidate()
+
+    def make_file(self, name):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w'):
+            pass
+        return path
+
+
+class TestStatCache(PathTestCase):
+
+    def test_kinds(self):
+        cache = StatCache()
+        path = self.make_file('a.txt')
+
+        self.assertTrue(cache.isfile(path))
+        self.assertFalse(cache.isdir(path))
+        self.assertTrue(cache.isdir(self.directory))
+        self.assertFalse(cache.isfile(path + '.missing'))
+        self.assertFalse(cache.isdir(None))
+
+    def test_results_are_cached_until_invalidated(self):
+        cache = StatCache(ttl=3600)
+        path = self.make_file('a.txt')
+
+        self.assertTrue(cache.isfile(path))
+        os.remove(path)
+        self.assertTrue(cache.isfile(path))
+
+        cache.invalidate(path)
+        self.assertFalse(cache.isfile(path))
+
+    def test_missing_paths_are_not_cached(self):
+        cache = StatCache(ttl=3600)
+        path = os.path.join(self.directory, 'a.txt')
+
+        self.assertFalse(cache.isfile(path))
+        self.make_file('a.txt')
+        self.assertTrue(cache.isfile(path))
+
+    def test_preloaded(self):
+        cache = StatCache(ttl=0)
+        path = self.make_file('a.txt')
+        modes = {path: os.stat(path).st_mode}
+        os.remove(path)
+
+        with cache.preloaded(modes):
+            self.assertTrue(cache.isfile(path))
+        self.assertFalse(cache.isfile(path))
+
+    def test_no_caching(self):
+        cache = StatCache(ttl=0)
+        path = os.path.join(self.directory, 'a.txt')
+
+        self.assertFalse(cache.isfile(path))
+        self.make_file('a.txt')
+        self.assertTrue(cache.isfile(path))
+
+    def test_max_size(self):
+        cache = StatCache(ttl=3600, max_size=4)
+        for i in range(10):
+            cache.isfile(self.make_file(str(i)))
+
+        self.assertLessEqual(len(cache._modes), 4)
+
+
+class TestPathTraits(PathTestCase):
+
+    def test_exists(self):
+        project = Project()
+        path = self.make_file('a.txt')
+
+        project.source = path
+        project.folder = self.directory
+        with self.assertRaises(TraitError):
+            project.source = self.directory
+        with self.assertRaises(TraitError):
+            project.folder = path
+
+    def test_cache_disabled_by_default(self):
+        self.assertEqual(stat_cache.ttl, 0)
+
+    def test_create_then_assign(self):
+        project = Project()
+        path = os.path.join(self.directory, 'a.txt')
+
+        with self.assertRaises(TraitError):
+            project.source = path
+        self.make_file('a.txt')
+        project.source = path
+
+        self.assertEqual(project.source, path)
+
+    def test_set_path_traits(self):
+        projects = [Project() for i in range(40)]
+        paths = [self.make_file('%d.txt' % i) for i in range(40)]
+
+        set_path_traits(zip(projects, ['source'] * 40, paths), workers=4)
+
+        self.assertEqual([project.source for project in projects], paths)
+
+    def test_set_path_traits_reports_all_failures(self):
+        project1 = Project()
+        project2 = Project()
+        path = self.make_file('a.txt')
+        missing = os.path.join(self.directory, 'missing')
+
+        with self.assertRaises(PathValidationError) as context:
+            set_path_traits([
+                (project1, 'source', missing),
+                (project1, 'folder', self.directory),
+                (project2, 'source', path),
+                (project2, 'folder', missing),
+            ])
+
+        errors = context.exception.errors
+        self.assertEqual([error[:3] for error in errors], [
+            (project1, 'source', missing), (project2, 'folder', missing)])
+        self.assertEqual(project1.folder, self.directory)
+        self.assertEqual(project2.source, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
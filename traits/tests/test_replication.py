@@ -0,0 +1,118 @@
+""" Tests for the replication of trait changes to another process.
+"""
+
+from __future__ import absolute_import
+
+from multiprocessing import Pipe, Process
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import Dict, HasTraits, Int, List, Set, Str
+from ..replication import LIST_EVENT, VALUE_EVENT, Replicator
+
+
+class Model(HasTraits):
+    count = Int
+
+    label = Str
+
+    items = List(Int)
+
+    table = Dict(Str, Int)
+
+    tags = Set(Str)
+
+
+def _run_mirror(connection, parent_connection, results):
+    # Close the parent end inherited by this process, so that closing it in
+    # the parent process ends the loop:
+    parent_connection.close()
+
+    model = Model()
+    replicator = Replicator(connection)
+    replicator.mirror(model, 'model')
+    try:
+        while replicator.receive():
+            pass
+    except EOFError:
+        pass
+
+    results.send(model.trait_get('count', 'label', 'items', 'table', 'tags'))
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, events):
+        self.sent.append(events)
+
+
+class TestReplication(unittest.TestCase):
+
+    def test_other_process(self):
+        parent_connection, child_connection = Pipe()
+        results, child_results = Pipe()
+        process = Process(target=_run_mirror,
+                          args=(child_connection, parent_connection,
+                                child_results))
+        process.start()
+        child_connection.close()
+
+        model = Model(count=1, items=[1, 2, 3])
+        replicator = Replicator(parent_connection)
+        replicator.publish(model, 'model')
+
+        with replicator.batch():
+            model.count = 5
+            model.label = 'five'
+            model.items[1:2] = [7, 8]
+            model.items.append(9)
+        model.table['a'] = 1
+        model.table.update({'a': 2, 'b': 3})
+        del model.table['b']
+        model.tags.update(['x', 'y'])
+        model.tags.remove('x')
+        replicator.close()
+
+        state = results.recv()
+        process.join()
+
+        self.assertEqual(state, {'count': 5, 'label': 'five',
+                                 'items': [1, 7, 8, 3, 9],
+                                 'table': {'a': 2}, 'tags': set(['y'])})
+
+    def test_batches_and_deltas(self):
+        connection = FakeConnection()
+        model = Model(items=list(range(1000)))
+        replicator = Replicator(connection)
+        replicator.publish(model, 'model', ['items'])
+        del connection.sent[:]
+
+        with replicator.batch():
+            model.count = 2
+            model.items.append(1000)
+            model.items[0] = -1
+
+        self.assertEqual(connection.sent, [[
+            (LIST_EVENT, 'model', 'items', 1000, 0, [1000]),
+            (LIST_EVENT, 'model', 'items', 0, 1, [-1]),
+        ]])
+
+    def test_no_echo(self):
+        connection = FakeConnection()
+        model = Model()
+        replicator = Replicator(connection)
+        replicator.publish(model, 'model')
+        replicator.mirror(model, 'model')
+        del connection.sent[:]
+
+        replicator.apply([(VALUE_EVENT, 'model', 'count', 3)])
+
+        self.assertEqual(model.count, 3)
+        self.assertEqual(connection.sent, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+""" Tests for HasTraits.snapshot() and traits.trait_snapshot.diff().
+"""
+
+from __future__ import absolute_import
+
+import gc
+import weakref
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Any, Dict, HasTraits, Instance, Int, List, Property, Str,
+    TraitSnapshot)
+from ..trait_snapshot import FrozenDict, _snapshot_graphs, diff
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+
+class Leaf(HasTraits):
+    name = Str
+    value = Int
+
+
+class Data(HasTraits):
+    values = Any
+
+
+class Node(HasTraits):
+    name = Str
+    leaf = Instance(Leaf)
+    children = List(Instance('Node'))
+    parent = Instance('Node')
+    info = Dict(Str, Int)
+    doubled = Property(Int, depends_on='leaf.value')
+
+    def _get_doubled(self):
+        return 2 * self.leaf.value
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.leaf1 = Leaf(name='leaf1', value=1)
+        self.leaf2 = Leaf(name='leaf2', value=2)
+        self.child1 = Node(name='child1', leaf=self.leaf1)
+        self.child2 = Node(name='child2', leaf=self.leaf2)
+        self.root = Node(name='root', children=[self.child1, self.child2],
+                         info={'a': 1})
+
+    def test_snapshot_values(self):
+        snapshot = self.root.snapshot()
+
+        self.assertIsInstance(snapshot, TraitSnapshot)
+        self.assertIs(snapshot.klass, Node)
+        self.assertIs(snapshot.source(), self.root)
+        self.assertEqual(snapshot.name, 'root')
+        self.assertEqual(snapshot['name'], 'root')
+        self.assertIsNone(snapshot.leaf)
+        self.assertIsInstance(snapshot.children, tuple)
+        self.assertEqual(snapshot.children[1].leaf.value, 2)
+        self.assertIsInstance(snapshot.info, FrozenDict)
+        self.assertEqual(snapshot.info, {'a': 1})
+        self.assertNotIn('doubled', snapshot)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = self.root.snapshot()
+
+        with self.assertRaises(AttributeError):
+            snapshot.name = 'changed'
+        with self.assertRaises(TypeError):
+            snapshot.info['b'] = 2
+
+    def test_snapshot_is_not_affected_by_later_changes(self):
+        snapshot = self.root.snapshot()
+
+        self.root.name = 'changed'
+        self.root.children.append(Node(name='child3'))
+        self.leaf1.value = 10
+
+        self.assertEqual(snapshot.name, 'root')
+        self.assertEqual(len(snapshot.children), 2)
+        self.assertEqual(snapshot.children[0].leaf.value, 1)
+
+    def test_unchanged_graph_is_reused(self):
+        snapshot1 = self.root.snapshot()
+        snapshot2 = self.root.snapshot()
+
+        self.assertIs(snapshot1, snapshot2)
+
+    def test_unchanged_subgraphs_are_shared(self):
+        snapshot1 = self.root.snapshot()
+        self.leaf1.value = 10
+        snapshot2 = self.root.snapshot()
+
+        self.assertIsNot(snapshot1, snapshot2)
+        self.assertIsNot(snapshot1.children[0], snapshot2.children[0])
+        self.assertIsNot(snapshot1.children[0].leaf,
+                         snapshot2.children[0].leaf)
+        self.assertIs(snapshot1.children[1], snapshot2.children[1])
+
+    def test_subgraph_snapshot_taken_separately(self):
+        snapshot1 = self.root.snapshot()
+        self.leaf2.value = 20
+        child_snapshot = self.child2.snapshot()
+        snapshot2 = self.root.snapshot()
+
+        self.assertIsNot(snapshot1, snapshot2)
+        self.assertIs(snapshot2.children[1], child_snapshot)
+        self.assertEqual(snapshot2.children[1].leaf.value, 20)
+
+    def test_reference_cycles(self):
+        self.child1.parent = self.root
+        snapshot1 = self.root.snapshot()
+
+        self.assertIs(snapshot1.children[0].parent, snapshot1)
+        self.assertIs(self.root.snapshot(), snapshot1)
+
+        self.leaf2.value = 20
+        snapshot2 = self.root.snapshot()
+
+        self.assertIsNot(snapshot2, snapshot1)
+        self.assertIs(snapshot2.children[0].parent, snapshot2)
+
+
+class CountingLeaf(Leaf):
+    """ A tracked Leaf counting the number of times its traits are read.
+    """
+
+    __track_dirty_traits__ = True
+
+    read = set()
+
+    def copyable_trait_names(self, **metadata):
+        CountingLeaf.read.add(self)
+        return super(CountingLeaf, self).copyable_trait_names(**metadata)
+
+
+class TestTrackedSnapshot(TestSnapshot):
+    """ The same tests, with objects tracking their changes, which are
+    updated without walking the whole graph. """
+
+    def setUp(self):
+        super(TestTrackedSnapshot, self).setUp()
+        for obj in (self.leaf1, self.leaf2, self.child1, self.child2,
+                    self.root):
+            obj.track_dirty_traits()
+
+    def test_only_changed_objects_are_read(self):
+        leaves = [CountingLeaf(value=i) for i in range(10)]
+        node = Node(children=[Node(leaf=leaf) for leaf in leaves])
+        for obj in [node] + node.children:
+            obj.track_dirty_traits()
+        snapshot1 = node.snapshot()
+
+        CountingLeaf.read = set()
+        leaves[3].value = 30
+        snapshot2 = node.snapshot()
+
+        self.assertEqual(CountingLeaf.read, set([leaves[3]]))
+        self.assertEqual(snapshot2.children[3].leaf.value, 30)
+        self.assertIs(snapshot2.children[4], snapshot1.children[4])
+
+    def test_added_and_removed_objects(self):
+        snapshot1 = self.root.snapshot()
+
+        child3 = Node(name='child3')
+        child3.track_dirty_traits()
+        self.root.children.append(child3)
+        snapshot2 = self.root.snapshot()
+        self.assertEqual(len(snapshot2.children), 3)
+        self.assertIs(snapshot2.children[0], snapshot1.children[0])
+
+        del self.root.children[0]
+        snapshot3 = self.root.snapshot()
+        self.assertEqual([child.name for child in snapshot3.children],
+                         ['child2', 'child3'])
+
+    def test_graph_does_not_keep_objects_alive(self):
+        self.root.snapshot()
+        graph = _snapshot_graphs[self.root]
+        self.assertIn(self.root, graph.parents[self.child1])
+        self.assertIn(weakref.ref(self.child1), graph.children[self.root])
+
+        child_ref = weakref.ref(self.child1)
+        del self.root.children[0], self.child1
+        self.root.snapshot()
+        gc.collect()
+
+        self.assertIsNone(child_ref())
+        self.assertEqual(len(graph.nodes), 3)
+
+    @unittest.skipUnless(numpy_available, "numpy not available")
+    def test_arrays_are_copied(self):
+        data = Data(values=numpy.arange(3))
+        snapshot1 = data.snapshot()
+        data.values[0] = 10
+        snapshot2 = data.snapshot()
+
+        self.assertEqual(list(snapshot1.values), [0, 1, 2])
+        self.assertFalse(snapshot1.values.flags.writeable)
+        self.assertEqual([change[0] for change in diff(snapshot1, snapshot2)],
+                         [('values',)])
+
+
+class TestSnapshotDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.leaf = Leaf(name='leaf', value=1)
+        self.child = Node(name='child', leaf=self.leaf)
+        self.root = Node(name='root', children=[self.child])
+
+    def test_no_changes(self):
+        snapshot = self.root.snapshot()
+
+        self.assertEqual(diff(snapshot, snapshot), [])
+        self.assertEqual(diff(snapshot, self.root.snapshot()), [])
+
+    def test_changed_traits(self):
+        snapshot1 = self.root.snapshot()
+        self.root.name = 'new root'
+        self.leaf.value = 2
+        snapshot2 = self.root.snapshot()
+
+        self.assertEqual(diff(snapshot1, snapshot2), [
+            (('children', 0, 'leaf', 'value'), 1, 2),
+            (('name',), 'root', 'new root'),
+        ])
+
+    def test_replaced_object(self):
+        snapshot1 = self.root.snapshot()
+        self.child.leaf = Leaf(name='leaf', value=1)
+        snapshot2 = self.root.snapshot()
+
+        changes = diff(snapshot1, snapshot2)
+        self.assertEqual(len(changes), 1)
+        path, old, new = changes[0]
+        self.assertEqual(path, ('children', 0, 'leaf'))
+        self.assertIs(old.source(), self.leaf)
+        self.assertIs(new.source(), self.child.leaf)
+
+    def test_changed_list_length(self):
+        snapshot1 = self.root.snapshot()
+        self.root.children.append(Node(name='child2'))
+        snapshot2 = self.root.snapshot()
+
+        changes = diff(snapshot1, snapshot2)
+        self.assertEqual([change[0] for change in changes], [('children',)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ from traits.testing.unittest_tools import unittest, UnittestTools
 
 from ..api import (
     HasTraits, Int, List, push_exception_handler, pop_exception_handler)
+from ..ctraits import cSyncNotifier
 
 
 class A(HasTraits):
@@ -183,5 +184,85 @@ class TestSyncTraits(unittest.TestCase, UnittestTools):
         self.assertEqual(change_counter, [1])
 
 
+    def test_sync_notifiers_removed_on_delete(self):
+        """ Test that the notifiers synchronizing a deleted object are removed.
+        """
+
+        a = A()
+        b = B()
+
+        a.sync_trait('l', b)
+        self.assertEqual(len(self._sync_notifiers(a, 'l')), 1)
+        self.assertEqual(len(self._sync_notifiers(a, 'l_items')), 1)
+
+        del b
+        self.assertEqual(self._sync_notifiers(a, 'l'), [])
+        self.assertEqual(self._sync_notifiers(a, 'l_items'), [])
+
+    def test_sync_twice(self):
+        """ Test that synchronizing the same traits twice has no effect.
+        """
+
+        a = A()
+        b = B()
+
+        a.sync_trait('t', b)
+        a.sync_trait('t', b)
+        b.sync_trait('t', a)
+
+        self.assertEqual(len(self._sync_notifiers(a, 't')), 1)
+        self.assertEqual(len(self._sync_notifiers(b, 't')), 1)
+
+        a.sync_trait('t', b, remove=True)
+        self.assertEqual(self._sync_notifiers(a, 't'), [])
+        self.assertEqual(self._sync_notifiers(b, 't'), [])
+
+    def test_sync_no_ping_pong(self):
+        """ Test that a value is not copied back to the object it came from.
+        """
+
+        a = A()
+        b = B()
+        c = B()
+
+        a.sync_trait('t', b)
+        b.sync_trait('t', c)
+
+        with self.assertTraitChanges(a, 't', count=1):
+            with self.assertTraitChanges(c, 't', count=1):
+                b.t = 3
+        self.assertEqual((a.t, c.t), (3, 3))
+
+        with self.assertTraitChanges(b, 't', count=1):
+            c.t = 4
+        self.assertEqual(a.t, 4)
+
+    def test_sync_ring(self):
+        """ Test that a value is copied once around a ring of one-way
+        synchronized lists.
+        """
+
+        a = A()
+        b = B()
+        c = B()
+
+        a.sync_trait('l', b, mutual=False)
+        b.sync_trait('l', c, mutual=False)
+        c.sync_trait('l', a, mutual=False)
+
+        a.l.append(1)
+        self.assertEqual((a.l, b.l, c.l), ([1], [1], [1]))
+
+        c.l = [2, 3]
+        self.assertEqual((a.l, b.l, c.l), ([2, 3], [2, 3], [2, 3]))
+
+        b.l[0] = 4
+        self.assertEqual((a.l, b.l, c.l), ([4, 3], [4, 3], [4, 3]))
+
+    def _sync_notifiers(self, object, name):
+        notifiers = object._trait(name, 2)._notifiers(1)
+        return [notifier for notifier in notifiers
+                if isinstance(notifier, cSyncNotifier)]
+
 if __name__ == '__main__':
     unittest.main()
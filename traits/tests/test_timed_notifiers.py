@@ -0,0 +1,155 @@
+""" Tests for dynamic notifiers with `dispatch='debounce'` and
+`dispatch='throttle'`.
+
+Most tests drive a scheduler without a thread using a fake clock, so that
+they do not depend on the timing of the machine running them.
+
+"""
+from __future__ import absolute_import
+
+import gc
+import threading
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import Float, HasTraits, List, on_trait_change
+from ..trait_notifiers import TimerScheduler, set_timer_scheduler
+
+
+class Slider(HasTraits):
+    value = Float
+
+    changes = Float
+
+    calls = List
+
+    @on_trait_change('changes', dispatch='debounce', interval=0.05)
+    def _record_change(self, new):
+        self.calls.append(new)
+
+
+class Listener(object):
+
+    def __init__(self):
+        self.calls = []
+        self.threads = []
+        self.notified = threading.Event()
+
+    def notify(self, new):
+        self.calls.append(new)
+        self.threads.append(threading.current_thread())
+        self.notified.set()
+
+
+class TestTimedNotifiers(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        self.scheduler = TimerScheduler(clock=lambda: self.now,
+                                        threaded=False)
+        self.previous_scheduler = set_timer_scheduler(self.scheduler)
+
+    def tearDown(self):
+        set_timer_scheduler(self.previous_scheduler)
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.scheduler.run_due()
+
+    def test_debounce(self):
+        slider = Slider()
+        listener = Listener()
+        slider.on_trait_change(listener.notify, 'value', dispatch='debounce',
+                               interval=0.05)
+
+        for i in range(10):
+            slider.value = i
+            self.advance(0.04)
+        self.assertEqual(listener.calls, [])
+
+        self.advance(0.01)
+        self.assertEqual(listener.calls, [9])
+
+    def test_throttle(self):
+        slider = Slider()
+        listener = Listener()
+        slider.on_trait_change(listener.notify, 'value', dispatch='throttle',
+                               interval=0.2)
+
+        slider.value = 1
+        self.advance(0)
+        self.assertEqual(listener.calls, [1])
+
+        slider.value = 2
+        self.advance(0.1)
+        slider.value = 3
+        self.assertEqual(listener.calls, [1])
+
+        self.advance(0.1)
+        self.assertEqual(listener.calls, [1, 3])
+
+    def test_decorator(self):
+        slider = Slider()
+
+        slider.changes = 1
+        slider.changes = 2
+        self.advance(0.04)
+        self.assertEqual(slider.calls, [])
+
+        self.advance(0.01)
+        self.assertEqual(slider.calls, [2])
+
+    def test_extended_name(self):
+        slider = Slider()
+        listener = Listener()
+        slider.on_trait_change(listener.notify, 'value,changes',
+                               dispatch='debounce', interval=0.5)
+
+        slider.value = 1
+        self.advance(0.4)
+        self.assertEqual(listener.calls, [])
+
+        self.advance(0.1)
+        self.assertEqual(listener.calls, [1])
+
+    def test_default_interval(self):
+        slider = Slider()
+        listener = Listener()
+        slider.on_trait_change(listener.notify, 'value', dispatch='debounce')
+
+        slider.value = 1
+        self.advance(0.09)
+        self.assertEqual(listener.calls, [])
+
+        self.advance(0.01)
+        self.assertEqual(listener.calls, [1])
+
+    def test_deleted_listener(self):
+        slider = Slider()
+        listener = Listener()
+        calls = listener.calls
+        slider.on_trait_change(listener.notify, 'value', dispatch='debounce',
+                               interval=0.05)
+
+        slider.value = 1
+        del listener
+        gc.collect()
+
+        self.advance(0.05)
+        self.assertEqual(calls, [])
+
+    def test_timer_thread(self):
+        set_timer_scheduler(self.previous_scheduler)
+        slider = Slider()
+        listener = Listener()
+        slider.on_trait_change(listener.notify, 'value', dispatch='debounce',
+                               interval=0.01)
+
+        slider.value = 1
+        self.assertTrue(listener.notified.wait(10.0))
+        self.assertEqual(listener.calls, [1])
+        self.assertIsNot(listener.threads[0], threading.current_thread())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+""" Tests for traits.trait_memory.trait_memory_report.
+"""
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import HasTraits, Instance, Int, List, trait_memory_report
+
+
+class Child(HasTraits):
+    value = Int
+
+
+class Parent(HasTraits):
+    child = Instance(Child)
+
+    items = List(Int)
+
+
+class TestTraitMemoryReport(unittest.TestCase):
+
+    def test_instance_report(self):
+        parent = Parent(child=Child(), items=[1, 2])
+
+        report = trait_memory_report(parent)
+
+        self.assertGreater(report['object'], 0)
+        self.assertGreater(report['obj_dict'], 0)
+        self.assertGreater(report['containers'], 0)
+        self.assertEqual(report['instance_traits'], 0)
+        self.assertEqual(report['notifiers'], 0)
+        self.assertEqual(report['listeners'], 0)
+        self.assertEqual(report['total'], sum(
+            size for name, size in report.items() if name != 'total'))
+
+    def test_report_does_not_create_parts(self):
+        parent = Parent()
+
+        trait_memory_report(parent)
+
+        self.assertEqual(parent._memory_parts()[1:], (None, None, None))
+
+    def test_notifiers_and_listeners(self):
+        parent = Parent(child=Child())
+        before = trait_memory_report(parent)
+
+        parent.on_trait_change(lambda: None, 'items')
+        parent.on_trait_change(lambda: None)
+        parent.on_trait_change(lambda: None, 'child.value')
+
+        report = trait_memory_report(parent)
+        self.assertEqual(report['instance_traits'], 0)
+        self.assertGreater(report['notifiers'], 0)
+        self.assertGreater(report['listeners'], 0)
+        self.assertGreater(report['total'], before['total'])
+
+    def test_class_report(self):
+        report = trait_memory_report(Parent)
+
+        for name in ('dicts', 'ctraits', 'handlers'):
+            self.assertGreater(report[name], 0)
+
+    def test_process_report(self):
+        parents = [Parent() for i in range(3)]
+
+        report = trait_memory_report()
+
+        self.assertEqual(report[Parent]['count'], 3)
+        self.assertEqual(report[Parent]['total'],
+                         3 * trait_memory_report(parents[0])['total'])
+        self.assertGreater(report[Parent]['class'], 0)
+
+    def test_invalid_argument(self):
+        with self.assertRaises(TypeError):
+            trait_memory_report(object())
+        with self.assertRaises(TypeError):
+            trait_memory_report(int)
+
+
+if __name__ == '__main__':
+    unittest.main()
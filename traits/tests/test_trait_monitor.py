@@ -0,0 +1,115 @@
+""" Tests for the object creation monitors of HasTraits.trait_monitor.
+"""
+
+from __future__ import absolute_import
+
+import gc
+import weakref
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import HasTraits, Int, trait_monitor_batch
+
+
+class Base(HasTraits):
+    value = Int
+
+
+class Derived(Base):
+    pass
+
+
+class Other(HasTraits):
+    pass
+
+
+class TestTraitMonitor(unittest.TestCase):
+
+    def setUp(self):
+        self.created = []
+        self.batches = []
+
+    def tearDown(self):
+        Base.trait_monitor(self.monitor, remove=True)
+        Derived.trait_monitor(self.monitor, remove=True)
+        Base.trait_monitor(self.batch_monitor, remove=True)
+
+    def monitor(self, object):
+        self.created.append(object)
+
+    def batch_monitor(self, objects):
+        self.batches.append(objects)
+
+    def test_monitor_subclasses(self):
+        Base.trait_monitor(self.monitor)
+
+        base = Base(value=1)
+        derived = Derived()
+        Other()
+
+        self.assertEqual(self.created, [base, derived])
+        self.assertEqual(base.value, 1)
+
+    def test_add_and_remove(self):
+        Base.trait_monitor(self.monitor)
+        Base.trait_monitor(self.monitor)
+        Derived.trait_monitor(self.monitor)
+        derived = Derived()
+        self.assertEqual(self.created, [derived, derived])
+
+        Base.trait_monitor(self.monitor, remove=True)
+        Derived()
+        Base()
+        self.assertEqual(len(self.created), 3)
+
+        Derived.trait_monitor(self.monitor, remove=True)
+        Derived()
+        self.assertEqual(len(self.created), 3)
+
+    def test_class_monitors_invalidated(self):
+        Base()
+        Base.trait_monitor(self.monitor)
+        base = Base()
+
+        self.assertEqual(self.created, [base])
+
+    def test_removed_monitor_released(self):
+        class Monitor(object):
+            def __call__(self, object):
+                pass
+
+        monitor = Monitor()
+        monitor_ref = weakref.ref(monitor)
+        Base.trait_monitor(monitor)
+        Base()
+        Base.trait_monitor(monitor, remove=True)
+        del monitor
+        gc.collect()
+
+        self.assertIsNone(monitor_ref())
+        self.assertNotIn('__class_monitors__', Base.__dict__)
+
+    def test_monitored_class_not_kept_alive(self):
+        Base.trait_monitor(self.monitor)
+        klass = type('Transient', (Base,), {})
+        klass()
+        klass_ref = weakref.ref(klass)
+        del klass, self.created[:]
+        gc.collect()
+
+        self.assertIsNone(klass_ref())
+
+    def test_batch(self):
+        Base.trait_monitor(self.batch_monitor, batch=True)
+
+        with trait_monitor_batch():
+            objects = [Base() for i in range(3)]
+            self.assertEqual(self.batches, [])
+        self.assertEqual(self.batches, [objects])
+
+        base = Base()
+        self.assertEqual(self.batches, [objects, [base]])
+
+
+if __name__ == '__main__':
+    unittest.main()
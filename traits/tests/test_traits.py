@@ -429,6 +429,22 @@ class PrefixMapTest(AnyTraitTest):
         return {'o': 'one', 'on': 'one', 'tw': 'two', 'th': 'three'}[value[:2]]
 
 
+class OverlappingPrefixListTrait(HasTraits):
+    value = Trait('no', TraitPrefixList('no', 'none', 'nothing', 'yes'))
+
+
+class OverlappingPrefixListTest(AnyTraitTest):
+    obj = OverlappingPrefixListTrait()
+
+    _default_value = 'no'
+    _good_values = ['no', 'non', 'none', 'not', 'nothing', 'y', 'yes']
+    _bad_values = ['', 'n', 'noo', 'nothings', 'x']
+
+    def coerce(self, value):
+        return {'no': 'no', 'non': 'none', 'none': 'none', 'not': 'nothing',
+                'nothing': 'nothing', 'y': 'yes', 'yes': 'yes'}[value]
+
+
 class IntRangeTrait(HasTraits):
     value = Trait(3, TraitRange(2, 5))
 
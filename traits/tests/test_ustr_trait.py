@@ -0,0 +1,70 @@
+""" Tests for the UStr trait and the HasUniqueStrings class.
+"""
+
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import HasTraits, List, Str
+from ..ustr_trait import HasUniqueStrings
+
+
+class Item(HasTraits):
+    name = Str(trait_value=True)
+
+
+class Owner(HasUniqueStrings):
+    items = List(Item, unique_string='name')
+
+
+def names(owner):
+    return [item.name for item in owner.items]
+
+
+class TestUStr(unittest.TestCase):
+
+    def test_unique_names(self):
+        owner = Owner(items=[Item(name='a'), Item(name='a')])
+        owner.items.extend([Item(name='a'), Item(name='b')])
+
+        self.assertEqual(names(owner), ['a', 'a_2', 'a_3', 'b'])
+
+    def test_explicit_suffixes_are_skipped(self):
+        owner = Owner()
+        owner.items.extend([Item(name='a_2'), Item(name='a'), Item(name='a'),
+                            Item(name='a')])
+
+        self.assertEqual(names(owner), ['a_2', 'a', 'a_3', 'a_4'])
+
+    def test_freed_names_are_reused(self):
+        owner = Owner()
+        owner.items.extend([Item(name='a') for i in range(4)])
+
+        del owner.items[1]
+        owner.items[1].name = 'b'
+        owner.items.extend([Item(name='a'), Item(name='a'), Item(name='a')])
+
+        self.assertEqual(sorted(names(owner)),
+                         ['a', 'a_2', 'a_3', 'a_4', 'a_5', 'b'])
+
+    def test_rename(self):
+        owner = Owner()
+        owner.items.extend([Item(name='a'), Item(name='b')])
+
+        owner.items[1].name = 'a'
+        self.assertEqual(names(owner), ['a', 'a_2'])
+
+        owner.items[0].name = 'c'
+        owner.items[1].name = 'a'
+        self.assertEqual(names(owner), ['c', 'a'])
+
+    def test_bulk_insert(self):
+        owner = Owner()
+        owner.items.extend([Item(name='item') for i in range(1000)])
+
+        self.assertEqual(len(set(names(owner))), 1000)
+        self.assertEqual(owner.items[-1].name, 'item_1000')
+
+
+if __name__ == '__main__':
+    unittest.main()
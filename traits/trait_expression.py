@@ -0,0 +1,175 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the compile_expression() function, which compiles Python
+    expressions through a process-wide cache of compiled code objects, and
+    the ExpressionEvaluator class, used to repeatedly evaluate expressions
+    against the traits of an object.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from threading import Lock
+from types import CodeType
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The default maximum number of compiled expressions kept in the cache:
+DEFAULT_CACHE_SIZE = 1024
+
+#-------------------------------------------------------------------------------
+#  'ExpressionCache' class:
+#-------------------------------------------------------------------------------
+
+class ExpressionCache ( object ):
+    """ A thread-safe, bounded cache of compiled expressions, which discards
+        the least recently used expression when it is full.
+    """
+
+    def __init__ ( self, size = DEFAULT_CACHE_SIZE ):
+        self._size  = size
+        self._codes = OrderedDict()
+        self._lock  = Lock()
+
+        #: The number of lookups which found the expression in the cache:
+        self.hits = 0
+
+        #: The number of lookups which compiled the expression:
+        self.misses = 0
+
+    def compile ( self, source ):
+        """ Returns the compiled form of the expression *source*.
+
+            Raises the same exceptions as the built-in compile() function if
+            *source* is not a valid expression.
+        """
+        key = ( type( source ), source )
+        with self._lock:
+            code = self._codes.pop( key, None )
+            if code is not None:
+                self._codes[ key ] = code
+                self.hits += 1
+                return code
+
+        code = compile( source, '<string>', 'eval' )
+
+        with self._lock:
+            self.misses += 1
+            self._codes[ key ] = code
+            while len( self._codes ) > self._size:
+                self._codes.popitem( last = False )
+
+        return code
+
+    def resize ( self, size ):
+        """ Sets the maximum number of compiled expressions kept.
+        """
+        with self._lock:
+            self._size = size
+            while len( self._codes ) > size:
+                self._codes.popitem( last = False )
+
+    def clear ( self ):
+        """ Discards all the compiled expressions.
+        """
+        with self._lock:
+            self._codes.clear()
+            self.hits = self.misses = 0
+
+    def __len__ ( self ):
+        return len( self._codes )
+
+# The process-wide cache of compiled expressions:
+expression_cache = ExpressionCache()
+
+#-------------------------------------------------------------------------------
+#  Compiles an expression using the process-wide cache:
+#-------------------------------------------------------------------------------
+
+def compile_expression ( source ):
+    """ Returns the compiled form of the Python expression *source*.
+
+        Expression strings are compiled at most once while they remain in the
+        process-wide cache of recently used expressions. Any other value
+        (such as an AST object) is compiled each time.
+    """
+    if isinstance( source, basestring ):
+        return expression_cache.compile( source )
+
+    return compile( source, '<string>', 'eval' )
+
+#-------------------------------------------------------------------------------
+#  '_ObjectNamespace' class:
+#-------------------------------------------------------------------------------
+
+class _ObjectNamespace ( dict ):
+    """ The local namespace of the expressions evaluated by an
+        ExpressionEvaluator: names which are not explicitly defined are looked
+        up as attributes of the object.
+    """
+
+    def __init__ ( self, object, names ):
+        super( _ObjectNamespace, self ).__init__( names )
+        self.object = object
+
+    def __missing__ ( self, name ):
+        try:
+            return getattr( self.object, name )
+        except AttributeError:
+            raise KeyError( name )
+
+#-------------------------------------------------------------------------------
+#  'ExpressionEvaluator' class:
+#-------------------------------------------------------------------------------
+
+class ExpressionEvaluator ( object ):
+    """ Evaluates Python expressions in the namespace of an object's traits.
+
+        Names used in an expression are looked up in the *names* passed to
+        the constructor, then as attributes of the object (so that the current
+        value of its traits is used), then in *globals* and finally in the
+        built-ins. For example::
+
+            evaluate = ExpressionEvaluator( rule, globals = vars( math ) )
+            for expression in rule.conditions:
+                if evaluate( expression ):
+                    ...
+
+        The namespace is only built once, so an evaluator is best kept and
+        reused to evaluate many expressions against the same object.
+    """
+
+    def __init__ ( self, object, globals = None, **names ):
+        """ Creates an evaluator for the traits of *object*.
+        """
+        self.object     = object
+        self.globals    = {} if globals is None else globals
+        self._namespace = _ObjectNamespace( object, names )
+
+    def __call__ ( self, expression ):
+        """ Returns the value of *expression*, which may be a string (which is
+            compiled through the process-wide cache) or a compiled expression,
+            such as the mapped value of an Expression trait.
+        """
+        if not isinstance( expression, CodeType ):
+            expression = compile_expression( expression )
+
+        return eval( expression, self.globals, self._namespace )
@@ -0,0 +1,257 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the helpers shared by the functions which work on graphs of
+    HasTraits objects (snapshots and dirty trait collection).
+
+    The graph of the objects reachable from a root object is walked once, and
+    then kept up to date from the objects which recorded changes (see
+    HasTraits.track_dirty_traits()), which are registered by the low-level
+    trait assignment code. So, as long as all the objects of a graph track
+    their changes, only the changed objects are visited again.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+from weakref import ref, WeakKeyDictionary, WeakSet
+
+from . import ctraits
+
+#-------------------------------------------------------------------------------
+#  Global Data:
+#-------------------------------------------------------------------------------
+
+# The objects which have recorded changes, and may not have been seen yet by
+# all the graphs:
+_changed_objects = WeakSet()
+
+# The serial number of the last change seen by each live graph:
+_graph_serials = WeakKeyDictionary()
+
+def _object_dirty ( object ):
+    """ Registers an object which starts recording changed traits.
+    """
+    _changed_objects.add( object )
+
+ctraits._dirty_handler( _object_dirty )
+
+#-------------------------------------------------------------------------------
+#  Returns the objects of a given class contained in a value:
+#-------------------------------------------------------------------------------
+
+def find_objects ( value, klass, objects ):
+    """ Appends all *klass* instances contained in *value* (directly, or in
+        lists, tuples, sets and dictionary values, recursively) to *objects*.
+    """
+    if isinstance( value, klass ):
+        objects.append( value )
+    elif isinstance( value, ( list, tuple, set, frozenset ) ):
+        for item in value:
+            find_objects( item, klass, objects )
+    elif isinstance( value, dict ):
+        for item in value.itervalues():
+            find_objects( item, klass, objects )
+
+#-------------------------------------------------------------------------------
+#  Returns the objects which changed since a given serial number:
+#-------------------------------------------------------------------------------
+
+def changed_objects ( since = None ):
+    """ Returns the objects which have recorded changes.
+
+        If *since* is None, returns the objects whose set of changed traits
+        is not empty. Otherwise, returns the objects which recorded a change
+        after the change with serial number *since* (see current_serial()),
+        even if their changes have been cleared since.
+    """
+    if since is None:
+        return [ object for object in list( _changed_objects )
+                 if len( object._trait_dirty() ) > 0 ]
+
+    return [ object for object in list( _changed_objects )
+             if object._trait_dirty_serial() > since ]
+
+def current_serial ( ):
+    """ Returns the serial number of the last change recorded by any object.
+    """
+    return ctraits._dirty_handler()
+
+#-------------------------------------------------------------------------------
+#  'TraitGraph' class:
+#-------------------------------------------------------------------------------
+
+class TraitGraph ( object ):
+    """ The graph of the HasTraits objects reachable from a root object
+        through their copyable traits.
+
+        update() walks the whole graph the first time, and afterwards only
+        the objects which changed since the previous update, provided every
+        object of the graph tracks its changes. Otherwise (or when an object
+        stops referring to another one) the whole graph is walked again.
+
+        The objects are only weakly referenced, so that the graph neither
+        keeps them alive nor mistakes a new object for a deleted one.
+    """
+
+    def __init__ ( self, root ):
+        # The objects of the graph:
+        self.nodes = WeakSet()
+
+        # The set of weak references to the objects referred to by each
+        # object (the reference to an object which has been deleted since
+        # records that it is no longer referred to):
+        self.children = WeakKeyDictionary()
+
+        # The set of objects referring to each object:
+        self.parents = WeakKeyDictionary()
+
+        # The serial number of the last change seen by the graph:
+        self.serial = 0
+
+        # Do all the objects of the graph track their changes?
+        self.tracked = False
+
+        # The root object of the graph:
+        self._root = ref( root )
+
+    def update ( self ):
+        """ Brings the graph up to date, and returns the list of the objects
+            which changed since the previous update, or None if the whole
+            graph was walked.
+        """
+        serial = current_serial()
+        if self.tracked and (len( self.nodes ) > 0):
+            changed = self._update_changed()
+        else:
+            changed = None
+
+        if changed is None:
+            self._walk_all()
+
+        self.serial = _graph_serials[ self ] = serial
+        _prune_changed_objects()
+
+        return changed
+
+    def objects ( self ):
+        """ Returns the objects of the graph.
+        """
+        return list( self.nodes )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _walk_all ( self ):
+        """ Walks the whole graph.
+        """
+        self.nodes.clear()
+        self.children.clear()
+        self.parents.clear()
+        self.tracked = True
+        root = self._root()
+        if root is not None:
+            self._add( [ root ] )
+
+    def _add ( self, todo ):
+        """ Adds the objects in *todo*, and the objects they refer to, to the
+            graph. Returns the list of added objects.
+        """
+        from .has_traits import HasTraits
+
+        nodes = self.nodes
+        added = []
+        while len( todo ) > 0:
+            object = todo.pop()
+            if object in nodes:
+                continue
+
+            children = _children( object, HasTraits )
+            nodes.add( object )
+            self.children[ object ] = set( [ ref( child )
+                                             for child in children ] )
+            for child in children:
+                self._add_parent( child, object )
+            self.tracked = self.tracked and object._trait_track_dirty()
+            added.append( object )
+            todo.extend( children )
+
+        return added
+
+    def _update_changed ( self ):
+        """ Updates the graph from the objects which changed since the
+            previous update. Returns the list of changed and added objects,
+            or None if the whole graph must be walked again.
+        """
+        from .has_traits import HasTraits
+
+        nodes   = self.nodes
+        changed = [ object for object in changed_objects( self.serial )
+                    if object in nodes ]
+        added   = []
+        for object in changed:
+            children     = _children( object, HasTraits )
+            new_children = set( [ ref( child ) for child in children ] )
+            old_children = self.children[ object ]
+            if not (old_children <= new_children):
+                # The object no longer refers to some object:
+                return None
+
+            for child in children:
+                if ref( child ) not in old_children:
+                    self._add_parent( child, object )
+            self.children[ object ] = new_children
+            added.extend( self._add( [ child for child in children
+                                       if child not in nodes ] ) )
+
+        if not self.tracked:
+            return None
+
+        return changed + added
+
+    def _add_parent ( self, object, parent ):
+        """ Records that *parent* refers to *object*.
+        """
+        parents = self.parents.get( object )
+        if parents is None:
+            parents = self.parents[ object ] = WeakSet()
+        parents.add( parent )
+
+#-- Private Helpers ------------------------------------------------------------
+
+def _children ( object, klass ):
+    """ Returns the *klass* objects referred to by the copyable traits of
+        *object*.
+    """
+    children = []
+    for name in object.copyable_trait_names():
+        find_objects( getattr( object, name ), klass, children )
+
+    return children
+
+def _prune_changed_objects ( ):
+    """ Forgets the changed objects which no graph still needs to see.
+    """
+    serials = _graph_serials.values()
+    if len( serials ) > 0:
+        floor = min( serials )
+    else:
+        floor = current_serial()
+
+    for object in list( _changed_objects ):
+        if ((object._trait_dirty_serial() <= floor) and
+            (len( object._trait_dirty() ) == 0)):
+            _changed_objects.discard( object )
@@ -45,6 +45,7 @@ from weakref import ref
 from .trait_base import (strx, SequenceTypes, Undefined, TypeTypes, ClassTypes,
     CoercableTypes, TraitsCache, class_of, Missing)
 from .trait_errors import TraitError, repr_type
+from .trait_expression import compile_expression
 
 from . import _py2to3
 
@@ -1615,6 +1616,40 @@ class TraitEnum ( TraitHandler ):
                            evaluate = trait.evaluate,
                            mode     = trait.mode or 'radio' )
 
+#-------------------------------------------------------------------------------
+#  Returns the table of values accepted by a prefix handler:
+#-------------------------------------------------------------------------------
+
+def _prefix_table ( keys ):
+    """ Returns a dictionary mapping each of the *keys*, and each unique
+        prefix of the string keys (i.e. a prefix of only one key), to the
+        corresponding key.
+
+        The dictionary is a flattened prefix tree: resolving a value only
+        takes a dictionary look-up (which the C validation code performs
+        directly), however many keys there are.
+    """
+    table = {}
+    for key in keys:
+        if isinstance( key, basestring ):
+            for i in xrange( len( key ) + 1 ):
+                prefix = key[:i]
+                if prefix in table:
+                    # The prefix is shared by several keys:
+                    table[ prefix ] = Undefined
+                else:
+                    table[ prefix ] = key
+
+    for prefix, key in table.items():
+        if key is Undefined:
+            del table[ prefix ]
+
+    # Exact matches take precedence over (ambiguous) prefix matches:
+    for key in keys:
+        table[ key ] = key
+
+    return table
+
 #-------------------------------------------------------------------------------
 #  'TraitPrefixList' class:
 #-------------------------------------------------------------------------------
@@ -1667,25 +1702,11 @@ class TraitPrefixList ( TraitHandler ):
         if (len( values ) == 1) and (type( values[0] ) in SequenceTypes):
             values = values[0]
         self.values  = values[:]
-        self.values_ = values_ = {}
-        for key in values:
-            values_[ key ] = key
+        self.values_ = values_ = _prefix_table( values )
         self.fast_validate = ( 10, values_, self.validate )
 
     def validate ( self, object, name, value ):
         try:
-            if value not in self.values_:
-                match = None
-                n     = len( value )
-                for key in self.values:
-                    if value == key[:n]:
-                        if match is not None:
-                           match = None
-                           break
-                        match = key
-                if match is None:
-                    self.error( object, name, value )
-                self.values_[ value ] = match
             return self.values_[ value ]
         except:
             self.error( object, name, value )
@@ -1824,25 +1845,11 @@ class TraitPrefixMap ( TraitMap ):
             the shadow trait attribute.
         """
         self.map  = map
-        self._map = _map = {}
-        for key in map.keys():
-            _map[ key ] = key
+        self._map = _map = _prefix_table( map.keys() )
         self.fast_validate = ( 10, _map, self.validate )
 
     def validate ( self, object, name, value ):
         try:
-            if value not in self._map:
-                match = None
-                n     = len( value )
-                for key in self.map.keys():
-                    if value == key[:n]:
-                        if match is not None:
-                           match = None
-                           break
-                        match = key
-                if match is None:
-                    self.error( object, name, value )
-                self._map[ value ] = match
             return self._map[ value ]
         except:
             self.error( object, name, value )
@@ -1864,7 +1871,9 @@ class TraitExpression ( TraitHandler ):
 
     def validate ( self, object, name, value ):
         try:
-            compile( value, '<string>', 'eval' )
+            # The compiled expression is cached, so that the 'post_setattr'
+            # call below does not compile it again:
+            compile_expression( value )
             return value
         except:
             self.error( object, name, value )
@@ -1876,7 +1885,7 @@ class TraitExpression ( TraitHandler ):
         return 'a valid Python expression'
 
     def mapped_value ( self, value ):
-        return compile( value, '<string>', 'eval' )
+        return compile_expression( value )
 
 #-------------------------------------------------------------------------------
 #  'TraitCompound' class:
@@ -2282,6 +2291,23 @@ def items_event ( ):
 
     return TraitList._items_event
 
+#-------------------------------------------------------------------------------
+#  Returns whether the items of a container value have already been validated:
+#-------------------------------------------------------------------------------
+
+def _is_validated_copy ( value, trait ):
+    """ Returns whether *value* is a detached copy (as made by ``copy.copy``
+        or ``copy.deepcopy``) of a container whose items were validated by the
+        same *trait* handler.
+
+        The items of such a copy do not need to be validated again when it
+        is assigned, so copying container traits (e.g. using
+        HasTraits.copy_traits() or HasTraits.clone_traits()) only costs a
+        copy of the underlying storage.
+    """
+    return ((getattr( value, 'trait', None ) is trait) and
+            (value.object() is None))
+
 #-------------------------------------------------------------------------------
 #  'TraitListObject' class:
 #-------------------------------------------------------------------------------
@@ -2301,7 +2327,8 @@ class TraitListObject ( list ):
         if trait.minlen <= len( value ) <= trait.maxlen:
             try:
                 validate = trait.item_trait.handler.validate
-                if validate is not None:
+                if ((validate is not None) and
+                    (not _is_validated_copy( value, trait ))):
                     value = [ validate( object, name, val ) for val in value ]
 
                 list.__setitem__(self, slice(0, 0), value )
@@ -2328,8 +2355,22 @@ class TraitListObject ( list ):
         if id_self in memo:
             return memo[ id_self ]
 
-        memo[ id_self ] = result = TraitListObject( self.trait, lambda: None,
-                         self.name, [ copy.deepcopy( x, memo ) for x in self ] )
+        memo[ id_self ] = result = self._detached_copy( [] )
+        list.extend( result, [ copy.deepcopy( x, memo ) for x in self ] )
+
+        return result
+
+    def __copy__ ( self ):
+        return self._detached_copy( self )
+
+    def _detached_copy ( self, value ):
+        """ Returns a copy of this list which is not attached to any object,
+            and whose contents are the already validated items of *value*.
+        """
+        result = TraitListObject.__new__( TraitListObject )
+        result.__dict__.update( self.__dict__ )
+        result.object = lambda: None
+        list.extend( result, value )
 
         return result
 
@@ -2720,7 +2761,8 @@ class TraitSetObject ( set ):
         # Validate and assign the initial set value:
         try:
             validate = trait.item_trait.handler.validate
-            if validate is not None:
+            if ((validate is not None) and
+                (not _is_validated_copy( value, trait ))):
                 value = [ validate( object, name, val ) for val in value ]
 
             super( TraitSetObject, self ).__init__( value )
@@ -2745,8 +2787,22 @@ class TraitSetObject ( set ):
         if id_self in memo:
             return memo[ id_self ]
 
-        memo[ id_self ] = result = TraitSetObject( self.trait, lambda: None,
-                         self.name, [ copy.deepcopy( x, memo ) for x in self ] )
+        memo[ id_self ] = result = self._detached_copy( [] )
+        set.update( result, [ copy.deepcopy( x, memo ) for x in self ] )
+
+        return result
+
+    def __copy__ ( self ):
+        return self._detached_copy( self )
+
+    def _detached_copy ( self, value ):
+        """ Returns a copy of this set which is not attached to any object,
+            and whose contents are the already validated items of *value*.
+        """
+        result = TraitSetObject.__new__( TraitSetObject )
+        result.__dict__.update( self.__dict__ )
+        result.object = lambda: None
+        set.update( result, value )
 
         return result
 
@@ -3060,7 +3116,10 @@ class TraitDictObject ( dict ):
             self.name_items = name + '_items'
 
         if len( value ) > 0:
-            dict.update( self, self._validate_dic( value ) )
+            if not _is_validated_copy( value, trait ):
+                value = self._validate_dic( value )
+
+            dict.update( self, value )
 
     def _send_trait_items_event(self, name, event, items_event=None):
         """ Send a TraitDictEvent to the owning object if there is one.
@@ -3076,8 +3135,24 @@ class TraitDictObject ( dict ):
         if id_self in memo:
             return memo[ id_self ]
 
-        memo[ id_self ] = result = TraitDictObject( self.trait, lambda: None,
-                         self.name, dict([ copy.deepcopy( x, memo ) for x in self.iteritems() ]) )
+        memo[ id_self ] = result = self._detached_copy( {} )
+        dict.update( result, [ copy.deepcopy( x, memo )
+                               for x in self.iteritems() ] )
+
+        return result
+
+    def __copy__ ( self ):
+        return self._detached_copy( self )
+
+    def _detached_copy ( self, value ):
+        """ Returns a copy of this dictionary which is not attached to any
+            object, and whose contents are the already validated items of
+            *value*.
+        """
+        result = TraitDictObject.__new__( TraitDictObject )
+        result.__dict__.update( self.__dict__ )
+        result.object = lambda: None
+        dict.update( result, value )
 
         return result
 
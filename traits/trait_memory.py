@@ -0,0 +1,254 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the trait_memory_report() function, reporting the memory used by
+    HasTraits objects and classes.
+
+    All sizes are in bytes, as reported by sys.getsizeof(). Only the shallow
+    sizes of the trait values are counted, and the objects which are usually
+    shared (such as the handlers called by notifiers) are not, so the reports
+    describe the overhead of each object, not everything it keeps alive.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import gc
+from sys import getsizeof
+from weakref import WeakKeyDictionary
+
+from .has_traits import (BaseTraits, ClassTraits, HasTraits, ListenerTraits,
+    PrefixTraits, ViewTraits)
+from .trait_handlers import TraitDictObject, TraitListObject, TraitSetObject
+from .traits import CTrait
+from .traits_listener import ListenerGroup, ListenerItem, TraitsListener
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The categories of the memory used by instances:
+INSTANCE_CATEGORIES = ( 'object', 'obj_dict', 'values', 'containers',
+                        'instance_traits', 'notifiers', 'listeners' )
+
+# The categories of the memory used by classes:
+CLASS_CATEGORIES = ( 'dicts', 'ctraits', 'handlers', 'notifiers' )
+
+# The class dictionaries of traits:
+CLASS_DICTS = ( BaseTraits, ClassTraits, PrefixTraits, ListenerTraits,
+                ViewTraits )
+
+# The trait list, dict and set classes:
+TRAIT_CONTAINERS = ( TraitListObject, TraitDictObject, TraitSetObject )
+
+#-------------------------------------------------------------------------------
+#  Reports the memory used by HasTraits objects and classes:
+#-------------------------------------------------------------------------------
+
+def trait_memory_report ( object = None ):
+    """ Reports the memory used by a HasTraits object, a HasTraits class, or
+        (if *object* is None) all the HasTraits objects of the process.
+
+        For an object, returns a dictionary with the number of bytes used by:
+
+        - 'object': the object itself.
+        - 'obj_dict': its attribute dictionary.
+        - 'values': the values in the attribute dictionary (shallow sizes).
+        - 'containers': the attributes referring the trait lists, dicts and
+          sets in its values back to the object.
+        - 'instance_traits': its instance trait dictionary and the cloned
+          CTraits in it.
+        - 'notifiers': the lists of notifiers of the object and of its
+          traits (and the side table of these lists), and the notifier
+          wrappers in them.
+        - 'listeners': the listeners created for its extended trait change
+          handlers (e.g. 'child.value').
+        - 'total': the sum of the above.
+
+        For a class, returns a dictionary with the number of bytes used by:
+
+        - 'dicts': its dictionaries of traits.
+        - 'ctraits': the CTraits in these dictionaries.
+        - 'handlers': the trait handlers of these CTraits.
+        - 'notifiers': the static notifier lists of these CTraits.
+        - 'total': the sum of the above.
+
+        For the process, returns a dictionary mapping each HasTraits class
+        with live instances to a dictionary with the number of instances
+        ('count'), the sum of the reports of the instances, and the total of
+        the report of the class ('class').
+
+        Raises a TypeError if *object* is neither a HasTraits object nor a
+        HasTraits class.
+    """
+    if object is None:
+        return _process_report()
+
+    if isinstance( object, type ) and issubclass( object, HasTraits ):
+        return _class_report( object )
+
+    if isinstance( object, HasTraits ):
+        return _instance_report( object )
+
+    raise TypeError( 'Expected a HasTraits object or class, or None, but got '
+                     '%r.' % ( object, ) )
+
+#-------------------------------------------------------------------------------
+#  Private functions:
+#-------------------------------------------------------------------------------
+
+def _shallow_size ( object ):
+    """ Returns the size of an object and of its attribute dictionary.
+    """
+    size = getsizeof( object )
+    attributes = getattr( object, '__dict__', None )
+    if isinstance( attributes, dict ):
+        size += getsizeof( attributes )
+
+    return size
+
+def _notifiers_size ( notifiers ):
+    """ Returns the size of a list of notifiers and of the wrappers in it.
+    """
+    if notifiers is None:
+        return 0
+
+    return getsizeof( notifiers ) + sum( _shallow_size( notifier )
+                                         for notifier in notifiers )
+
+def _listeners_size ( listeners, seen ):
+    """ Returns the size of the ListenerNotifyWrapper lists of an object and
+        of the listener trees they refer to.
+    """
+    size    = getsizeof( listeners )
+    pending = []
+    for wrappers in listeners.itervalues():
+        size += getsizeof( wrappers )
+        for wrapper in wrappers:
+            size += _shallow_size( wrapper )
+            pending.append( wrapper.listener )
+
+    while len( pending ) > 0:
+        listener = pending.pop()
+        if (listener is None) or (id( listener ) in seen):
+            continue
+
+        seen.add( id( listener ) )
+        size += _shallow_size( listener )
+        if isinstance( listener, ListenerGroup ):
+            pending.extend( listener.items )
+        elif isinstance( listener, ListenerItem ):
+            handler = listener.handler
+            if id( handler ) not in seen:
+                seen.add( id( handler ) )
+                size += _shallow_size( handler )
+            active = listener.active
+            if isinstance( active, WeakKeyDictionary ):
+                size += getsizeof( active.data )
+            pending.append( listener.next )
+
+    return size
+
+def _instance_report ( object ):
+    """ Returns the memory report of a HasTraits object.
+    """
+    obj_dict, itrait_dict, notifiers, inotifiers = object._memory_parts()
+    report = dict.fromkeys( INSTANCE_CATEGORIES, 0 )
+    report[ 'object' ] = getsizeof( object )
+
+    if obj_dict is not None:
+        report[ 'obj_dict' ] = getsizeof( obj_dict )
+        for name, value in obj_dict.iteritems():
+            if name == TraitsListener:
+                report[ 'listeners' ] = _listeners_size( value, set() )
+                continue
+
+            report[ 'values' ] += getsizeof( value )
+            if isinstance( value, TRAIT_CONTAINERS ):
+                report[ 'containers' ] += (getsizeof( value.__dict__ ) +
+                                           getsizeof( value.object ))
+
+    report[ 'notifiers' ] = _notifiers_size( notifiers )
+
+    if inotifiers is not None:
+        report[ 'notifiers' ] += getsizeof( inotifiers ) + sum(
+            _notifiers_size( trait_notifiers )
+            for trait_notifiers in inotifiers.itervalues() )
+
+    if itrait_dict is not None:
+        size = getsizeof( itrait_dict )
+        for trait in itrait_dict.itervalues():
+            size += getsizeof( trait )
+            report[ 'notifiers' ] += _notifiers_size( trait._notifiers( 0 ) )
+        report[ 'instance_traits' ] = size
+
+    report[ 'total' ] = sum( report[ name ] for name in INSTANCE_CATEGORIES )
+
+    return report
+
+def _class_report ( klass ):
+    """ Returns the memory report of a HasTraits class.
+    """
+    report  = dict.fromkeys( CLASS_CATEGORIES, 0 )
+    ctraits = {}
+    for name in CLASS_DICTS:
+        traits = klass.__dict__.get( name )
+        if traits is None:
+            continue
+
+        report[ 'dicts' ] += getsizeof( traits )
+        if name in ( BaseTraits, ClassTraits, PrefixTraits ):
+            for trait in traits.itervalues():
+                if isinstance( trait, CTrait ):
+                    ctraits[ id( trait ) ] = trait
+
+    handlers = {}
+    for trait in ctraits.itervalues():
+        report[ 'ctraits' ]   += getsizeof( trait )
+        report[ 'notifiers' ] += _notifiers_size( trait._notifiers( 0 ) )
+        handler = trait.handler
+        if handler is not None:
+            handlers[ id( handler ) ] = handler
+
+    report[ 'handlers' ] = sum( _shallow_size( handler )
+                                for handler in handlers.itervalues() )
+    report[ 'total' ] = sum( report[ name ] for name in CLASS_CATEGORIES )
+
+    return report
+
+def _process_report ( ):
+    """ Returns the memory report of all HasTraits objects of the process,
+        by class.
+    """
+    report = {}
+    for object in gc.get_objects():
+        if not isinstance( object, HasTraits ):
+            continue
+
+        klass = object.__class__
+        stats = report.get( klass )
+        if stats is None:
+            stats = report[ klass ] = dict.fromkeys( INSTANCE_CATEGORIES +
+                                                     ( 'total', ), 0 )
+            stats[ 'count' ] = 0
+            stats[ 'class' ] = _class_report( klass )[ 'total' ]
+
+        stats[ 'count' ] += 1
+        for name, size in _instance_report( object ).iteritems():
+            stats[ name ] += size
+
+    return report
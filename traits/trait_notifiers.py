@@ -25,8 +25,11 @@
 from __future__ import absolute_import
 
 import contextlib
+from collections import OrderedDict, deque
+from heapq import heappop, heappush
 from threading import local as thread_local
-from threading import Thread
+from threading import Condition, Lock, Thread
+from time import time
 from thread import get_ident
 import traceback
 from types import MethodType
@@ -251,6 +254,159 @@ push_exception_handler = notification_exception_handler._push_handler
 pop_exception_handler  = notification_exception_handler._pop_handler
 handle_exception       = notification_exception_handler._handle_exception
 
+#-------------------------------------------------------------------------------
+#  Returns the signature of the exception being handled:
+#-------------------------------------------------------------------------------
+
+# The source file of this module (used to skip the notifier frames of
+# tracebacks):
+_notifiers_file = __file__[:-1] if __file__[-4:] in ( '.pyc', '.pyo' ) \
+                  else __file__
+
+def _exception_signature ( object, trait_name ):
+    """ Returns the ( class, trait name, handler code, exception class ) tuple
+        identifying the exception being handled by a notification exception
+        handler.
+    """
+    excp_class, excp, tb = sys.exc_info()
+    code = None
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        if code.co_filename != _notifiers_file:
+            break
+        tb = tb.tb_next
+
+    return ( object.__class__, trait_name, code, excp_class )
+
+#-------------------------------------------------------------------------------
+#  'RateLimitedExceptionLogger' class:
+#-------------------------------------------------------------------------------
+
+class RateLimitedExceptionLogger ( object ):
+    """ A notification exception handler logging the exceptions like the
+        default handler, but at most *burst* times per *interval* seconds for
+        each ( class, trait name, handler, exception class ) signature.
+
+        The other exceptions are only counted, and the number of exceptions
+        suppressed since the last one logged is reported along with the next
+        one logged for the same signature. Use it with::
+
+            push_exception_handler( RateLimitedExceptionLogger() )
+    """
+
+    def __init__ ( self, interval = 60.0, burst = 1 ):
+        self.interval = interval
+        self.burst    = burst
+
+        # Mapping from signatures to [ start of the current interval, number
+        # of exceptions logged in it, number suppressed, total number ]:
+        self._counts = {}
+        self._lock   = Lock()
+
+    def __call__ ( self, object, trait_name, old, new ):
+        signature = _exception_signature( object, trait_name )
+        now       = time()
+        with self._lock:
+            counts = self._counts.get( signature )
+            if counts is None:
+                counts = self._counts[ signature ] = [ now, 0, 0, 0 ]
+            elif (now - counts[0]) >= self.interval:
+                counts[0] = now
+                counts[1] = 0
+
+            counts[3] += 1
+            if counts[1] >= self.burst:
+                counts[2] += 1
+                return
+
+            counts[1] += 1
+            suppressed, counts[2] = counts[2], 0
+
+        handler = notification_exception_handler
+        handler._log_exception( object, trait_name, old, new )
+        if suppressed > 0:
+            handler.traits_logger.warning(
+                '%d similar exceptions were not logged since the previous '
+                'one.' % suppressed )
+
+    def counts ( self ):
+        """ Returns a dictionary mapping the signature of each kind of
+            exception handled to the number of exceptions of this kind.
+        """
+        with self._lock:
+            return dict( ( signature, counts[3] )
+                         for signature, counts in self._counts.iteritems() )
+
+    def reset ( self ):
+        """ Forgets all the exceptions handled so far.
+        """
+        with self._lock:
+            self._counts.clear()
+
+#-------------------------------------------------------------------------------
+#  'ExceptionBuffer' class:
+#-------------------------------------------------------------------------------
+
+class ExceptionBuffer ( object ):
+    """ A notification exception handler collecting the exceptions into a
+        buffer for later inspection, instead of formatting them.
+
+        The buffer holds the last *max_size* ( object, trait_name, old, new,
+        exc_info ) records, and counts the records dropped to make room for
+        newer ones. Only the exception class and value are kept in 'exc_info'
+        (the traceback being None) unless *keep_traceback* is True, since
+        tracebacks keep all their frames alive.
+    """
+
+    def __init__ ( self, max_size = 1000, keep_traceback = False ):
+        self.keep_traceback = keep_traceback
+        self.dropped        = 0
+        self._records       = deque( maxlen = max_size )
+
+    def __call__ ( self, object, trait_name, old, new ):
+        exc_info = sys.exc_info()
+        if not self.keep_traceback:
+            exc_info = ( exc_info[0], exc_info[1], None )
+
+        records = self._records
+        if len( records ) == records.maxlen:
+            self.dropped += 1
+        records.append( ( object, trait_name, old, new, exc_info ) )
+
+    def __len__ ( self ):
+        return len( self._records )
+
+    def records ( self ):
+        """ Returns the list of the records in the buffer, oldest first.
+        """
+        return list( self._records )
+
+    def drain ( self ):
+        """ Returns the list of the records in the buffer, oldest first, and
+            empties the buffer.
+        """
+        records = []
+        try:
+            while True:
+                records.append( self._records.popleft() )
+        except IndexError:
+            pass
+
+        return records
+
+    def format ( self, records = None ):
+        """ Returns the list of the messages describing each of the *records*
+            (by default, those in the buffer).
+        """
+        if records is None:
+            records = self.records()
+
+        return [ 'Exception occurred in traits notification handler for '
+                 'object: %s, trait: %s, old value: %s, new value: %s\n%s' %
+                 ( object, trait_name, old, new,
+                   ''.join( traceback.format_exception( *exc_info ) ) )
+                 for object, trait_name, old, new, exc_info in records ]
+
 #-------------------------------------------------------------------------------
 #  Traits global notification event tracer:
 #-------------------------------------------------------------------------------
@@ -418,6 +574,11 @@ class TraitChangeNotifyWrapper(object):
     the decorator with the same name.
     """
 
+    # Large object graphs create many wrappers, so they have no __dict__
+    # (subclasses get one, unless they define __slots__ too):
+    __slots__ = ( 'object', 'name', 'owner', 'handler', 'notify_listener',
+                  'argument_transform', '__weakref__' )
+
     # The wrapper is called with the full set of argument, and we need to
     # create a tuple with the arguments that need to be sent to the event
     # handler, depending on the number of those.
@@ -510,6 +671,21 @@ class TraitChangeNotifyWrapper(object):
 
         return ((self.name is None) and (handler == self.handler))
 
+    def listener ( self ):
+        """ Returns the listener notified by the wrapper, or None if it has
+        been deleted.
+        """
+        if self.name is None:
+            return self.handler
+
+        object = self.object
+        if object is not None:
+            object = object()
+            if object is not None:
+                return getattr( object, self.name )
+
+        return None
+
     def listener_deleted ( self, ref ):
         # In multithreaded situations, it's possible for this method to
         # be called after, or concurrently with, the dispose method.
@@ -648,3 +824,596 @@ class NewTraitChangeNotifyWrapper ( TraitChangeNotifyWrapper ):
 
     def dispatch ( self, handler, *args ):
         Thread( target = handler, args = args ).start()
+
+#-------------------------------------------------------------------------------
+#  'DataflowScheduler' class:
+#-------------------------------------------------------------------------------
+
+class DataflowScheduler ( object ):
+    """ Runs the handlers registered with the 'dataflow' dispatch in
+    dependency order, once per transaction.
+
+    Instead of being run as soon as a trait changes, a dataflow handler is
+    queued until the end of the current transaction. A handler queued several
+    times during a transaction is only run once, with the arguments of the
+    last change. The queued handlers are run one at a time, and a handler is
+    only run when no other queued handler is known to (indirectly) trigger it,
+    so that it sees the final values of all its inputs.
+
+    The dependencies between the handlers are learned while running them: a
+    handler triggered by a change made by another handler depends on it. When
+    the known dependencies do not order the queued handlers (or they are
+    cyclic), the handlers are run in the order they were first queued.
+
+    A transaction is opened explicitly using dataflow_transaction(), or
+    implicitly by the change of a trait having dataflow handlers, in which
+    case it ends after the last dataflow handler of the trait is notified.
+    Transactions are local to the thread making the changes.
+    """
+
+    def __init__ ( self ):
+        # Mapping from a wrapper to the wrappers notified of the changes made
+        # by its handler:
+        self._graph = weakref.WeakKeyDictionary()
+        self._state = thread_local()
+
+    def begin ( self ):
+        """ Opens a (possibly nested) transaction.
+        """
+        state = self._get_state()
+        state.depth += 1
+
+    def end ( self ):
+        """ Closes a transaction, running the queued handlers if it is the
+        outermost one.
+        """
+        state = self._get_state()
+        state.depth -= 1
+        if state.depth == 0:
+            self.flush()
+
+    def schedule ( self, wrapper, handler, event ):
+        """ Queues a *handler* to be notified of a trait change *event* by a
+        *wrapper*.
+        """
+        state = self._get_state()
+        state.changed = True
+        for running in state.running:
+            self._graph.setdefault( running, weakref.WeakSet() ).add( wrapper )
+
+        entry = state.pending.get( handler )
+        if entry is None:
+            state.pending[ handler ] = entry = _DataflowEntry()
+        entry.wrappers.add( wrapper )
+        entry.wrapper = wrapper
+        entry.handler = handler
+        entry.event   = event
+
+        if (state.depth == 0) and wrapper.closes_transaction():
+            self.flush()
+
+    def flush ( self ):
+        """ Runs the queued handlers, including the handlers they trigger.
+        """
+        state   = self._get_state()
+        pending = state.pending
+        if (len( pending ) == 0) or (len( state.running ) > 0):
+            return
+
+        state.depth += 1
+        order = None
+        try:
+            while len( pending ) > 0:
+                # The order is only recomputed when a handler queues a
+                # handler (or learns a dependency):
+                if state.changed or (order is None):
+                    order         = self._sort( pending )
+                    state.changed = False
+
+                entry = pending.pop( order.pop() )
+                state.running = entry.wrappers
+                try:
+                    entry.wrapper.run( entry.handler, entry.event )
+                finally:
+                    state.running = ()
+        except:
+            pending.clear()
+            raise
+        finally:
+            state.depth -= 1
+
+    def _sort ( self, pending ):
+        """ Returns the queued handlers in reverse running order: a handler
+        runs after the queued handlers (indirectly) triggering it, and
+        otherwise in the order it was queued.
+        """
+        # Build the graph of the handlers reachable from the queued ones,
+        # merging the wrappers of a same handler (e.g. one per trait). The
+        # wrappers of deleted handlers are kept as separate nodes:
+        graph = self._graph
+        nodes = {}
+        stack = []
+        for handler, entry in pending.iteritems():
+            for wrapper in entry.wrappers:
+                nodes[ wrapper ] = handler
+                stack.append( wrapper )
+
+        successors = {}
+        while len( stack ) > 0:
+            wrapper = stack.pop()
+            targets = successors.setdefault( nodes[ wrapper ], set() )
+            for target in graph.get( wrapper, () ):
+                node = nodes.get( target )
+                if node is None:
+                    node = nodes[ target ] = target.listener() or target
+                    stack.append( target )
+                targets.add( node )
+
+        # Sort it topologically, picking the first queued handler whenever
+        # several handlers are ready. The handlers which are not queued are
+        # visited as soon as they are ready:
+        counts = dict.fromkeys( successors, 0 )
+        for targets in successors.itervalues():
+            for node in targets:
+                counts[ node ] += 1
+
+        position = dict( ( handler, i ) for i, handler in enumerate( pending ) )
+        ready    = []
+        for node, count in counts.iteritems():
+            if count == 0:
+                heappush( ready, ( position.get( node, -1 ), id( node ), node ) )
+
+        order   = []
+        visited = set()
+        while len( order ) < len( pending ):
+            if len( ready ) == 0:
+                # The remaining handlers are cyclic, so run the first queued:
+                node = next( handler for handler in pending
+                             if handler not in visited )
+                heappush( ready, ( position[ node ], id( node ), node ) )
+
+            node = heappop( ready )[2]
+            if node in visited:
+                continue
+
+            visited.add( node )
+            if node in position:
+                order.append( node )
+            for target in successors[ node ]:
+                counts[ target ] -= 1
+                if (counts[ target ] == 0) and (target not in visited):
+                    heappush( ready, ( position.get( target, -1 ), id( target ),
+                                       target ) )
+
+        order.reverse()
+
+        return order
+
+    def _get_state ( self ):
+        state = self._state
+        if not hasattr( state, 'pending' ):
+            state.pending = OrderedDict()
+            state.running = ()
+            state.depth   = 0
+            state.changed = False
+
+        return state
+
+class _DataflowEntry ( object ):
+    """ A handler queued by the dataflow scheduler.
+    """
+
+    __slots__ = ( 'wrappers', 'wrapper', 'handler', 'event' )
+
+    def __init__ ( self ):
+        self.wrappers = set()
+
+# The scheduler used by the 'dataflow' dispatch:
+dataflow_scheduler = DataflowScheduler()
+
+@contextlib.contextmanager
+def dataflow_transaction():
+    """ Context manager delaying the 'dataflow' handlers triggered by the
+    changes made in its body until its end, where each of them is run once,
+    in dependency order.
+    """
+    dataflow_scheduler.begin()
+    try:
+        yield
+    finally:
+        dataflow_scheduler.end()
+
+#-------------------------------------------------------------------------------
+#  'DataflowTraitChangeNotifyWrapper' class:
+#-------------------------------------------------------------------------------
+
+class DataflowTraitChangeNotifyWrapper ( TraitChangeNotifyWrapper ):
+    """ Dynamic change notify wrapper, dispatching through the dataflow
+    scheduler.
+
+    This class is in charge to dispatch trait change events to dynamic
+    listener, typically created using the `on_trait_change` method and the
+    `dispatch` parameter set to 'dataflow'.
+    """
+
+    def init ( self, handler, owner, target=None ):
+        self.notifiers = owner
+        return super( DataflowTraitChangeNotifyWrapper, self ).init(
+            handler, owner, target )
+
+    def run ( self, handler, event ):
+        """ Dispatch a queued trait change event to the listener.
+        """
+        object, trait_name, old, new = event
+        super( DataflowTraitChangeNotifyWrapper, self )._dispatch_change_event(
+            object, trait_name, old, new, handler )
+
+    def closes_transaction ( self ):
+        """ Returns whether the wrapper is the last dataflow wrapper of its
+        notifiers list, and so ends the transaction implicitly opened by a
+        trait change.
+        """
+        for notifier in reversed( self.notifiers ):
+            if isinstance( notifier, DataflowTraitChangeNotifyWrapper ):
+                return (notifier is self)
+
+        return True
+
+    def _dispatch_change_event(self, object, trait_name, old, new, handler):
+        """ Queue a trait change event for the listener. """
+
+        dataflow_scheduler.schedule( self, handler,
+                                     ( object, trait_name, old, new ) )
+
+#-------------------------------------------------------------------------------
+#  'DeferredQueue' class:
+#-------------------------------------------------------------------------------
+
+class DeferredQueue ( object ):
+    """ Holds the handlers registered with the 'deferred' dispatch until
+    flush_deferred() is called or a deferred_batch() ends.
+
+    Handlers are run by decreasing priority, and in the order they were
+    queued for equal priorities. A handler queued several times before being
+    run is only run once, with the arguments of the last change. Queues are
+    local to the thread making the changes.
+    """
+
+    def __init__ ( self ):
+        self._state = thread_local()
+
+    def schedule ( self, wrapper, handler, event ):
+        """ Queues a *handler* to be notified of a trait change *event* by a
+        *wrapper*.
+        """
+        state    = self._get_state()
+        priority = wrapper.priority
+        entry    = state.entries.get( handler )
+        if entry is not None:
+            if priority <= entry.priority:
+                entry.wrapper = wrapper
+                entry.event   = event
+                return
+
+            # Requeue the handler with the higher priority:
+            entry.handler = None
+
+        state.count += 1
+        state.entries[ handler ] = entry = _DeferredEntry(
+            priority, wrapper, handler, event )
+        heappush( state.heap, ( -priority, state.count, entry ) )
+
+    def begin ( self ):
+        """ Opens a (possibly nested) batch.
+        """
+        self._get_state().depth += 1
+
+    def end ( self ):
+        """ Closes a batch, running the queued handlers if it is the
+        outermost one.
+        """
+        state = self._get_state()
+        state.depth -= 1
+        if state.depth == 0:
+            self.flush()
+
+    def flush ( self ):
+        """ Runs the queued handlers, including the handlers they queue.
+        """
+        state = self._get_state()
+        if state.flushing:
+            return
+
+        heap    = state.heap
+        entries = state.entries
+        state.flushing = True
+        try:
+            while len( heap ) > 0:
+                entry = heappop( heap )[2]
+                if entry.handler is not None:
+                    del entries[ entry.handler ]
+                    entry.wrapper.run( entry.handler, entry.event )
+        finally:
+            state.flushing = False
+
+    def __len__ ( self ):
+        return len( self._get_state().entries )
+
+    def _get_state ( self ):
+        state = self._state
+        if not hasattr( state, 'heap' ):
+            state.heap     = []
+            state.entries  = {}
+            state.count    = 0
+            state.depth    = 0
+            state.flushing = False
+
+        return state
+
+class _DeferredEntry ( object ):
+    """ A handler queued by a deferred queue.
+    """
+
+    __slots__ = ( 'priority', 'wrapper', 'handler', 'event' )
+
+    def __init__ ( self, priority, wrapper, handler, event ):
+        self.priority = priority
+        self.wrapper  = wrapper
+        self.handler  = handler
+        self.event    = event
+
+# The queue used by the 'deferred' dispatch:
+deferred_queue = DeferredQueue()
+
+def flush_deferred ( ):
+    """ Runs the 'deferred' handlers queued by the current thread.
+    """
+    deferred_queue.flush()
+
+@contextlib.contextmanager
+def deferred_batch():
+    """ Context manager running the 'deferred' handlers queued by the current
+    thread at its end.
+    """
+    deferred_queue.begin()
+    try:
+        yield
+    finally:
+        deferred_queue.end()
+
+#-------------------------------------------------------------------------------
+#  'DeferredTraitChangeNotifyWrapper' class:
+#-------------------------------------------------------------------------------
+
+class DeferredTraitChangeNotifyWrapper ( TraitChangeNotifyWrapper ):
+    """ Dynamic change notify wrapper, dispatching through the deferred queue.
+
+    This class is in charge to dispatch trait change events to dynamic
+    listener, typically created using the `on_trait_change` method and the
+    `dispatch` parameter set to 'deferred'.
+    """
+
+    #: The priority of the listener in the deferred queue (set from the
+    #: `priority` argument of `on_trait_change`):
+    priority = 0
+
+    def run ( self, handler, event ):
+        """ Dispatch a queued trait change event to the listener.
+        """
+        object, trait_name, old, new = event
+        super( DeferredTraitChangeNotifyWrapper, self )._dispatch_change_event(
+            object, trait_name, old, new, handler )
+
+    def _dispatch_change_event(self, object, trait_name, old, new, handler):
+        """ Queue a trait change event for the listener. """
+
+        deferred_queue.schedule( self, handler,
+                                 ( object, trait_name, old, new ) )
+
+#-------------------------------------------------------------------------------
+#  'TimerScheduler' class:
+#-------------------------------------------------------------------------------
+
+class TimerScheduler ( object ):
+    """ Runs callbacks after a delay, on a single daemon thread shared by all
+    the 'debounce' and 'throttle' notifiers.
+
+    *clock* is the function returning the current time in seconds. If
+    *threaded* is False, no thread is started, and the due callbacks are
+    only run by calling run_due() (e.g. from an event loop, or a test).
+    """
+
+    def __init__ ( self, clock = time, threaded = True ):
+        #: The function returning the current time in seconds:
+        self.clock = clock
+
+        #: The lock protecting the scheduler and the state of the notifiers:
+        self.lock = Condition()
+
+        self._heap     = []
+        self._count    = 0
+        self._threaded = threaded
+        self._thread   = None
+
+    def call_later ( self, delay, callback ):
+        """ Calls *callback* (with no arguments) on the scheduler thread in
+        *delay* seconds.
+        """
+        with self.lock:
+            self._count += 1
+            heappush( self._heap,
+                      ( self.clock() + delay, self._count, callback ) )
+            if self._threaded and (self._thread is None):
+                self._thread = Thread( target = self._run,
+                                       name   = 'TraitsTimerScheduler' )
+                self._thread.daemon = True
+                self._thread.start()
+            self.lock.notify()
+
+    def run_due ( self ):
+        """ Runs the callbacks which are due in the current thread, and
+        returns their number.
+        """
+        count = 0
+        while True:
+            callback = self._pop_due()
+            if callback is None:
+                return count
+
+            self._call( callback )
+            count += 1
+
+    def _pop_due ( self ):
+        """ Removes and returns the first callback which is due, or returns
+        None if there is none.
+        """
+        with self.lock:
+            heap = self._heap
+            if (len( heap ) > 0) and (heap[0][0] <= self.clock()):
+                return heappop( heap )[2]
+
+        return None
+
+    def _call ( self, callback ):
+        try:
+            callback()
+        except Exception:
+            # The exception has already been given to the notification
+            # exception handler:
+            pass
+
+    def _run ( self ):
+        lock = self.lock
+        heap = self._heap
+        while True:
+            with lock:
+                while True:
+                    if len( heap ) == 0:
+                        lock.wait()
+                        continue
+
+                    delay = heap[0][0] - self.clock()
+                    if delay <= 0:
+                        callback = heappop( heap )[2]
+                        break
+
+                    lock.wait( delay )
+
+            self._call( callback )
+
+# The scheduler used by the 'debounce' and 'throttle' dispatch:
+timer_scheduler = TimerScheduler()
+
+def set_timer_scheduler ( scheduler ):
+    """ Sets the scheduler used by the 'debounce' and 'throttle' dispatch,
+    and returns the previous one.
+    """
+    global timer_scheduler
+
+    previous, timer_scheduler = timer_scheduler, scheduler
+
+    return previous
+
+#-------------------------------------------------------------------------------
+#  'TimedTraitChangeNotifyWrapper' class:
+#-------------------------------------------------------------------------------
+
+class TimedTraitChangeNotifyWrapper ( TraitChangeNotifyWrapper ):
+    """ Base class for the dynamic change notify wrappers dispatching the
+    latest trait change event on the timer scheduler thread.
+
+    The event is dispatched as soon as the scheduler runs it, unless a
+    subclass postpones it by setting the time it is due in `_changed`.
+
+    Only weak references to the listener and to the changed object are kept
+    while an event is pending, and the event is dropped if either has been
+    deleted when it is due.
+    """
+
+    #: The number of seconds events are coalesced for (set from the
+    #: `interval` argument of `on_trait_change`):
+    interval = 0.1
+
+    # The latest trait change event, not yet dispatched:
+    _event = None
+
+    # Has the dispatch of the event been scheduled?
+    _scheduled = False
+
+    # The time the last event was dispatched:
+    _last_dispatch = 0.0
+
+    # The time the pending event is due:
+    _due = 0.0
+
+    def _dispatch_change_event(self, object, trait_name, old, new, handler):
+        """ Keep the latest trait change event, and schedule its dispatch. """
+
+        scheduler = timer_scheduler
+        with scheduler.lock:
+            now = scheduler.clock()
+            self._event = ( weakref.ref( object ), trait_name, old, new )
+            self._changed( now )
+            if not self._scheduled:
+                self._scheduled = True
+                scheduler.call_later( self._due - now, self._timeout )
+
+    def _timeout ( self ):
+        """ Dispatches the latest trait change event, unless it is not due
+        yet.
+        """
+        scheduler = timer_scheduler
+        with scheduler.lock:
+            now   = scheduler.clock()
+            delay = self._due - now
+            if delay > 0:
+                scheduler.call_later( delay, self._timeout )
+                return
+
+            event, self._event  = self._event, None
+            self._scheduled     = False
+            self._last_dispatch = now
+
+        object  = event[0]()
+        handler = self.listener()
+        if (object is not None) and (handler is not None):
+            super( TimedTraitChangeNotifyWrapper, self )._dispatch_change_event(
+                object, event[1], event[2], event[3], handler )
+
+    def _changed ( self, now ):
+        """ Handles a new event occurring at time *now*, by setting the time
+        the pending event is due.
+        """
+        self._due = now
+
+#-------------------------------------------------------------------------------
+#  'DebounceTraitChangeNotifyWrapper' class:
+#-------------------------------------------------------------------------------
+
+class DebounceTraitChangeNotifyWrapper ( TimedTraitChangeNotifyWrapper ):
+    """ Dynamic change notify wrapper, dispatching the latest event once no
+    event has occurred for `interval` seconds.
+
+    This class is in charge to dispatch trait change events to dynamic
+    listener, typically created using the `on_trait_change` method and the
+    `dispatch` parameter set to 'debounce'.
+    """
+
+    def _changed ( self, now ):
+        self._due = now + self.interval
+
+#-------------------------------------------------------------------------------
+#  'ThrottleTraitChangeNotifyWrapper' class:
+#-------------------------------------------------------------------------------
+
+class ThrottleTraitChangeNotifyWrapper ( TimedTraitChangeNotifyWrapper ):
+    """ Dynamic change notify wrapper, dispatching the latest event at most
+    once every `interval` seconds.
+
+    This class is in charge to dispatch trait change events to dynamic
+    listener, typically created using the `on_trait_change` method and the
+    `dispatch` parameter set to 'throttle'.
+    """
+
+    def _changed ( self, now ):
+        self._due = self._last_dispatch + self.interval
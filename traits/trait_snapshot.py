@@ -0,0 +1,419 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the TraitSnapshot class, an immutable, structurally shared view
+    of the trait values of a graph of HasTraits objects, and the diff()
+    function used to compare two snapshots.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import sys
+from weakref import ref, WeakKeyDictionary
+
+from .trait_base import Missing
+from .trait_graph import TraitGraph, current_serial
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The most recent snapshot node taken of each HasTraits object:
+_last_snapshots = WeakKeyDictionary()
+
+# The graph of the objects reachable from each object snapshot() was called
+# with:
+_snapshot_graphs = WeakKeyDictionary()
+
+#-------------------------------------------------------------------------------
+#  'TraitSnapshot' class:
+#-------------------------------------------------------------------------------
+
+class TraitSnapshot ( object ):
+    """ An immutable snapshot of the copyable trait values of a HasTraits
+        object.
+
+        Trait values which are HasTraits objects are replaced by their own
+        TraitSnapshot, lists and tuples by tuples, sets by frozensets,
+        dictionaries by FrozenDict objects and numpy arrays by read-only
+        copies. All other values are captured by reference: a snapshot (and
+        diff()) only sees that such a value was replaced by another one, not
+        the changes made to it in place (e.g. to the attributes of an object
+        held by an Instance trait which is not a HasTraits object).
+
+        A snapshot of an object whose trait values (and the trait values of
+        all the objects it refers to) have not changed since the previous
+        snapshot reuses the previous TraitSnapshot node, so unchanged
+        subgraphs are shared between successive snapshots.
+    """
+
+    __slots__ = ( '_klass', '_source', '_values', '_serial', '__weakref__' )
+
+    def __init__ ( self, object, serial = 0 ):
+        set_attr = super( TraitSnapshot, self ).__setattr__
+        set_attr( '_klass', object.__class__ )
+        set_attr( '_source', ref( object ) )
+        set_attr( '_values', {} )
+
+        # The serial number of the last change recorded when the snapshot was
+        # taken:
+        set_attr( '_serial', serial )
+
+    #-- Public Methods ---------------------------------------------------------
+
+    @property
+    def klass ( self ):
+        """ The class of the object the snapshot was taken of.
+        """
+        return self._klass
+
+    def source ( self ):
+        """ Returns the object the snapshot was taken of, or None if it no
+            longer exists.
+        """
+        return self._source()
+
+    def trait_names ( self ):
+        """ Returns the names of the traits captured by the snapshot.
+        """
+        return self._values.keys()
+
+    def get ( self, name, default = None ):
+        return self._values.get( name, default )
+
+    def items ( self ):
+        return self._values.items()
+
+    #-- Container Methods ------------------------------------------------------
+
+    def __getitem__ ( self, name ):
+        return self._values[ name ]
+
+    def __contains__ ( self, name ):
+        return name in self._values
+
+    def __iter__ ( self ):
+        return iter( self._values )
+
+    def __len__ ( self ):
+        return len( self._values )
+
+    #-- Attribute Access -------------------------------------------------------
+
+    def __getattr__ ( self, name ):
+        try:
+            return self._values[ name ]
+        except KeyError:
+            raise AttributeError( "'%s' snapshot has no trait '%s'" % (
+                                  self._klass.__name__, name ) )
+
+    def __setattr__ ( self, name, value ):
+        raise AttributeError( 'TraitSnapshot objects are immutable' )
+
+    def __delattr__ ( self, name ):
+        raise AttributeError( 'TraitSnapshot objects are immutable' )
+
+    def __repr__ ( self ):
+        return '<TraitSnapshot of %s object at 0x%x>' % (
+               self._klass.__name__, id( self ) )
+
+#-------------------------------------------------------------------------------
+#  'FrozenDict' class:
+#-------------------------------------------------------------------------------
+
+class FrozenDict ( dict ):
+    """ A read-only dictionary used to capture dictionary trait values.
+    """
+
+    def _immutable ( self, *args, **kw ):
+        raise TypeError( 'FrozenDict objects are immutable' )
+
+    __setitem__ = __delitem__ = clear = update = setdefault = pop = \
+        popitem = _immutable
+
+#-------------------------------------------------------------------------------
+#  Takes a snapshot of a graph of HasTraits objects:
+#-------------------------------------------------------------------------------
+
+def snapshot ( root ):
+    """ Returns a TraitSnapshot of the HasTraits object *root* and of all the
+        HasTraits objects reachable from it through its trait values.
+    """
+    from .has_traits import HasTraits
+
+    graph = _snapshot_graphs.get( root )
+    if graph is None:
+        graph = _snapshot_graphs[ root ] = TraitGraph( root )
+
+    # Only the objects which changed since the previous snapshot of the graph
+    # need to be checked, unless the whole graph was walked. The objects
+    # referring to an object whose last snapshot was taken since (through
+    # another graph) are checked too, as their own last snapshot may refer to
+    # an older one:
+    previous = graph.serial
+    serial   = current_serial()
+    changed  = graph.update()
+    if changed is None:
+        todo = graph.objects()
+    else:
+        todo = list( changed )
+
+    # An object's previous snapshot can be reused only if its own values are
+    # unchanged and every object it refers to can reuse its snapshot too. (The
+    # objects visited are kept alive until the end, so their ids are unique):
+    states = {}
+    stale  = {}
+    while len( todo ) > 0:
+        object = todo.pop()
+        if id( object ) in states:
+            continue
+
+        values = _trait_values( object )
+        states[ id( object ) ] = ( object, values )
+        last   = _last_snapshots.get( object )
+        if (last is None) or (not _same_values( values, last._values,
+                                                HasTraits )):
+            stale[ id( object ) ] = object
+        elif (changed is None) or (last._serial <= previous):
+            continue
+
+        todo.extend( graph.parents.get( object, () ) )
+
+    todo = stale.values()
+    while len( todo ) > 0:
+        for parent in graph.parents.get( todo.pop(), () ):
+            if id( parent ) not in stale:
+                stale[ id( parent ) ] = parent
+                todo.append( parent )
+
+    # Create the new snapshot nodes first, so that reference cycles between
+    # objects can be captured, then fill in their values:
+    objects = stale.values()
+    nodes   = {}
+    for object in objects:
+        nodes[ id( object ) ] = TraitSnapshot( object, serial )
+
+    for object in objects:
+        node  = nodes[ id( object ) ]
+        state = states.get( id( object ) )
+        if state is None:
+            values = _trait_values( object )
+        else:
+            values = state[1]
+        for name, value in values.iteritems():
+            node._values[ name ] = _freeze( value, nodes, HasTraits )
+
+        _last_snapshots[ object ] = node
+
+    return _last_snapshots[ root ]
+
+#-------------------------------------------------------------------------------
+#  Compares two snapshots:
+#-------------------------------------------------------------------------------
+
+def diff ( snapshot_a, snapshot_b ):
+    """ Returns the differences between two snapshots.
+
+        Parameters
+        ----------
+        snapshot_a, snapshot_b : TraitSnapshot
+            The snapshots to compare, normally two snapshots taken of the same
+            object at different times.
+
+        Returns
+        -------
+        changes : list of ( path, old, new ) tuples
+            One entry for each changed trait. *path* is a tuple of the trait
+            names and list indices leading from the root object to the changed
+            trait, and *old* and *new* are its values in *snapshot_a* and
+            *snapshot_b*.
+
+        Description
+        -----------
+        Subgraphs which are shared by both snapshots are skipped, so the cost
+        of a diff is proportional to the size of the changed part of the
+        graphs. Snapshots of the same object are compared trait by trait;
+        a reference to a different object is reported as a change of the
+        trait holding it.
+    """
+    changes = []
+    _diff_nodes( snapshot_a, snapshot_b, (), changes, set() )
+
+    return changes
+
+#-- Private Helpers ------------------------------------------------------------
+
+def _trait_values ( object ):
+    """ Returns the dictionary of the copyable trait values of an object.
+    """
+    return dict( [ ( name, getattr( object, name ) )
+                   for name in object.copyable_trait_names() ] )
+
+def _ndarray ( ):
+    """ Returns the numpy array class, or None if numpy has not been imported
+        (in which case no trait value can be an array).
+    """
+    return getattr( sys.modules.get( 'numpy' ), 'ndarray', None )
+
+def _equal ( value_a, value_b ):
+    """ Returns whether two trait values (or captured values) are equal.
+    """
+    ndarray = _ndarray()
+    if ((ndarray is not None) and (isinstance( value_a, ndarray ) or
+                                   isinstance( value_b, ndarray ))):
+        try:
+            return bool( sys.modules[ 'numpy' ].array_equal( value_a,
+                                                             value_b ) )
+        except:
+            return False
+
+    try:
+        return bool( value_a == value_b )
+    except:
+        # Treat incomparable values as different:
+        return False
+
+def _freeze ( value, nodes, klass ):
+    """ Returns the immutable snapshot form of a trait value.
+    """
+    if isinstance( value, klass ):
+        node = nodes.get( id( value ) )
+        if node is None:
+            node = _last_snapshots[ value ]
+
+        return node
+
+    if isinstance( value, ( list, tuple ) ):
+        return tuple( [ _freeze( item, nodes, klass ) for item in value ] )
+
+    if isinstance( value, ( set, frozenset ) ):
+        return frozenset( [ _freeze( item, nodes, klass ) for item in value ] )
+
+    if isinstance( value, dict ):
+        return FrozenDict( [ ( key, _freeze( item, nodes, klass ) )
+                             for key, item in value.iteritems() ] )
+
+    ndarray = _ndarray()
+    if (ndarray is not None) and isinstance( value, ndarray ):
+        frozen = value.copy()
+        frozen.flags.writeable = False
+
+        return frozen
+
+    return value
+
+def _same_values ( values, frozen_values, klass ):
+    """ Returns whether the trait values in the *values* dictionary are the
+        same as those captured in *frozen_values*.
+    """
+    if len( values ) != len( frozen_values ):
+        return False
+
+    for name, value in values.iteritems():
+        if ((name not in frozen_values) or
+            (not _same( value, frozen_values[ name ], klass ))):
+            return False
+
+    return True
+
+def _same ( value, frozen, klass ):
+    """ Returns whether a trait value is the same as its previously captured
+        snapshot form.
+    """
+    if isinstance( value, klass ):
+        return frozen is _last_snapshots.get( value )
+
+    if isinstance( value, ( list, tuple ) ):
+        if (not isinstance( frozen, tuple )) or (len( value ) != len( frozen )):
+            return False
+
+        for item, frozen_item in zip( value, frozen ):
+            if not _same( item, frozen_item, klass ):
+                return False
+
+        return True
+
+    if isinstance( value, ( set, frozenset ) ):
+        if ((not isinstance( frozen, frozenset )) or
+            (len( value ) != len( frozen ))):
+            return False
+
+        return frozenset( [ _last_snapshots.get( item )
+                            if isinstance( item, klass ) else item
+                            for item in value ] ) == frozen
+
+    if isinstance( value, dict ):
+        if ((not isinstance( frozen, FrozenDict )) or
+            (len( value ) != len( frozen ))):
+            return False
+
+        for key, item in value.iteritems():
+            if (key not in frozen) or (not _same( item, frozen[ key ], klass )):
+                return False
+
+        return True
+
+    if value is frozen:
+        return True
+
+    return _equal( value, frozen )
+
+def _diff_nodes ( node_a, node_b, path, changes, visited ):
+    """ Appends the changes between two snapshots of the same object to
+        *changes*.
+    """
+    if node_a is node_b:
+        return
+
+    key = ( id( node_a ), id( node_b ) )
+    if key in visited:
+        return
+
+    visited.add( key )
+
+    values_a = node_a._values
+    values_b = node_b._values
+    for name in sorted( set( values_a ) | set( values_b ) ):
+        _diff_values( values_a.get( name, Missing ),
+                      values_b.get( name, Missing ), path + ( name, ),
+                      changes, visited )
+
+def _diff_values ( value_a, value_b, path, changes, visited ):
+    """ Appends the changes between two captured trait values to *changes*.
+    """
+    if value_a is value_b:
+        return
+
+    if isinstance( value_a, TraitSnapshot ) and isinstance( value_b,
+                                                            TraitSnapshot ):
+        if value_a._source() is value_b._source():
+            _diff_nodes( value_a, value_b, path, changes, visited )
+            return
+
+    elif (isinstance( value_a, tuple ) and isinstance( value_b, tuple ) and
+          (len( value_a ) == len( value_b ))):
+        for i, ( item_a, item_b ) in enumerate( zip( value_a, value_b ) ):
+            _diff_values( item_a, item_b, path + ( i, ), changes, visited )
+        return
+
+    elif not ( isinstance( value_a, TraitSnapshot ) or
+               isinstance( value_b, TraitSnapshot ) ):
+        if _equal( value_a, value_b ):
+            return
+
+    changes.append( ( path, value_a, value_b ) )
@@ -28,7 +28,7 @@ import datetime
 import operator
 import re
 import sys
-from os.path import isfile, isdir
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary
 from types import FunctionType, MethodType, ModuleType
 
 from . import trait_handlers
@@ -45,6 +45,10 @@ from .traits import (Trait, trait_from, _TraitMaker, _InstanceArgs, code_editor,
 
 from .trait_errors import TraitError
 
+from .trait_expression import compile_expression
+
+from .path_validation import stat_cache
+
 from . import _py2to3
 
 #-------------------------------------------------------------------------------
@@ -1231,7 +1235,7 @@ class Delegate ( TraitType ):
     metadata = { 'type': 'delegate', 'transient': False }
 
     def __init__ ( self, delegate, prefix = '', modify = False,
-                         listenable = True, **metadata ):
+                         listenable = True, cached = False, **metadata ):
         """ Creates a Delegate trait.
         """
         if prefix == '':
@@ -1248,6 +1252,7 @@ class Delegate ( TraitType ):
         metadata[ '_delegate' ]   = delegate
         metadata[ '_prefix' ]     = prefix
         metadata[ '_listenable' ] = listenable
+        metadata[ '_cached' ]     = cached and (listenable is not False)
 
         super( Delegate, self ).__init__( **metadata )
 
@@ -1255,6 +1260,7 @@ class Delegate ( TraitType ):
         self.prefix      = prefix
         self.prefix_type = prefix_type
         self.modify      = modify
+        self.cached      = metadata[ '_cached' ]
 
     def as_ctrait ( self ):
         """ Returns a CTrait corresponding to the trait defined by this class.
@@ -1262,6 +1268,8 @@ class Delegate ( TraitType ):
         trait = super( Delegate, self ).as_ctrait()
         trait.delegate( self.delegate, self.prefix, self.prefix_type,
                         self.modify )
+        if self.cached:
+            trait.cache_delegate( True )
 
         return trait
 
@@ -1274,7 +1282,8 @@ class DelegatesTo ( Delegate ):
         pattern.
     """
 
-    def __init__ ( self, delegate, prefix = '', listenable = True, **metadata ):
+    def __init__ ( self, delegate, prefix = '', listenable = True,
+                         cached = False, **metadata ):
         """ Creates a "delegator" trait, whose definition and default value are
             delegated to a *delegate* trait attribute on another object.
 
@@ -1289,6 +1298,13 @@ class DelegatesTo ( Delegate ):
             listenable : bool
                 Indicates whether a listener can be attached to this attribute
                 such that changes to the delagate attribute will trigger it.
+            cached : bool
+                Indicates whether the delegated value should be cached on the
+                object after the first read, instead of being looked up on the
+                delegate object each time. The cached value is discarded when
+                the delegate listener reports a change, so this requires
+                *listenable* to be True. See the Description for the
+                restrictions which apply.
 
             Description
             -----------
@@ -1315,11 +1331,19 @@ class DelegatesTo ( Delegate ):
             Note that any changes to the delegator attribute are actually
             applied to the corresponding attribute on the delegate object. The
             original object containing the delegator trait is not modified.
+
+            A *cached* delegator is only kept up to date by change
+            notifications. It should only be used when the delegate attribute
+            is always changed in a way that sends a notification (i.e., not
+            using trait_setq(), and not a Property without 'depends_on'
+            metadata), and when every delegator in a chain of delegations is
+            also cached.
         """
         super( DelegatesTo, self ).__init__( delegate,
                                              prefix     = prefix,
                                              modify     = True,
                                              listenable = listenable,
+                                             cached     = cached,
                                              **metadata )
 
 #-------------------------------------------------------------------------------
@@ -1332,7 +1356,7 @@ class PrototypedFrom ( Delegate ):
     """
 
     def __init__ ( self, prototype, prefix = '', listenable = True,
-                         **metadata ):
+                         cached = False, **metadata ):
         """ Creates a "prototyped" trait, whose definition and default value are
             obtained from a trait attribute on another object.
 
@@ -1348,6 +1372,13 @@ class PrototypedFrom ( Delegate ):
                 Indicates whether a listener can be attached to this attribute
                 such that changes to the corresponding attribute on the
                 prototype object will trigger it.
+            cached : bool
+                Indicates whether the prototyped value should be cached on the
+                object after the first read, instead of being looked up on the
+                prototype object each time. The cached value is discarded when
+                the delegate listener reports a change, so this requires
+                *listenable* to be True. See the Description for the
+                restrictions which apply.
 
             Description
             -----------
@@ -1376,11 +1407,18 @@ class PrototypedFrom ( Delegate ):
             original object, not the prototype object. The prototype object is
             only used to define to trait type and default value.
 
+            A *cached* prototyped attribute is only kept up to date by change
+            notifications. It should only be used when the prototype attribute
+            is always changed in a way that sends a notification (i.e., not
+            using trait_setq(), and not a Property without 'depends_on'
+            metadata), and when every prototyped attribute in a chain of
+            prototypes is also cached.
         """
         super( PrototypedFrom, self ).__init__( prototype,
                                                 prefix     = prefix,
                                                 modify     = False,
                                                 listenable = listenable,
+                                                cached     = cached,
                                                 **metadata )
 
 #-------------------------------------------------------------------------------
@@ -1406,7 +1444,7 @@ class Expression ( TraitType ):
         """ Validates that a specified value is valid for this trait.
         """
         try:
-            return compile( value, '<string>', 'eval' )
+            return compile_expression( value )
         except:
             self.error( object, name, value )
 
@@ -1418,7 +1456,7 @@ class Expression ( TraitType ):
     def mapped_value ( self, value ):
         """ Returns the 'mapped' value for the specified **value**.
         """
-        return compile( value, '<string>', 'eval' )
+        return compile_expression( value )
 
     def as_ctrait ( self ):
         """ Returns a CTrait corresponding to the trait defined by this class.
@@ -1484,11 +1522,13 @@ class BaseFile ( BaseStr ):
         """ Validates that a specified value is valid for this trait.
 
             Note: The 'fast validator' version performs this check in C.
+            The existence of the file is checked using the cache of file
+            system queries in traits.path_validation.
         """
         validated_value = super( BaseFile, self ).validate( object, name, value )
         if not self.exists:
             return validated_value
-        elif isfile( value ):
+        elif stat_cache.isfile( value ):
             return validated_value
 
         self.error( object, name, value )
@@ -1577,11 +1617,13 @@ class BaseDirectory ( BaseStr ):
         """ Validates that a specified value is valid for this trait.
 
             Note: The 'fast validator' version performs this check in C.
+            The existence of the directory is checked using the cache of file
+            system queries in traits.path_validation.
         """
         if not self.exists:
             return super( BaseDirectory, self ).validate( object, name, value )
 
-        if isdir( value ):
+        if stat_cache.isdir( value ):
             return value
 
         self.error( object, name, value )
@@ -2668,6 +2710,31 @@ AdaptMap = {
    'default': 2
 }
 
+# The classes which have been resolved from their names, keyed by
+# ( module name, class name ), shared by all traits referring to them. An
+# entry is only reused while it is still the class defined by its module (so
+# reloading the module resolves the new class), and does not keep the class
+# alive:
+_resolved_classes = WeakValueDictionary()
+
+# The BaseInstance traits whose class has not been resolved yet, mapped to the
+# set of CTraits created from them (whose validator is updated to use the
+# C-level fast validator once the class is resolved):
+_unresolved_traits = WeakKeyDictionary()
+
+# The unresolved BaseInstance traits, indexed by the ( module name, class name )
+# of the class they refer to, so that resolving a class only visits the traits
+# waiting for that class:
+_unresolved_classes = {}
+
+def _resolve_pending_classes ( key ):
+    """ Resolves the class of all unresolved BaseInstance traits waiting for
+        the class with the specified ( module name, class name ) key, once
+        it has been found.
+    """
+    for handler in list( _unresolved_classes.pop( key, () ) ):
+        handler._resolve_defined_class()
+
 class BaseClass ( TraitType ):
     """ Base class for types which have an associated class which can be
         determined dynamically by specifying a string name for the class (e.g.
@@ -2692,15 +2759,27 @@ class BaseClass ( TraitType ):
     def validate_class ( self, klass ):
         return klass
 
-    def find_class ( self, klass ):
-        module = self.module
-        col    = klass.rfind( '.' )
+    def _class_key ( self, klass ):
+        """ Returns the ( module name, class name ) key of the specified class
+            name.
+        """
+        col = klass.rfind( '.' )
         if col >= 0:
-            module = klass[ : col ]
-            klass = klass[ col + 1: ]
+            return ( klass[ : col ], klass[ col + 1: ] )
+
+        return ( self.module, klass )
+
+    def find_class ( self, klass, import_module = True ):
+        col           = klass.rfind( '.' )
+        key           = self._class_key( klass )
+        module, klass = key
+        theClass      = _resolved_classes.get( key )
+        current  = getattr( sys.modules.get( module ), klass, None )
+        if (theClass is not None) and (current is theClass):
+            return theClass
 
-        theClass = getattr( sys.modules.get( module ), klass, None )
-        if (theClass is None) and (col >= 0):
+        theClass = current
+        if (theClass is None) and (col >= 0) and import_module:
             try:
                 mod = __import__( module )
                 for component in module.split( '.' )[1:]:
@@ -2710,6 +2789,9 @@ class BaseClass ( TraitType ):
             except:
                 pass
 
+        if theClass is not None:
+            _resolved_classes[ key ] = theClass
+
         return theClass
 
     def validate_failed ( self, object, name, value ):
@@ -2916,6 +2998,25 @@ class BaseInstance ( BaseClass ):
 
         return ( dvt, dv )
 
+    def as_ctrait ( self ):
+        """ Returns a CTrait corresponding to the trait defined by this class.
+        """
+        trait = super( BaseInstance, self ).as_ctrait()
+
+        # Remember the trait, so that its validator can be updated once the
+        # class is resolved (except for property-style traits):
+        if (isinstance( self.klass, basestring ) and
+            (getattr( self, 'get', None ) is None) and
+            (getattr( self, 'set', None ) is None)):
+            traits = _unresolved_traits.get( self )
+            if traits is None:
+                traits = _unresolved_traits[ self ] = WeakSet()
+                _unresolved_classes.setdefault( self._class_key( self.klass ),
+                                                WeakSet() ).add( self )
+            traits.add( trait )
+
+        return trait
+
     def create_editor ( self ):
         """ Returns the default traits UI editor for this type of trait.
         """
@@ -2934,6 +3035,9 @@ class BaseInstance ( BaseClass ):
             if klass is None:
                 raise TraitError, 'Unable to locate class: ' + args[0]
 
+            # Resolve the traits waiting for the class (including this one):
+            _resolve_pending_classes( self._class_key( args[0] ) )
+
         return klass( *args[1:], **kw )
 
     #: fixme: Do we still need this method using the new style?...
@@ -2949,7 +3053,12 @@ class BaseInstance ( BaseClass ):
         pass
 
     def resolve_class ( self, object, name, value ):
+        key = self._class_key( self.klass )
         super( BaseInstance, self ).resolve_class( object, name, value )
+        self._update_fast_validate()
+
+        # Resolve the other traits waiting for the same class:
+        _resolve_pending_classes( key )
 
         #: fixme: The following is quite ugly, because it wants to try and fix
         #: the trait referencing this handler to use the 'fast path' now that the
@@ -2981,6 +3090,30 @@ class BaseInstance ( BaseClass ):
         if handler.fast_validate is not None:
             trait.set_validate( handler.fast_validate )
 
+    def _resolve_defined_class ( self ):
+        """ Resolves the class of the trait if it is already defined (without
+            importing any module).
+        """
+        if isinstance( self.klass, basestring ):
+            klass = self.validate_class( self.find_class( self.klass, False ) )
+            if klass is None:
+                return
+
+            self.klass = klass
+
+        self._update_fast_validate()
+
+    def _update_fast_validate ( self ):
+        """ Sets up the C-level fast validator once the class is resolved, and
+            makes all the CTraits created from the trait use it.
+        """
+        self.init_fast_validate()
+        traits = _unresolved_traits.pop( self, () )
+        if self.fast_validate is not None:
+            for trait in traits:
+                if trait.handler is self:
+                    trait.set_validate( self.fast_validate )
+
 class Instance ( BaseInstance ):
     """ Defines a trait whose value must be an instance of a specified class,
         or one of its subclasses using a C-level fast validator.
@@ -35,7 +35,8 @@ from types import MethodType
 from .has_traits import HasPrivateTraits
 from .trait_base import Undefined, Uninitialized
 from .traits import Property
-from .trait_types import Str, Int, Bool, Instance, List, Enum, Any
+from .trait_types import (Str, Int, Bool, Either, Float, Instance, List, Enum,
+    Any)
 from .trait_errors import TraitError
 from .trait_notifiers import TraitChangeNotifyWrapper
 
@@ -148,6 +149,10 @@ class ListenerBase ( HasPrivateTraits ):
     # The dispatch mechanism to use when invoking the handler:
     #dispatch = Str
 
+    # The number of seconds used by the 'debounce' and 'throttle' dispatch
+    # (None for the default):
+    #interval = Either( None, Float )
+
     # Does the handler go at the beginning (True) or end (False) of the
     # notification handlers list?
     #priority = Bool( False )
@@ -258,9 +263,14 @@ class ListenerItem ( ListenerBase ):
     #: The dispatch mechanism to use when invoking the handler:
     dispatch = Str
 
+    #: The number of seconds used by the 'debounce' and 'throttle' dispatch
+    #: (None for the default):
+    interval = Either( None, Float )
+
     #: Does the handler go at the beginning (True) or end (False) of the
-    #: notification handlers list?
-    priority = Bool( False )
+    #: notification handlers list? (An integer is also the priority of the
+    #: handler for the 'deferred' dispatch.)
+    priority = Either( Bool( False ), Int )
 
     #: The next level (if any) of ListenerBase object to be called when any of
     #: this object's listened-to traits is changed:
@@ -611,6 +621,16 @@ class ListenerItem ( ListenerBase ):
         if self.next is not None:
             self.next.priority = priority
 
+    #---------------------------------------------------------------------------
+    #  Handles the 'interval' trait being changed:
+    #---------------------------------------------------------------------------
+
+    def _interval_changed ( self, interval ):
+        """ Handles the **interval** trait being changed.
+        """
+        if self.next is not None:
+            self.next.interval = interval
+
     #-- Private Methods --------------------------------------------------------
 
     #---------------------------------------------------------------------------
@@ -626,6 +646,7 @@ class ListenerItem ( ListenerBase ):
                 handler,
                 remove=remove,
                 dispatch=self.dispatch,
+                interval=self.interval,
                 priority=self.priority,
                 target=self._get_target(),
             )
@@ -648,6 +669,7 @@ class ListenerItem ( ListenerBase ):
                     name,
                     remove=remove,
                     dispatch=self.dispatch,
+                    interval=self.interval,
                     priority=self.priority,
                     target=self._get_target(),
                 )
@@ -670,6 +692,7 @@ class ListenerItem ( ListenerBase ):
                         name,
                         remove=remove,
                         dispatch=self.dispatch,
+                        interval=self.interval,
                         priority=self.priority,
                         target=self._get_target(),
                     )
@@ -718,6 +741,7 @@ class ListenerItem ( ListenerBase ):
                     name,
                     remove=remove,
                     dispatch=self.dispatch,
+                    interval=self.interval,
                     priority=self.priority,
                     target=self._get_target(),
                 )
@@ -728,6 +752,7 @@ class ListenerItem ( ListenerBase ):
                         name + '_items',
                         remove=remove,
                         dispatch=self.dispatch,
+                        interval=self.interval,
                         priority=self.priority,
                         target=self._get_target(),
                     )
@@ -738,6 +763,7 @@ class ListenerItem ( ListenerBase ):
                         name + '_items',
                         remove=remove,
                         dispatch=self.dispatch,
+                        interval=self.interval,
                         priority=self.priority,
                         target=self._get_target(),
                     )
@@ -757,6 +783,7 @@ class ListenerItem ( ListenerBase ):
                         name,
                         remove=remove,
                         dispatch=self.dispatch,
+                        interval=self.interval,
                         priority=self.priority,
                         target=self._get_target(),
                     )
@@ -767,6 +794,7 @@ class ListenerItem ( ListenerBase ):
                             name + '_items',
                             remove=remove,
                             dispatch=self.dispatch,
+                            interval=self.interval,
                             priority=self.priority,
                             target=self._get_target(),
                         )
@@ -776,6 +804,7 @@ class ListenerItem ( ListenerBase ):
                             name + '_items',
                             remove=remove,
                             dispatch=self.dispatch,
+                            interval=self.interval,
                             priority=self.priority,
                             target=self._get_target(),
                         )
@@ -836,6 +865,7 @@ class ListenerItem ( ListenerBase ):
                     name,
                     remove=remove,
                     dispatch=self.dispatch,
+                    interval=self.interval,
                     priority=self.priority,
                     target=self._get_target(),
                 )
@@ -846,6 +876,7 @@ class ListenerItem ( ListenerBase ):
                         name + '_items',
                         remove=remove,
                         dispatch=self.dispatch,
+                        interval=self.interval,
                         priority=self.priority,
                         target=self._get_target(),
                     )
@@ -865,6 +896,7 @@ class ListenerItem ( ListenerBase ):
                         name,
                         remove=remove,
                         dispatch=self.dispatch,
+                        interval=self.interval,
                         priority=self.priority,
                         target=self._get_target(),
                     )
@@ -875,6 +907,7 @@ class ListenerItem ( ListenerBase ):
                             name + '_items',
                             remove=remove,
                             dispatch=self.dispatch,
+                            interval=self.interval,
                             priority=self.priority,
                             target=self._get_target(),
                         )
@@ -884,6 +917,7 @@ class ListenerItem ( ListenerBase ):
             name,
             remove=remove,
             dispatch=self.dispatch,
+            interval=self.interval,
             priority=self.priority,
             target=self._get_target(),
         )
@@ -893,6 +927,7 @@ class ListenerItem ( ListenerBase ):
             name + '_items',
             remove=remove,
             dispatch=self.dispatch,
+            interval=self.interval,
             priority=self.priority,
             target=self._get_target(),
         )
@@ -982,6 +1017,10 @@ class ListenerGroup ( ListenerBase ):
     #: The dispatch mechanism to use when invoking the handler:
     dispatch = Property
 
+    #: The number of seconds used by the 'debounce' and 'throttle' dispatch
+    #: (None for the default):
+    interval = ListProperty
+
     #: Does the handler go at the beginning (True) or end (False) of the
     #: notification handlers list?
     priority = ListProperty
@@ -1343,6 +1382,8 @@ class ListenerNotifyWrapper ( TraitChangeNotifyWrapper ):
 
 class ListenerHandler ( object ):
 
+    __slots__ = ( 'object', 'name', 'handler', '__weakref__' )
+
     def __init__ ( self, handler ):
         if type( handler ) is MethodType:
             object = handler.im_self
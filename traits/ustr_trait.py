@@ -57,10 +57,18 @@ class UStr ( TraitType ):
         self.list_name = list_name
         self.str_name  = str_name
         self.ustr_type = TypeValue( self )
-        self.names     = dict( [ ( getattr( item, str_name ), item )
-                                 for item in getattr( owner, list_name ) ] )
-        self.roots     = {}
+
+        # The index of the items by name, kept up to date as items are added
+        # to, removed from or renamed in the list:
+        self.names = {}
+
+        # The last suffix generated for each base name:
+        self.roots = {}
+
+        # The generated suffixes freed by removed or renamed items, for each
+        # base name:
         self.available = {}
+
         owner.on_trait_change( self._items_modified, list_name + '[]' )
 
     def validate ( self, object, name, value ):
@@ -72,34 +80,44 @@ class UStr ( TraitType ):
             if names.get( old_name ) is object:
                 self._remove( old_name )
 
-            if value not in names:
-                names[ value ] = object
-                return value
-
-            available = self.available.get( value )
-            while True:
-                if available is None:
-                    new_value = None
-                    break
+            value          = self._unique_name( value )
+            names[ value ] = object
 
-                index = available.pop()
-                if len( available ) == 0:
-                    del self.available[ value ]
-                    available = None
+            return value
 
-                new_value = '%s_%d' % ( value, index )
-                if new_value not in names:
-                    break
-
-            if new_value is None:
-                self.roots[ value ] = index = \
-                    self.roots.setdefault( value, 1 ) + 1
-                new_value = '%s_%d' % ( value, index )
+        self.error( object, name, value )
 
-            names[ new_value ] = object
-            return new_value
+    def _unique_name ( self, value ):
+        """ Returns *value*, or the first free name made of *value* and a
+            numeric suffix if it is already used.
 
-        self.error( object, name, value )
+            Freed suffixes are reused first, then new suffixes are generated
+            in increasing order, so that finding a free name takes constant
+            time on average, however many items share the same base name.
+        """
+        names = self.names
+        if value not in names:
+            return value
+
+        available = self.available.get( value )
+        while available:
+            new_value = '%s_%d' % ( value, available.pop() )
+            if len( available ) == 0:
+                del self.available[ value ]
+            if new_value not in names:
+                return new_value
+
+        # Skip over the suffixed names assigned explicitly:
+        index = self.roots.get( value, 1 )
+        while True:
+            index    += 1
+            new_value = '%s_%d' % ( value, index )
+            if new_value not in names:
+                break
+
+        self.roots[ value ] = index
+
+        return new_value
 
     def _remove ( self, name ):
         """ Removes a specified name.
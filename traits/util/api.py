@@ -1,9 +1,13 @@
 __all__ = [
     'deprecated',
     'import_symbol',
+    'profile_events',
     'record_events',
+    'ring_buffer_tracing',
 ]
 
 from .deprecated import deprecated
+from .event_profiler import profile_events
 from .event_tracer import record_events
 from .import_symbol import import_symbol
+from .ring_buffer_tracer import ring_buffer_tracing
@@ -0,0 +1,377 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+""" Profile trait change notifications in single and multi-threaded
+environments.
+
+"""
+import pstats
+import random
+import threading
+from contextlib import contextmanager
+from timeit import default_timer
+
+from traits import trait_notifiers
+
+
+# Indices of the fields of a statistics entry:
+COUNT, CUMULATIVE, SELF, MAX, MAX_DEPTH, EXCEPTIONS = range(6)
+
+# Indices of the fields of a pending change event entry:
+(EVENT_ID, EVENT_SIGNATURE, EVENT_KEY, EVENT_HANDLERS, EVENT_LISTENERS,
+ EVENT_SAMPLED) = range(6)
+
+
+def _handler_function(handler):
+    """ Return the function implementing a change handler.
+
+    Bound methods are created anew for every notification, so their
+    underlying function is used to identify them.
+
+    """
+    return getattr(handler, 'im_func', handler)
+
+
+def _handler_name(function):
+    return getattr(function, '__name__', repr(function))
+
+
+class _ThreadProfile(object):
+    """ The profiling state and statistics of a single thread.
+
+    """
+
+    def __init__(self):
+        #: The handler calls in progress: [key, start time, time in children].
+        self.stack = []
+        #: The change events being dispatched at each nesting depth:
+        #: [dispatch number, event signature, (class, trait name), number of
+        #: handlers called, listeners notified, whether the event is sampled].
+        self.pending = []
+        #: The number of change event dispatches seen so far.
+        self.dispatches = 0
+        #: The number of nested handler calls which are not being sampled.
+        self.skipping = 0
+        #: Statistics entries keyed by (class, trait name, handler function).
+        self.stats = {}
+        #: Histograms of the number of handlers called per change event, keyed
+        #: by (class, trait name).
+        self.fanout = {}
+        #: Histogram of the nesting depth of handler calls.
+        self.depths = {}
+
+    def flush(self, depth=0):
+        """ Record the fan-out of the change events at or below *depth*.
+
+        """
+        fanout = self.fanout
+        for event in self.pending[depth:]:
+            if event[EVENT_SAMPLED]:
+                histogram = fanout.setdefault(event[EVENT_KEY], {})
+                count = event[EVENT_HANDLERS]
+                histogram[count] = histogram.get(count, 0) + 1
+        del self.pending[depth:]
+
+
+class ChangeEventProfiler(object):
+    """ A thread aware, low overhead trait change notification profiler.
+
+    The profiler collects, for each (class, trait, handler) combination, the
+    number of handler calls, their cumulative time (including nested
+    notifications), their self time (excluding nested notifications), the
+    maximum time of a single call, the maximum nesting depth and the number
+    of calls which raised an exception. It also collects the histogram of the
+    number of handlers notified of each change event (the listener fan-out)
+    and the histogram of the nesting depth of handler calls.
+
+    Nothing is formatted while profiling: the results are only converted to
+    reports when requested.
+
+    """
+
+    def __init__(self, sample_rate=1.0):
+        """ Object constructor
+
+        Parameters
+        ----------
+        sample_rate : float
+            The fraction of top-level change events which are profiled. All
+            the handlers notified of a profiled change event, and the handler
+            calls nested in its dispatch, are profiled.
+
+        """
+        self.sample_rate = sample_rate
+        self._thread_local = threading.local()
+        self._profiles = []
+        self._profiles_lock = threading.Lock()
+
+    def pre_tracer(self, obj, name, old, new, handler):
+        """ The traits pre event tracer.
+
+        This method should be set as the global pre event tracer for traits.
+
+        """
+        profile = self._get_profile()
+        if profile.skipping:
+            profile.skipping += 1
+            return
+
+        stack = profile.stack
+        depth = len(stack)
+
+        # Handler calls belong to the change event being dispatched at the
+        # same depth, unless the event differs or the listener has already
+        # been notified of it (the same change repeated, e.g. an Event fired
+        # several times), in which case a new dispatch starts:
+        signature = (id(obj), name, id(old), id(new))
+        listener = (id(getattr(handler, 'im_self', None)),
+                    _handler_function(handler))
+        pending = profile.pending
+        if len(pending) > depth:
+            event = pending[depth]
+            if (event[EVENT_SIGNATURE] != signature or
+                    listener in event[EVENT_LISTENERS]):
+                profile.flush(depth)
+                event = None
+        else:
+            event = None
+
+        if event is None:
+            # Top-level change events are sampled once, for all their
+            # handlers:
+            sampled = (depth > 0 or self.sample_rate >= 1.0 or
+                       random.random() < self.sample_rate)
+            profile.dispatches += 1
+            event = [profile.dispatches, signature, (obj.__class__, name), 0,
+                     set(), sampled]
+            pending.append(event)
+
+        event[EVENT_LISTENERS].add(listener)
+        if not event[EVENT_SAMPLED]:
+            profile.skipping += 1
+            return
+
+        event[EVENT_HANDLERS] += 1
+        stack.append([(obj.__class__, name, _handler_function(handler)),
+                      default_timer(), 0.0])
+
+    def post_tracer(self, obj, name, old, new, handler, exception=None):
+        """ The traits post event tracer.
+
+        This method should be set as the global post event tracer for traits.
+
+        """
+        now = default_timer()
+        profile = self._get_profile()
+        if profile.skipping:
+            profile.skipping -= 1
+            return
+
+        stack = profile.stack
+        if len(stack) == 0:
+            # The profiler was installed while a handler was running.
+            return
+
+        key, start, child_time = stack.pop()
+        elapsed = now - start
+        depth = len(stack)
+
+        entry = profile.stats.get(key)
+        if entry is None:
+            entry = profile.stats[key] = [0, 0.0, 0.0, 0.0, 0, 0]
+        entry[COUNT] += 1
+        entry[CUMULATIVE] += elapsed
+        entry[SELF] += elapsed - child_time
+        if elapsed > entry[MAX]:
+            entry[MAX] = elapsed
+        if depth > entry[MAX_DEPTH]:
+            entry[MAX_DEPTH] = depth
+        if exception is not None:
+            entry[EXCEPTIONS] += 1
+
+        depths = profile.depths
+        depths[depth] = depths.get(depth, 0) + 1
+
+        if depth > 0:
+            stack[-1][2] += elapsed
+
+        # The change events dispatched by the handler are complete:
+        if len(profile.pending) > depth + 1:
+            profile.flush(depth + 1)
+
+    def stats(self):
+        """ Return the handler call statistics.
+
+        Returns
+        -------
+        stats : dict
+            A dictionary mapping (class name, trait name, handler name) tuples
+            to dictionaries with the 'count', 'cumulative_time', 'self_time',
+            'max_time', 'max_depth' and 'exceptions' of the handler calls.
+
+        """
+        result = {}
+        for key, entry in self._merged_stats().iteritems():
+            klass, name, function = key
+            result[(klass.__name__, name, _handler_name(function))] = dict(
+                count=entry[COUNT],
+                cumulative_time=entry[CUMULATIVE],
+                self_time=entry[SELF],
+                max_time=entry[MAX],
+                max_depth=entry[MAX_DEPTH],
+                exceptions=entry[EXCEPTIONS],
+            )
+        return result
+
+    def fanout(self):
+        """ Return the listener fan-out histograms.
+
+        Returns
+        -------
+        fanout : dict
+            A dictionary mapping (class name, trait name) tuples to
+            histograms, themselves dictionaries mapping a number of handlers
+            to the number of change events which notified that many handlers.
+
+        """
+        result = {}
+        for profile in self._get_profiles():
+            profile.flush()
+            for (klass, name), histogram in profile.fanout.iteritems():
+                merged = result.setdefault((klass.__name__, name), {})
+                for count, events in histogram.iteritems():
+                    merged[count] = merged.get(count, 0) + events
+        return result
+
+    def depths(self):
+        """ Return the histogram of the nesting depth of handler calls.
+
+        Returns
+        -------
+        depths : dict
+            A dictionary mapping a nesting depth (0 for handlers notified of
+            a change made outside of any handler) to a number of handler
+            calls.
+
+        """
+        result = {}
+        for profile in self._get_profiles():
+            for depth, calls in profile.depths.iteritems():
+                result[depth] = result.get(depth, 0) + calls
+        return result
+
+    def pstats(self):
+        """ Return the handler call statistics as a `pstats.Stats` object.
+
+        This makes it possible to sort and print the statistics using the
+        standard library tools, e.g. ``profiler.pstats().print_stats()``.
+        Each (class, trait, handler) combination appears as a function named
+        "<class>.<trait> -> <handler>", located at the source of the handler.
+
+        """
+        return pstats.Stats(_PstatsSource(self._pstats_entries()))
+
+    def _pstats_entries(self):
+        """ Return the handler call statistics in the `pstats` format.
+
+        """
+        stats = {}
+        for key, entry in self._merged_stats().iteritems():
+            klass, name, function = key
+            code = getattr(function, 'func_code', None)
+            if code is None:
+                filename, lineno = '~', 0
+            else:
+                filename, lineno = code.co_filename, code.co_firstlineno
+            label = '%s.%s -> %s' % (klass.__name__, name,
+                                     _handler_name(function))
+            count = entry[COUNT]
+            stats[(filename, lineno, label)] = (
+                count, count, entry[SELF], entry[CUMULATIVE], {})
+        return stats
+
+    def clear(self):
+        """ Discard all the statistics collected so far.
+
+        """
+        with self._profiles_lock:
+            for profile in self._profiles:
+                profile.stats = {}
+                profile.fanout = {}
+                profile.depths = {}
+                del profile.pending[len(profile.stack):]
+
+    def _merged_stats(self):
+        merged = {}
+        for profile in self._get_profiles():
+            for key, entry in profile.stats.iteritems():
+                total = merged.get(key)
+                if total is None:
+                    merged[key] = list(entry)
+                else:
+                    total[COUNT] += entry[COUNT]
+                    total[CUMULATIVE] += entry[CUMULATIVE]
+                    total[SELF] += entry[SELF]
+                    total[MAX] = max(total[MAX], entry[MAX])
+                    total[MAX_DEPTH] = max(total[MAX_DEPTH], entry[MAX_DEPTH])
+                    total[EXCEPTIONS] += entry[EXCEPTIONS]
+        return merged
+
+    def _get_profiles(self):
+        with self._profiles_lock:
+            return list(self._profiles)
+
+    def _get_profile(self):
+        try:
+            return self._thread_local.profile
+        except AttributeError:
+            profile = self._thread_local.profile = _ThreadProfile()
+            with self._profiles_lock:
+                self._profiles.append(profile)
+            return profile
+
+
+class _PstatsSource(object):
+    """ The statistics source object expected by `pstats.Stats`.
+
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+@contextmanager
+def profile_events(sample_rate=1.0):
+    """ Multi-threaded trait change notification profiler.
+
+    Usage
+    -----
+    ::
+
+        >>> from traits.util.event_profiler import profile_events
+        >>> with profile_events() as profiler:
+        ...     my_model.some_trait = True
+        >>> profiler.stats()
+        >>> profiler.pstats().sort_stats('time').print_stats(10)
+
+    This will install tracers that profile all the trait change handlers
+    called while the context is active, then restore the previous tracers.
+
+    """
+    profiler = ChangeEventProfiler(sample_rate=sample_rate)
+    with trait_notifiers.change_event_tracers(
+            profiler.pre_tracer, profiler.post_tracer):
+        yield profiler
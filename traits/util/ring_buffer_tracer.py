@@ -0,0 +1,415 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+""" Record trait change events into fixed-size, per-thread binary ring
+buffers.
+
+Unlike the tracers in `traits.util.event_tracer`, which keep every record as
+a Python object and format it as text, this tracer stores compact binary
+records of a fixed size, so that it uses a bounded amount of memory and can
+be left on in production. The most recent records can be dumped to a file at
+any time, and decoded offline using `load_trace`, or from the command line
+using::
+
+    python -m traits.util.ring_buffer_tracer <trace file>
+
+"""
+import json
+import struct
+import sys
+import threading
+import warnings
+from collections import namedtuple
+from contextlib import contextmanager
+
+from traits import trait_notifiers
+
+
+def _monotonic_timer():
+    """ Return a monotonic clock, or None if none is available.
+
+    Python 2 has no ``time.monotonic``, so on Linux the POSIX
+    ``clock_gettime(CLOCK_MONOTONIC)`` is called through ctypes instead.
+
+    """
+    try:
+        from time import monotonic
+    except ImportError:
+        pass
+    else:
+        return monotonic
+
+    if not sys.platform.startswith('linux'):
+        return None
+
+    import ctypes
+    import ctypes.util
+
+    class timespec(ctypes.Structure):
+        _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+    try:
+        librt = ctypes.CDLL(ctypes.util.find_library('rt') or 'librt.so.1')
+        clock_gettime = librt.clock_gettime
+    except (OSError, AttributeError):
+        return None
+    clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(timespec)]
+    clock_gettime.restype = ctypes.c_int
+    CLOCK_MONOTONIC = 1
+
+    def monotonic():
+        value = timespec()
+        clock_gettime(CLOCK_MONOTONIC, ctypes.byref(value))
+        return value.tv_sec + value.tv_nsec * 1e-9
+
+    if clock_gettime(CLOCK_MONOTONIC, ctypes.byref(timespec())) != 0:
+        return None
+    return monotonic
+
+
+_timer = _monotonic_timer()
+
+#: Whether the timestamps of the records come from a monotonic clock. If not,
+#: they come from the wall clock and may jump when the system time changes.
+MONOTONIC_CLOCK = _timer is not None
+
+if not MONOTONIC_CLOCK:
+    from timeit import default_timer as _timer
+
+
+#: The magic number identifying a trace file.
+MAGIC = b'TRTRACE1'
+
+#: The binary layout of a record: timestamp, class id, trait id, handler id,
+#: record kind and flags.
+RECORD = struct.Struct('<dIIIBB2x')
+
+#: Record kinds.
+CALL, EXIT = 0, 1
+
+#: Record flags.
+EXCEPTION = 0x01
+
+#: The default number of records kept per thread.
+DEFAULT_CAPACITY = 1 << 16
+
+#: The default number of distinct class, trait and handler names kept.
+DEFAULT_NAMES_CAPACITY = 1 << 12
+
+#: The name recorded once the table of names is full.
+OVERFLOW_NAME = '<other>'
+
+
+class TraceRecord(namedtuple('TraceRecord', [
+        'time', 'kind', 'class_name', 'trait_name', 'handler_name',
+        'exception'])):
+    """ A decoded trace record.
+
+    """
+    __slots__ = ()
+
+    def __unicode__(self):
+        return u'{0:.6f} {1} {2}.{3} -> {4}{5}\n'.format(
+            self.time, 'CALL' if self.kind == CALL else 'EXIT',
+            self.class_name, self.trait_name, self.handler_name,
+            ' [EXCEPTION]' if self.exception else '')
+
+
+class _InternTable(object):
+    """ Assigns small integer ids to the names stored in trace records.
+
+    The table keeps at most *capacity* names, so that its memory stays
+    bounded like the ring buffers; once it is full, any new name gets the id
+    of `OVERFLOW_NAME`. Only the names are kept, never the traced objects.
+
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._ids = {OVERFLOW_NAME: 0}
+        self._names = [OVERFLOW_NAME]
+        self._lock = threading.Lock()
+
+    def id_for(self, name):
+        """ Return the id of *name*, assigning it a new id if it does not have
+        one yet.
+
+        """
+        id = self._ids.get(name)
+        if id is None:
+            with self._lock:
+                id = self._ids.get(name)
+                if id is None:
+                    if len(self._names) >= self.capacity:
+                        return 0
+                    id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = id
+        return id
+
+    def names(self):
+        with self._lock:
+            return list(self._names)
+
+
+class _ThreadRing(object):
+    """ The ring buffer of records of a single thread.
+
+    """
+
+    def __init__(self, thread_name, capacity):
+        self.thread_name = thread_name
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * RECORD.size)
+        #: The total number of records written.
+        self.count = 0
+
+    def snapshot(self):
+        """ Return the thread name, the number of records written and the
+        records still in the buffer, oldest first.
+
+        """
+        count = self.count
+        buffer = bytes(self.buffer)
+        if count <= self.capacity:
+            return self.thread_name, count, buffer[:count * RECORD.size]
+        split = (count % self.capacity) * RECORD.size
+        return self.thread_name, count, buffer[split:] + buffer[:split]
+
+
+class RingBufferTracer(object):
+    """ A thread aware trait change tracer with bounded memory.
+
+    Each thread records into its own ring buffer of *capacity* records, which
+    is allocated the first time the thread dispatches a change event. When a
+    buffer is full the oldest records are overwritten. At most
+    *names_capacity* distinct class names (and as many trait and handler
+    names) are recorded; any other name is recorded as `OVERFLOW_NAME`.
+
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY,
+                 names_capacity=DEFAULT_NAMES_CAPACITY):
+        self.capacity = capacity
+        self._classes = _InternTable(names_capacity)
+        self._traits = _InternTable(names_capacity)
+        self._handlers = _InternTable(names_capacity)
+        self._thread_local = threading.local()
+        self._rings = []
+        self._rings_lock = threading.Lock()
+        self._previous_tracers = None
+
+    def pre_tracer(self, obj, name, old, new, handler):
+        """ The traits pre event tracer.
+
+        This method should be set as the global pre event tracer for traits.
+
+        """
+        self._record(obj, name, handler, CALL, 0)
+
+    def post_tracer(self, obj, name, old, new, handler, exception=None):
+        """ The traits post event tracer.
+
+        This method should be set as the global post event tracer for traits.
+
+        """
+        self._record(obj, name, handler, EXIT,
+                     0 if exception is None else EXCEPTION)
+
+    def install(self):
+        """ Install the tracer as the global trait change event tracer.
+
+        """
+        self._previous_tracers = trait_notifiers.get_change_event_tracers()
+        trait_notifiers.set_change_event_tracers(
+            pre_tracer=self.pre_tracer, post_tracer=self.post_tracer)
+
+    def uninstall(self):
+        """ Restore the global trait change event tracers which were in effect
+        when the tracer was installed.
+
+        """
+        if self._previous_tracers is not None:
+            trait_notifiers.set_change_event_tracers(*self._previous_tracers)
+            self._previous_tracers = None
+
+    def snapshot(self):
+        """ Return the binary contents of the tracer.
+
+        The snapshot is a best effort copy: records written concurrently by
+        other threads while it is taken may be missing or overwritten.
+
+        """
+        with self._rings_lock:
+            rings = list(self._rings)
+
+        threads = []
+        chunks = []
+        for ring in rings:
+            thread_name, count, records = ring.snapshot()
+            threads.append(dict(
+                name=thread_name, written=count,
+                records=len(records) // RECORD.size))
+            chunks.append(records)
+
+        header = json.dumps(dict(
+            classes=self._classes.names(),
+            traits=self._traits.names(),
+            handlers=self._handlers.names(),
+            threads=threads,
+            monotonic=MONOTONIC_CLOCK,
+        )).encode('utf-8')
+        return b''.join(
+            [MAGIC, struct.pack('<I', len(header)), header] + chunks)
+
+    def dump(self, filename):
+        """ Save a snapshot of the tracer into a file.
+
+        """
+        with open(filename, 'wb') as fh:
+            fh.write(self.snapshot())
+
+    def _record(self, obj, name, handler, kind, flags):
+        time = _timer()
+        try:
+            ring = self._thread_local.ring
+        except AttributeError:
+            ring = self._new_ring()
+
+        function = getattr(handler, 'im_func', handler)
+        handler_name = getattr(function, '__name__', None)
+        if handler_name is None:
+            handler_name = type(function).__name__
+        count = ring.count
+        RECORD.pack_into(
+            ring.buffer, (count % ring.capacity) * RECORD.size,
+            time,
+            self._classes.id_for(obj.__class__.__name__),
+            self._traits.id_for(name),
+            self._handlers.id_for(handler_name),
+            kind, flags)
+        ring.count = count + 1
+
+    def _new_ring(self):
+        ring = _ThreadRing(threading.current_thread().name, self.capacity)
+        self._thread_local.ring = ring
+        with self._rings_lock:
+            self._rings.append(ring)
+        return ring
+
+
+def decode_trace(data):
+    """ Decode the binary contents of a tracer.
+
+    Parameters
+    ----------
+    data : bytes
+        A snapshot of a RingBufferTracer, or the contents of a trace file.
+
+    Returns
+    -------
+    threads : list of (thread_name, dropped, records) tuples
+        For each thread, the number of records which were overwritten and the
+        decoded records remaining in its buffer, oldest first.
+
+    Warns
+    -----
+    RuntimeWarning
+        If the timestamps of the records do not come from a monotonic clock.
+
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not a trait change trace.')
+
+    offset = len(MAGIC)
+    header_size, = struct.unpack_from('<I', data, offset)
+    offset += 4
+    header = json.loads(data[offset:offset + header_size].decode('utf-8'))
+    offset += header_size
+
+    if not header.get('monotonic', True):
+        warnings.warn(
+            'The trace timestamps come from a clock which is not monotonic, '
+            'and may jump when the system time is changed.', RuntimeWarning)
+
+    classes = header['classes']
+    traits = header['traits']
+    handlers = header['handlers']
+    result = []
+    for thread in header['threads']:
+        records = []
+        for i in range(thread['records']):
+            (time, class_id, trait_id, handler_id, kind,
+             flags) = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            records.append(TraceRecord(
+                time, kind, classes[class_id], traits[trait_id],
+                handlers[handler_id], bool(flags & EXCEPTION)))
+        result.append(
+            (thread['name'], thread['written'] - thread['records'], records))
+    return result
+
+
+def load_trace(filename):
+    """ Decode a trace file saved using `RingBufferTracer.dump`.
+
+    """
+    with open(filename, 'rb') as fh:
+        return decode_trace(fh.read())
+
+
+@contextmanager
+def ring_buffer_tracing(capacity=DEFAULT_CAPACITY,
+                        names_capacity=DEFAULT_NAMES_CAPACITY):
+    """ Record trait change events into per-thread ring buffers.
+
+    Usage
+    -----
+    ::
+
+        >>> from traits.util.ring_buffer_tracer import ring_buffer_tracing
+        >>> with ring_buffer_tracing() as tracer:
+        ...     my_model.some_trait = True
+        ...     tracer.dump('latency_spike.trace')
+
+    """
+    tracer = RingBufferTracer(
+        capacity=capacity, names_capacity=names_capacity)
+    tracer.install()
+    try:
+        yield tracer
+    finally:
+        tracer.uninstall()
+
+
+def main(argv=None):
+    """ Print the records of a trace file as text.
+
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) != 1:
+        sys.stderr.write(
+            'usage: python -m traits.util.ring_buffer_tracer <trace file>\n')
+        return 2
+
+    for thread_name, dropped, records in load_trace(argv[0]):
+        sys.stdout.write('{0} ({1} older records dropped)\n'.format(
+            thread_name, dropped))
+        for record in records:
+            sys.stdout.write(unicode(record))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#----------------------------------------------------------------------------
+# Copyright (c) 2016, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+#
+#----------------------------------------------------------------------------
+import random
+import threading
+import unittest
+
+from traits.api import Event, HasTraits, on_trait_change, Float, Int, List
+from traits import trait_notifiers
+from traits.util.event_profiler import ChangeEventProfiler, profile_events
+
+
+class TestObject(HasTraits):
+
+    number = Float(2.0)
+    list_of_numbers = List(Float())
+    count = Int
+    fired = Event
+
+    @on_trait_change('number')
+    def _add_number_to_list(self, value):
+        self.list_of_numbers.append(value)
+
+    @on_trait_change('number')
+    def _increment_count(self):
+        self.count += 1
+
+    @on_trait_change('count')
+    def _fail_on_three(self, value):
+        if value == 3:
+            raise ValueError(value)
+
+
+class TestEventProfiler(unittest.TestCase):
+
+    def setUp(self):
+        trait_notifiers.push_exception_handler(
+            lambda *args: None, reraise_exceptions=False, main=True)
+
+    def tearDown(self):
+        trait_notifiers.pop_exception_handler()
+
+    def test_stats(self):
+        test_object = TestObject()
+        with profile_events() as profiler:
+            test_object.number = 5.0
+            test_object.number = 6.0
+
+        stats = profiler.stats()
+        self.assertEqual(
+            set(stats),
+            set([('TestObject', 'number', '_add_number_to_list'),
+                 ('TestObject', 'number', '_increment_count'),
+                 ('TestObject', 'count', '_fail_on_three')]))
+
+        entry = stats[('TestObject', 'number', '_increment_count')]
+        self.assertEqual(entry['count'], 2)
+        self.assertEqual(entry['max_depth'], 0)
+        self.assertEqual(entry['exceptions'], 0)
+        self.assertGreaterEqual(entry['cumulative_time'], entry['self_time'])
+        self.assertGreaterEqual(entry['cumulative_time'], entry['max_time'])
+
+        entry = stats[('TestObject', 'count', '_fail_on_three')]
+        self.assertEqual(entry['count'], 2)
+        self.assertEqual(entry['max_depth'], 1)
+        self.assertEqual(entry['exceptions'], 0)
+
+    def test_exceptions(self):
+        test_object = TestObject(count=1)
+        with profile_events() as profiler:
+            test_object.count = 3
+
+        entry = profiler.stats()[('TestObject', 'count', '_fail_on_three')]
+        self.assertEqual(entry['exceptions'], 1)
+
+    def test_fanout_and_depths(self):
+        test_object = TestObject()
+        with profile_events() as profiler:
+            test_object.number = 5.0
+            test_object.number = 6.0
+
+        fanout = profiler.fanout()
+        self.assertEqual(fanout[('TestObject', 'number')], {2: 2})
+        self.assertEqual(fanout[('TestObject', 'count')], {1: 2})
+        self.assertEqual(profiler.depths(), {0: 4, 1: 2})
+
+    def test_tracers_are_restored(self):
+        tracers = trait_notifiers.get_change_event_tracers()
+        with profile_events():
+            pass
+        self.assertEqual(trait_notifiers.get_change_event_tracers(), tracers)
+
+    def test_sampling(self):
+        test_object = TestObject()
+        with profile_events(sample_rate=0.0) as profiler:
+            test_object.number = 5.0
+
+        self.assertEqual(profiler.stats(), {})
+        self.assertEqual(profiler.depths(), {})
+
+    def test_pstats(self):
+        test_object = TestObject()
+        with profile_events() as profiler:
+            test_object.number = 5.0
+
+        stats = profiler.pstats()
+        labels = set(key[2] for key in stats.stats)
+        self.assertIn('TestObject.number -> _increment_count', labels)
+
+        # The statistics methods are still available:
+        self.assertIn(('TestObject', 'number', '_increment_count'),
+                      profiler.stats())
+
+    def test_repeated_identical_events(self):
+        test_object = TestObject()
+        calls = []
+        for i in range(3):
+            test_object.on_trait_change(
+                lambda: calls.append(None), 'fired')
+
+        with profile_events() as profiler:
+            for i in range(10):
+                test_object.fired = True
+
+        self.assertEqual(len(calls), 30)
+        self.assertEqual(profiler.fanout()[('TestObject', 'fired')], {3: 10})
+
+    def test_sampling_per_event(self):
+        test_object = TestObject()
+        for i in range(3):
+            test_object.on_trait_change(lambda: None, 'fired')
+
+        random.seed(0)
+        with profile_events(sample_rate=0.5) as profiler:
+            for i in range(50):
+                test_object.fired = True
+
+        fanout = profiler.fanout()[('TestObject', 'fired')]
+        self.assertEqual(list(fanout), [3])
+        self.assertGreater(fanout[3], 0)
+        self.assertLess(fanout[3], 50)
+
+    def test_clear(self):
+        test_object = TestObject()
+        with profile_events() as profiler:
+            test_object.number = 5.0
+            profiler.clear()
+            test_object.number = 6.0
+
+        stats = profiler.stats()
+        entry = stats[('TestObject', 'number', '_increment_count')]
+        self.assertEqual(entry['count'], 1)
+
+    def test_multiple_threads(self):
+        test_object = TestObject()
+        profiler = ChangeEventProfiler()
+
+        def change():
+            test_object.number += 1.0
+
+        with trait_notifiers.change_event_tracers(
+                profiler.pre_tracer, profiler.post_tracer):
+            threads = [threading.Thread(target=change) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        stats = profiler.stats()
+        entry = stats[('TestObject', 'number', '_add_number_to_list')]
+        self.assertEqual(entry['count'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+#----------------------------------------------------------------------------
+# Copyright (c) 2016, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+#
+#----------------------------------------------------------------------------
+import gc
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import warnings
+import weakref
+
+from traits.api import HasTraits, on_trait_change, Float, List
+from traits import trait_notifiers
+from traits.util import ring_buffer_tracer
+from traits.util.ring_buffer_tracer import (
+    CALL, EXIT, OVERFLOW_NAME, RingBufferTracer, decode_trace, load_trace,
+    ring_buffer_tracing)
+
+
+class TestObject(HasTraits):
+
+    number = Float(2.0)
+    list_of_numbers = List(Float())
+
+    @on_trait_change('number')
+    def _add_number_to_list(self, value):
+        self.list_of_numbers.append(value)
+
+    @on_trait_change('list_of_numbers_items')
+    def _fail(self):
+        if len(self.list_of_numbers) > 2:
+            raise ValueError()
+
+
+class TestRingBufferTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        trait_notifiers.push_exception_handler(
+            lambda *args: None, reraise_exceptions=False)
+
+    def tearDown(self):
+        trait_notifiers.pop_exception_handler()
+        shutil.rmtree(self.directory)
+
+    def test_records(self):
+        test_object = TestObject()
+        with ring_buffer_tracing() as tracer:
+            test_object.number = 5.0
+
+        (thread_name, dropped, records), = decode_trace(tracer.snapshot())
+        self.assertEqual(thread_name, threading.current_thread().name)
+        self.assertEqual(dropped, 0)
+        self.assertEqual(
+            [(record.kind, record.trait_name, record.handler_name)
+             for record in records],
+            [(CALL, 'number', '_add_number_to_list'),
+             (CALL, 'list_of_numbers_items', '_fail'),
+             (EXIT, 'list_of_numbers_items', '_fail'),
+             (EXIT, 'number', '_add_number_to_list')])
+        self.assertEqual(records[0].class_name, 'TestObject')
+        times = [record.time for record in records]
+        self.assertEqual(times, sorted(times))
+
+    def test_exception_flag(self):
+        test_object = TestObject(list_of_numbers=[1.0, 2.0])
+        with ring_buffer_tracing() as tracer:
+            test_object.number = 5.0
+
+        (thread_name, dropped, records), = decode_trace(tracer.snapshot())
+        self.assertTrue(records[2].exception)
+        self.assertFalse(records[3].exception)
+
+    def test_bounded_capacity(self):
+        test_object = TestObject()
+        with ring_buffer_tracing(capacity=6) as tracer:
+            for i in range(10):
+                test_object.number = float(i)
+
+        (thread_name, dropped, records), = decode_trace(tracer.snapshot())
+        self.assertEqual(len(records), 6)
+        self.assertEqual(dropped, 34)
+        self.assertEqual(records[-1].kind, EXIT)
+        self.assertEqual(records[-1].trait_name, 'number')
+
+    def test_dump_and_load(self):
+        test_object = TestObject()
+        filename = os.path.join(self.directory, 'changes.trace')
+        with ring_buffer_tracing() as tracer:
+            test_object.number = 5.0
+            tracer.dump(filename)
+
+        self.assertEqual(load_trace(filename), decode_trace(tracer.snapshot()))
+
+    def test_multiple_threads(self):
+        test_object = TestObject()
+        tracer = RingBufferTracer()
+
+        def change():
+            test_object.number = 5.0
+
+        tracer.install()
+        try:
+            thread = threading.Thread(target=change, name='Worker')
+            thread.start()
+            thread.join()
+            test_object.number = 6.0
+        finally:
+            tracer.uninstall()
+
+        threads = decode_trace(tracer.snapshot())
+        self.assertEqual(
+            sorted(thread_name for thread_name, _, _ in threads),
+            sorted(['Worker', threading.current_thread().name]))
+
+    def test_uninstall_restores_tracers(self):
+        tracers = trait_notifiers.get_change_event_tracers()
+        with ring_buffer_tracing():
+            pass
+        self.assertEqual(trait_notifiers.get_change_event_tracers(), tracers)
+
+    def test_bounded_names(self):
+        test_objects = [
+            type('TestObject{0}'.format(i), (TestObject,), {})()
+            for i in range(5)]
+        with ring_buffer_tracing(names_capacity=4) as tracer:
+            for test_object in test_objects:
+                test_object.number = 5.0
+
+        (thread_name, dropped, records), = decode_trace(tracer.snapshot())
+        self.assertEqual(
+            [record.class_name for record in records[::4]],
+            ['TestObject0', 'TestObject1', 'TestObject2', OVERFLOW_NAME,
+             OVERFLOW_NAME])
+
+    def test_traced_objects_not_kept_alive(self):
+        klass = type('Transient', (TestObject,), {})
+        with ring_buffer_tracing() as tracer:
+            klass().number = 5.0
+        class_ref = weakref.ref(klass)
+        del klass
+        gc.collect()
+
+        self.assertIsNone(class_ref())
+        (thread_name, dropped, records), = decode_trace(tracer.snapshot())
+        self.assertEqual(records[0].class_name, 'Transient')
+
+    def test_monotonic_clock(self):
+        self.assertTrue(ring_buffer_tracer.MONOTONIC_CLOCK)
+        test_object = TestObject()
+        with ring_buffer_tracing() as tracer:
+            test_object.number = 5.0
+
+        with warnings.catch_warnings(record=True) as warned:
+            warnings.simplefilter('always')
+            decode_trace(tracer.snapshot())
+        self.assertEqual(warned, [])
+
+    def test_clock_not_monotonic(self):
+        test_object = TestObject()
+        with ring_buffer_tracing() as tracer:
+            test_object.number = 5.0
+        ring_buffer_tracer.MONOTONIC_CLOCK = False
+        try:
+            data = tracer.snapshot()
+        finally:
+            ring_buffer_tracer.MONOTONIC_CLOCK = True
+
+        with warnings.catch_warnings(record=True) as warned:
+            warnings.simplefilter('always')
+            (thread_name, dropped, records), = decode_trace(data)
+        self.assertEqual(len(records), 4)
+        self.assertEqual(len(warned), 1)
+        self.assertIs(warned[0].category, RuntimeWarning)
+
+    def test_invalid_trace(self):
+        with self.assertRaises(ValueError):
+            decode_trace(b'not a trace')
+
+
+if __name__ == '__main__':
+    unittest.main()